@@ -0,0 +1,66 @@
+"""
+Benchmark: embedded chart workbooks (XlsxWriter vs. fast writer vs. none) on a chart-heavy deck.
+
+Usage (from the repository root):
+    python benchmarks/bench_charts.py [--charts 200] [--points 100] [--series 3] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ppt_assistant import PPTAssistant  # noqa: E402
+from ppt_assistant.config import PPTConfig  # noqa: E402
+from ppt_assistant.workbook import WORKBOOK_CACHE  # noqa: E402
+
+
+def _slides(charts, points, series, identical):
+    slides = []
+    for c in range(charts):
+        offset = 0 if identical else c
+        data = {
+            "categories": [f"P{i}" for i in range(points)],
+            "series": [{"name": f"S{s}", "values": [(i * (s + 1) + offset) % 97 * 1.5 for i in range(points)]}
+                       for s in range(series)],
+        }
+        slides.append({"layout": "chart", "content": {"title": f"Chart {c}", "chart": {"type": "bar", "data": data}}})
+    return slides
+
+
+def _time(mode, slides, repeat):
+    config = PPTConfig()
+    config.CHART_WORKBOOK = mode
+    best = float('inf')
+    size = 0
+    for _ in range(repeat):
+        WORKBOOK_CACHE.clear()
+        start = time.perf_counter()
+        size = len(PPTAssistant.from_slides(slides, config).to_bytes())
+        best = min(best, time.perf_counter() - start)
+    return best, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--charts', type=int, default=200)
+    parser.add_argument('--points', type=int, default=100)
+    parser.add_argument('--series', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for identical in (False, True):
+        slides = _slides(args.charts, args.points, args.series, identical)
+        label = "identical data" if identical else "distinct data"
+        print(f"{args.charts} charts x {args.series} series x {args.points} points, {label}, best of {args.repeat}")
+        baseline = None
+        for mode in ('xlsxwriter', 'fast', 'none'):
+            seconds, size = _time(mode, slides, args.repeat)
+            baseline = baseline or seconds
+            print(f"  {mode:<11} {seconds * 1000:8.1f} ms  {size / 1024:8.1f} KB  {baseline / seconds:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: line chart downsampling (off vs. LTTB vs. min/max) on decks with long series.
+
+Reports render+save time, output size and the time to open the output. Open time is
+measured by loading the package with python-pptx, which parses every chart XML part
+the way PowerPoint must on open; the embedded workbooks are only read on "Edit Data".
+
+Usage (from the repository root):
+    python benchmarks/bench_downsample.py [--charts 4] [--points 50000] [--series 2] [--repeat 3]
+"""
+
+import argparse
+import io
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation  # noqa: E402
+
+from ppt_assistant import PPTAssistant  # noqa: E402
+from ppt_assistant.config import PPTConfig  # noqa: E402
+
+MODES = (None, 'lttb', 'minmax')
+
+
+def _slides(charts, points, series):
+    categories = list(range(points))
+    slides = []
+    for c in range(charts):
+        data = {"categories": categories, "series": [
+            {"name": f"S{s}", "values": [math.sin((i + c * 7) / (500 + 100 * s)) * 100 + i % 13 for i in range(points)]}
+            for s in range(series)]}
+        slides.append({"layout": "chart", "content": {"title": f"Chart {c}", "chart": {"type": "line", "data": data}}})
+    return slides
+
+
+def _best(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--charts', type=int, default=4)
+    parser.add_argument('--points', type=int, default=50000)
+    parser.add_argument('--series', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    slides = _slides(args.charts, args.points, args.series)
+    print(f"{args.charts} line charts x {args.series} series x {args.points} points, best of {args.repeat}")
+    print(f"{'mode':<8} {'render s':>9} {'output KB':>10} {'open ms':>9} {'points kept':>12}")
+    for mode in MODES:
+        config = PPTConfig()
+        config.CHART_DOWNSAMPLE = mode
+        render, data = _best(lambda: PPTAssistant.from_slides(slides, config).to_bytes(), args.repeat)
+        opened, prs = _best(lambda: Presentation(io.BytesIO(data)), args.repeat)
+        kept = len(next(shape.chart for shape in prs.slides[0].shapes if shape.has_chart).plots[0].categories)
+        print(f"{mode or 'off':<8} {render:9.2f} {len(data) / 1024:10.1f} {opened * 1000:9.1f} {kept:12d}")
+
+
+if __name__ == '__main__':
+    main()
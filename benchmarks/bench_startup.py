@@ -0,0 +1,77 @@
+"""
+Benchmark: CLI startup time in fresh interpreters.
+
+Each command runs in a new process. The table shows wall time (min and median) and the
+cumulative import time of the top-level package as reported by `python -X importtime`.
+`import ppt_assistant.core` stands in for the old eager start-up, which loaded python-pptx
+on every invocation. The script exits with status 1 when the median wall time of
+`--help` exceeds the target.
+
+Usage (from the repository root):
+    python benchmarks/bench_startup.py [--runs 10] [--target-ms 80]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLE = os.path.join(ROOT, 'examples', 'example_config.json')
+
+COMMANDS = {
+    'python (baseline)': ['-c', 'pass'],
+    'import ppt_assistant': ['-c', 'import ppt_assistant'],
+    '--help': ['-m', 'ppt_assistant', '--help'],
+    '--validate-only': ['-m', 'ppt_assistant', EXAMPLE, '--validate-only'],
+    'import core (eager)': ['-c', 'import ppt_assistant.core'],
+}
+
+
+def _wall_ms(args):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def _import_ms(args):
+    """Cumulative import time (ms) of top-level modules named ppt_assistant*, from -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=ROOT, check=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        # nested imports are indented under their importer
+        name = fields[2][1:]
+        if name.startswith('ppt_assistant'):
+            total += int(fields[1])
+    return total / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--target-ms', type=float, default=80.0,
+                        help='maximum median wall time of --help')
+    args = parser.parse_args()
+
+    print(f"{'command':<22} {'min ms':>8} {'median ms':>10} {'imports ms':>11}")
+    medians = {}
+    for label, command in COMMANDS.items():
+        _wall_ms(command)  # warm the OS file cache and .pyc files
+        times = [_wall_ms(command) for _ in range(args.runs)]
+        medians[label] = statistics.median(times)
+        print(f"{label:<22} {min(times):8.1f} {medians[label]:10.1f} {_import_ms(command):11.1f}")
+
+    if medians['--help'] > args.target_ms:
+        print(f"--help median {medians['--help']:.1f} ms exceeds target {args.target_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: peak memory of streaming output vs. saving at the end, as the slide count grows.
+
+Each run reads a JSON Lines manifest in streaming mode in a fresh process, so
+peak RSS reflects the output side only.
+
+Usage (from the repository root):
+    python benchmarks/bench_streaming.py [--slides 1000 2500 5000]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.generators import make_images, mixed  # noqa: E402
+
+
+def _run(manifest, streaming):
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.profiling import peak_rss
+
+    start = time.perf_counter()
+    assistant = PPTAssistant(manifest)
+    if streaming:
+        assistant.write_streaming()
+    else:
+        assistant.save()
+    return time.perf_counter() - start, peak_rss(), os.path.getsize(assistant.output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--slides', type=int, nargs='+', default=[1000, 2500, 5000])
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        # in a process of its own: Linux carries the parent's peak RSS over into spawned children
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            images = pool.submit(make_images, tmp).result()
+        print(f"{'slides':>7}  {'mode':<9} {'seconds':>8} {'peak RSS MB':>12} {'output MB':>10}")
+        for count in args.slides:
+            manifest = os.path.join(tmp, f"deck_{count}.jsonl")
+            with open(manifest, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({"output": os.path.join(tmp, f"deck_{count}.pptx")}) + "\n")
+                for slide in mixed(count, images=images):
+                    f.write(json.dumps(slide, ensure_ascii=False) + "\n")
+            for streaming in (False, True):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    seconds, rss, size = pool.submit(_run, manifest, streaming).result()
+                mode = "streaming" if streaming else "save"
+                print(f"{count:7d}  {mode:<9} {seconds:8.2f} {rss / 1048576:12.1f} {size / 1048576:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: bulk table XML builder vs. per-cell python-pptx proxies.
+
+Usage (from the repository root):
+    python benchmarks/bench_table.py [--rows 834] [--cols 12] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation  # noqa: E402
+from pptx.util import Inches  # noqa: E402
+
+from ppt_assistant import DEFAULT_CONFIG  # noqa: E402
+from ppt_assistant.table import add_table  # noqa: E402
+from tests._reference import add_table_with_proxies  # noqa: E402
+
+
+def _time(add, headers, rows, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        start = time.perf_counter()
+        add(slide, headers, rows, Inches(0.5), Inches(1.5), Inches(11.7), Inches(5), DEFAULT_CONFIG)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=834)
+    parser.add_argument('--cols', type=int, default=12)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    headers = [f"Column {c}" for c in range(args.cols)]
+    rows = [[f"r{r}c{c}" for c in range(args.cols)] for r in range(args.rows)]
+    cells = args.cols * (args.rows + 1)
+
+    slow = _time(add_table_with_proxies, headers, rows, args.repeat)
+    fast = _time(add_table, headers, rows, args.repeat)
+    print(f"{cells} cells ({args.rows + 1} x {args.cols}), best of {args.repeat}")
+    print(f"  python-pptx proxies: {slow * 1000:8.1f} ms")
+    print(f"  bulk XML builder:    {fast * 1000:8.1f} ms")
+    print(f"  speedup:             {slow / fast:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
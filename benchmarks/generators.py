@@ -0,0 +1,138 @@
+"""
+Synthetic deck generators for the benchmark suite.
+
+Every generator returns a list of slide dicts in the JSON manifest format and is
+deterministic for a given size, so results are comparable between runs.
+Image scenarios take the paths from `make_images`; create them once up front so the
+image generation is not measured with the render.
+"""
+
+import os
+import random
+
+from PIL import Image
+
+_CJK = "簡報生成工具支持文字圖片表格圖表多種佈局並自動套用模板樣式適合批量製作報告"
+_WORDS = "quarterly revenue growth margin forecast pipeline customer retention region product".split()
+
+
+def _sentence(rng, length):
+    """Mixed Traditional Chinese and English text of roughly `length` characters."""
+    parts = []
+    while sum(map(len, parts)) < length:
+        if rng.random() < 0.7:
+            parts.append("".join(rng.choice(_CJK) for _ in range(rng.randint(6, 16))))
+        else:
+            parts.append(" " + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 5))) + " ")
+    return "".join(parts)[:length]
+
+
+def _table(rng, rows, cols):
+    return {
+        "headers": [f"欄位 {c + 1}" for c in range(cols)],
+        "rows": [[f"{rng.randint(0, 99999)}" if c else f"R{r + 1}" for c in range(cols)] for r in range(rows)],
+    }
+
+
+def _chart(rng, series, points, chart_type="bar"):
+    return {
+        "type": chart_type,
+        "data": {
+            "categories": [f"P{i + 1}" for i in range(points)],
+            "series": [{"name": f"S{s + 1}", "values": [round(rng.uniform(0, 1000), 1) for _ in range(points)]}
+                       for s in range(series)],
+        },
+    }
+
+
+def make_images(directory, count=8, size=(3000, 2000)):
+    """Write `count` distinct photo-sized images (alternating JPEG and PNG) and return their paths."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for i in range(count):
+        ext = "jpg" if i % 2 == 0 else "png"
+        path = os.path.join(directory, f"bench_{i}.{ext}")
+        if not os.path.exists(path):
+            img = Image.linear_gradient("L").resize(size).convert("RGB")
+            img = Image.merge("RGB", [band.point(lambda v, k=k: (v * (k + i + 1)) % 256)
+                                      for k, band in enumerate(img.split())])
+            img.save(path)
+        paths.append(path)
+    return paths
+
+
+def text_heavy(slides=500, seed=1, **_):
+    """Content and two-column slides with long mixed-language bodies."""
+    rng = random.Random(seed)
+    deck = []
+    for i in range(slides):
+        if i % 2 == 0:
+            content = {"title": f"重點 {i + 1}", "body": [_sentence(rng, 80) for _ in range(8)]}
+            deck.append({"layout": "content", "content": content})
+        else:
+            content = {"title": f"比較 {i + 1}", "left": _sentence(rng, 300), "right": _sentence(rng, 300)}
+            deck.append({"layout": "two_column", "content": content})
+    return deck
+
+
+def table_heavy(tables=20, rows=209, cols=12, seed=2, **_):
+    """Tables of about 2,500 cells each (paginated onto continuation slides)."""
+    rng = random.Random(seed)
+    return [{"layout": "table", "content": {"title": f"數據表 {t + 1}", "table": _table(rng, rows, cols)}}
+            for t in range(tables)]
+
+
+def chart_heavy(charts=20, series=100, points=12, seed=3, **_):
+    """Charts with 100 series each."""
+    rng = random.Random(seed)
+    types = ["bar", "column", "line"]
+    return [{"layout": "chart", "content": {"title": f"圖表 {c + 1}",
+                                            "chart": _chart(rng, series, points, types[c % len(types)])}}
+            for c in range(charts)]
+
+
+def image_heavy(slides=200, images=(), **_):
+    """Image slides cycling through a handful of large photos (paths from `make_images`)."""
+    return [{"layout": "image", "content": {"title": f"圖片 {i + 1}", "image": images[i % len(images)],
+                                            "caption": f"說明 {i + 1}"}}
+            for i in range(slides)]
+
+
+def mixed(slides=5000, images=(), seed=4, **_):
+    """A long deck cycling through every layout (image paths from `make_images`)."""
+    rng = random.Random(seed)
+    deck = []
+    for i in range(slides):
+        kind = i % 6
+        if i % 50 == 0:
+            deck.append({"layout": "title", "content": {"title": f"第 {i // 50 + 1} 章", "subtitle": _sentence(rng, 20)}})
+        elif kind == 0:
+            deck.append({"layout": "content", "content": {"title": f"頁 {i}", "body": [_sentence(rng, 60) for _ in range(4)]}})
+        elif kind == 1:
+            deck.append({"layout": "two_column", "content": {"title": f"頁 {i}", "left": _sentence(rng, 120),
+                                                             "right": _sentence(rng, 120)}})
+        elif kind == 2:
+            deck.append({"layout": "table", "content": {"title": f"頁 {i}", "table": _table(rng, 10, 5)}})
+        elif kind == 3:
+            deck.append({"layout": "chart", "content": {"title": f"頁 {i}", "chart": _chart(rng, 3, 12)}})
+        elif kind == 4:
+            deck.append({"layout": "image", "content": {"title": f"頁 {i}", "image": images[i % len(images)]}})
+        else:
+            deck.append({"layout": "content", "content": {"title": f"頁 {i}", "body": _sentence(rng, 200)}})
+    return deck
+
+
+# name -> (generator, size keyword scaled by --scale, default size)
+SCENARIOS = {
+    'text': (text_heavy, 'slides', 500),
+    'table': (table_heavy, 'tables', 20),
+    'chart': (chart_heavy, 'charts', 20),
+    'image': (image_heavy, 'slides', 200),
+    'mixed': (mixed, 'slides', 5000),
+}
+
+
+def generate(name, scale=1.0, images=()):
+    """Build the slides of scenario `name`, with its size multiplied by `scale` (at least 1)."""
+    generator, size_key, size = SCENARIOS[name]
+    return generator(**{size_key: max(1, round(size * scale)), 'images': images})
@@ -0,0 +1,180 @@
+"""
+Benchmark suite: synthetic decks for every layout, with baseline regression tracking.
+
+Each scenario runs in a fresh process (cold caches, clean peak RSS) and reports
+throughput (manifest slides/s), per-manifest-slide latency percentiles, peak RSS and
+output size. Throughput and latency share one unit, so a table that paginates onto
+more continuation slides does not change either; `slides` records the rendered count.
+Results can be saved as a baseline JSON file; later runs are compared against it
+and the script exits with status 1 when any metric regresses beyond the threshold.
+
+Usage (from the repository root):
+    python benchmarks/suite.py [--scenario text table chart image mixed] [--scale 1.0] [--repeat 3]
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json [--threshold 0.2]
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.generators import SCENARIOS, generate, make_images  # noqa: E402
+
+# metric -> True when higher is better
+METRICS = {
+    'slides_per_second': True,
+    'p50_ms': False,
+    'p95_ms': False,
+    'p99_ms': False,
+    'peak_rss_mb': False,
+    'output_bytes': False,
+}
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered), max(1, math.ceil(fraction * len(ordered)))) - 1]
+
+
+def run_scenario(name, scale, images):
+    """Generate and render one scenario in the current process and return its metrics."""
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.profiling import Profiler, peak_rss
+
+    slides = generate(name, scale, images)
+    profiler = Profiler()
+    start = time.perf_counter()
+    with profiler:
+        assistant = PPTAssistant.from_slides(slides, profiler=profiler)
+        output_bytes = len(assistant.to_bytes())
+    seconds = time.perf_counter() - start
+    # one latency record per manifest slide, so throughput counts manifest slides too
+    latencies = [record['wall_seconds'] * 1000 for record in profiler.slides] or [0.0]
+    rss = peak_rss()
+    return {
+        'manifest_slides': len(slides),
+        'slides': len(assistant.prs.slides),
+        'seconds': round(seconds, 4),
+        'slides_per_second': round(len(slides) / seconds, 2),
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'peak_rss_mb': round(rss / 1048576, 1) if rss is not None else None,
+        'output_bytes': output_bytes,
+    }
+
+
+def best_of(runs):
+    """Combine repeated runs, keeping the best value of every metric."""
+    best = dict(runs[0])
+    for run in runs[1:]:
+        for metric, higher in METRICS.items():
+            if run[metric] is None or best[metric] is None:
+                continue
+            best[metric] = max(best[metric], run[metric]) if higher else min(best[metric], run[metric])
+        best['seconds'] = min(best['seconds'], run['seconds'])
+    return best
+
+
+def run_suite(names, scale=1.0, repeat=3, image_dir=None):
+    """Run the scenarios, each repetition in a fresh process, and return {name: metrics}."""
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        # write the source images once, outside the measured processes; in a process of
+        # their own, since Linux carries the parent's peak RSS over into spawned children
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            images = pool.submit(make_images, image_dir or tmp).result()
+        results = {}
+        for name in names:
+            runs = []
+            for _ in range(repeat):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    runs.append(pool.submit(run_scenario, name, scale, images).result())
+            results[name] = best_of(runs)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    Returns:
+        List of (scenario, metric, baseline value, current value, relative change)
+        for every metric that got worse by more than `threshold`.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric, higher in METRICS.items():
+            old, new = base.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if (-change if higher else change) > threshold:
+                regressions.append((name, metric, old, new, change))
+    return regressions
+
+
+def _environment(scale, repeat):
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'scale': scale,
+        'repeat': repeat,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scenario', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--scale', type=float, default=1.0, help="multiply every scenario size (e.g. 0.1 for a quick run)")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', metavar='FILE', help="compare against this baseline JSON file")
+    parser.add_argument('--save-baseline', metavar='FILE', help="write the results as a baseline JSON file")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    args = parser.parse_args()
+
+    results = run_suite(args.scenario, args.scale, args.repeat)
+
+    print(f"{'scenario':<8} {'manifest':>8} {'slides':>7} {'slides/s':>9} {'p50 ms':>8} {'p95 ms':>8}"
+          f" {'p99 ms':>8} {'RSS MB':>7} {'output KB':>10}")
+    for name, m in results.items():
+        rss = f"{m['peak_rss_mb']:7.1f}" if m['peak_rss_mb'] is not None else f"{'-':>7}"
+        print(f"{name:<8} {m['manifest_slides']:8d} {m['slides']:7d} {m['slides_per_second']:9.1f}"
+              f" {m['p50_ms']:8.2f} {m['p95_ms']:8.2f} {m['p99_ms']:8.2f} {rss} {m['output_bytes'] / 1024:10.1f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({'environment': _environment(args.scale, args.repeat), 'results': results}, f, indent=2)
+            f.write('\n')
+        print(f"baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        for option in ('scale', 'repeat'):
+            if baseline['environment'].get(option) != getattr(args, option):
+                print(f"warning: baseline was recorded with --{option} {baseline['environment'].get(option)}")
+        regressions = compare(results, baseline['results'], args.threshold)
+        for name, metric, old, new, change in regressions:
+            print(f"REGRESSION {name}.{metric}: {old} -> {new} ({change:+.1%})")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,8 +4,20 @@ PPT 助手工具包
 完全適配 16:9 比例 (13.333 x 7.5 inches)
 """
 
-from .core import PPTAssistant
 from .config import PPTConfig, DEFAULT_CONFIG
 
 __version__ = "1.0.0"
-__all__ = ["PPTAssistant", "PPTConfig", "DEFAULT_CONFIG"]
\ No newline at end of file
+__all__ = ["PPTAssistant", "PPTConfig", "DEFAULT_CONFIG"]
+
+
+def __getattr__(name):
+    # core 匯入 python-pptx,首次取用 PPTAssistant 時才載入,
+    # 使 --help、參數錯誤與 --validate-only 等不需渲染的調用快速啟動
+    if name == "PPTAssistant":
+        from .core import PPTAssistant
+        return PPTAssistant
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + ["PPTAssistant"])
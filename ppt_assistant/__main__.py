@@ -1,26 +1,139 @@
 """Entry point for running ppt-assistant as a module."""
 
-from .core import PPTAssistant
-import sys
+import argparse
 import os
+import sys
+import time
+
+
+def build_parser(prog=None):
+    """建立命令行參數解析器"""
+    parser = argparse.ArgumentParser(
+        prog=prog or 'python -m ppt_assistant',
+        description='從 JSON 配置文件生成 16:9 PPT 簡報',
+        epilog='常駐渲染服務: python -m ppt_assistant serve --help',
+    )
+    parser.add_argument('json_file', nargs='?', help='JSON 配置文件路徑')
+    parser.add_argument('--stream', action='store_true',
+                        help='逐張串流讀取投影片,適用於超大配置文件 (.jsonl 總是串流)')
+    parser.add_argument('--stream-output', action='store_true',
+                        help='邊渲染邊寫出: 每張投影片完成即寫入文件並釋放,記憶體不隨投影片數增長')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='並行渲染單份簡報的工作進程數,適用於投影片很多的簡報')
+    parser.add_argument('--incremental', action='store_true',
+                        help='增量重建: 只重新渲染配置有變化的投影片,其餘從上一版輸出複製')
+    parser.add_argument('--validate-only', action='store_true',
+                        help='只檢查配置 (佈局、表格形狀、圖表數據長度與類型、圖片是否存在),不生成簡報')
+    parser.add_argument('--profile', action='store_true',
+                        help='記錄各階段與每張投影片的耗時與記憶體,報告寫入 <output>.profile.json')
+    parser.add_argument('--profile-dump', metavar='FILE',
+                        help='同時以 cProfile 記錄並導出 pstats 文件 (可用 snakeviz/flameprof 查看,隱含 --profile)')
+    parser.add_argument('--batch', metavar='DIR_OR_GLOB',
+                        help='批量模式: 目錄 (其中所有 .json 與 .jsonl) 或 glob 模式,串流、增量與剖析選項套用於每份簡報')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='批量模式的工作進程數 (默認為 CPU 核心數)')
+    return parser
+
+
+def _check_batch_args(parser, args):
+    """拒絕批量模式下無法套用的參數組合"""
+    # 批量模式已按份並行 (-j),各份內再開進程池會過度佔用 CPU;
+    # 單一 cProfile 文件與驗證模式亦無法對應多份簡報
+    conflicts = [
+        ('json_file', 'JSON 配置文件參數'),
+        ('workers', '--workers (請使用 -j 控制並行份數)'),
+        ('profile_dump', '--profile-dump (請使用 --profile,為每份簡報寫出剖析報告)'),
+        ('validate_only', '--validate-only'),
+    ]
+    for name, label in conflicts:
+        if getattr(args, name):
+            parser.error(f"--batch 不能與 {label} 同時使用")
+
+
+def _run_batch(args):
+    """執行批量模式"""
+    from .batch import expand_inputs, run_batch, print_summary
+
+    json_files = expand_inputs(args.batch)
+    if not json_files:
+        print(f"錯誤: 找不到符合 '{args.batch}' 的 JSON 文件")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = run_batch(json_files, args.jobs, stream=args.stream, stream_output=args.stream_output,
+                        incremental=args.incremental, profile=args.profile)
+    print_summary(results, time.perf_counter() - start)
+    if not all(r['ok'] for r in results):
+        sys.exit(1)
 
 
-def main():
+def _run_profiled(args):
+    """在剖析下生成簡報,輸出剖析報告"""
+    from .core import PPTAssistant
+    from .profiling import Profiler
+
+    with Profiler(cprofile=bool(args.profile_dump)) as profiler:
+        assistant = PPTAssistant(args.json_file, stream=args.stream, profiler=profiler)
+        assistant.create_presentation(workers=args.workers, incremental=args.incremental,
+                                      stream_output=args.stream_output)
+
+    report_path = f"{assistant.output_path}.profile.json"
+    profiler.write_report(report_path)
+    print("性能剖析:")
+    for line in profiler.format_summary():
+        print(line)
+    print(f"剖析報告: {report_path}")
+    if args.profile_dump:
+        profiler.dump_stats(args.profile_dump)
+        print(f"cProfile 記錄: {args.profile_dump}")
+
+
+def main(argv=None, prog=None):
     """主函數"""
-    if len(sys.argv) < 2:
-        print("使用方法: python -m ppt_assistant <json_file>")
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ['serve']:
+        from .server import main as serve_main
+        serve_main(argv[1:], f"{prog} serve" if prog else None)
+        return
+
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        _check_batch_args(parser, args)
+        _run_batch(args)
+        return
+
+    if not args.json_file:
+        parser.print_usage()
         print("範例: python -m ppt_assistant examples/example_config.json")
         sys.exit(1)
 
-    json_file = sys.argv[1]
+    json_file = args.json_file
 
     if not os.path.exists(json_file):
         print(f"錯誤: 找不到文件 '{json_file}'")
         sys.exit(1)
 
+    from .validation import ManifestValidationError, validate_manifest
+
     try:
-        assistant = PPTAssistant(json_file)
-        assistant.create_presentation()
+        if args.validate_only:
+            count = validate_manifest(json_file, stream=args.stream)
+            print(f"配置驗證通過: {count} 張投影片")
+            return
+
+        from .core import PPTAssistant
+        if args.profile or args.profile_dump:
+            _run_profiled(args)
+        else:
+            assistant = PPTAssistant(json_file, stream=args.stream)
+            assistant.create_presentation(workers=args.workers, incremental=args.incremental,
+                                          stream_output=args.stream_output)
+    except ManifestValidationError as e:
+        print(f"錯誤: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"錯誤: {e}")
         import traceback
@@ -29,4 +142,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,215 @@
+"""
+非同步介面
+
+供 asyncio 服務 (如 aiohttp) 調用: 渲染與保存在執行器中進行,事件循環不被阻塞。
+
+- 執行器: 默認為線程池,與進程內的模板、圖片與工作簿快取共用;CPU 密集且需要
+  多核並行時可使用進程池 (executor='process',工作進程啟動時預熱模板),
+  也可傳入自行管理的 concurrent.futures 執行器
+- 並發限制: 以 asyncio.Semaphore 限制同時進行的渲染數,其餘請求在事件循環中等候
+- 逾時與取消: 線程中的渲染在投影片之間檢查取消標記並提前結束;進程池中尚未開始的
+  渲染會被取消,已開始的渲染會在工作進程中完成,結果被丟棄
+- 非阻塞 I/O: JSON 文件以 asyncio.to_thread 讀取;線程模式下,配置引用的圖片在
+  渲染前於執行器中並行讀取與預處理,結果放入媒體快取供渲染直接使用
+
+    from ppt_assistant.aio import render_async
+
+    data = await render_async(config_dict, timeout=30)
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class RenderCancelled(Exception):
+    """渲染已被取消 (逾時或呼叫方取消)"""
+
+
+def _read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _checked(slides, cancel):
+    """逐張產出投影片,取消標記被設置時停止渲染"""
+    for slide in slides:
+        if cancel.is_set():
+            raise RenderCancelled("渲染已取消")
+        yield slide
+
+
+def _render(config, output, compression, ppt_config, cancel=None):
+    """在執行器中生成簡報,返回 .pptx bytes 或寫入 output 並返回路徑"""
+    from .core import PPTAssistant
+
+    assistant = PPTAssistant.from_dict(config, ppt_config)
+    if cancel is not None:
+        # 包裝後的投影片不再是列表,先在此完成渲染前的驗證
+        if assistant.ppt_config.VALIDATE_MANIFEST:
+            assistant.validate()
+        assistant.slides_data = _checked(assistant.slides_data, cancel)
+    if output:
+        assistant.save(output, compression)
+        return output
+    return assistant.to_bytes(compression)
+
+
+def _image_paths(config):
+    """配置中圖片頁引用且存在的圖片路徑 (去重,保持順序)"""
+    paths = {}
+    for slide in config.get('slides', []):
+        if isinstance(slide, dict) and slide.get('layout') == 'image':
+            content = slide.get('content')
+            path = content.get('image') if isinstance(content, dict) else None
+            if isinstance(path, str) and os.path.isfile(path):
+                paths[path] = None
+    return list(paths)
+
+
+class AsyncRenderer:
+    """在執行器中生成簡報的非同步前端"""
+
+    def __init__(self, executor='thread', max_concurrency=None, timeout=None, ppt_config=None,
+                 prefetch_images=True):
+        """
+        Args:
+            executor: 'thread' (默認)、'process',或 concurrent.futures.Executor 實例
+                (由呼叫方管理其生命週期)
+            max_concurrency: 同時進行的渲染數上限,默認為 CPU 核心數;
+                也是 'thread'/'process' 執行器的工作線程/進程數
+            timeout: 每次渲染的默認逾時秒數 (包括等候並發名額的時間),None 表示不限
+            ppt_config: PPT 配置對象，默認為 DEFAULT_CONFIG
+            prefetch_images: 線程模式下是否在渲染前並行預處理配置引用的圖片
+
+        Raises:
+            ValueError: 不支援的執行器類型
+        """
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.timeout = timeout
+        self.ppt_config = ppt_config
+        self.prefetch_images = prefetch_images
+        self._owns_executor = isinstance(executor, str)
+        if executor == 'thread':
+            executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix='ppt-render')
+        elif executor == 'process':
+            from .batch import _init_worker
+            # 事件循環所在進程是多線程的 (to_thread、服務框架的線程),以 spawn 啟動工作進程
+            # 避免 fork 時繼承被其他線程持有的鎖
+            executor = ProcessPoolExecutor(self.max_concurrency, mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=_init_worker)
+        elif isinstance(executor, str):
+            raise ValueError(f"不支援的執行器類型: {executor}")
+        self._executor = executor
+        self._in_process = not isinstance(executor, ProcessPoolExecutor)
+        # asyncio.Semaphore 綁定於首次使用它的事件循環,每個事件循環各建一個
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.active = 0
+
+    def _semaphore(self):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _prefetch(self, config):
+        """在執行器中並行預處理圖片 (失敗時留待渲染時處理)"""
+        from .config import DEFAULT_CONFIG
+        from .images import load_image
+
+        ppt_config = self.ppt_config or DEFAULT_CONFIG
+        if not ppt_config.IMAGE_PREPROCESS:
+            return
+        loop = asyncio.get_running_loop()
+        width = ppt_config.geometry.image_width_inches
+        await asyncio.gather(*(
+            loop.run_in_executor(self._executor, load_image, path, width, ppt_config)
+            for path in _image_paths(config)
+        ), return_exceptions=True)
+
+    async def _run(self, config, output, compression):
+        loop = asyncio.get_running_loop()
+        if isinstance(config, (str, os.PathLike)):
+            config = await asyncio.to_thread(_read_json, config)
+        async with self._semaphore():
+            self.active += 1
+            cancel = threading.Event() if self._in_process else None
+            try:
+                if cancel is not None and self.prefetch_images:
+                    await self._prefetch(config)
+                return await loop.run_in_executor(
+                    self._executor, _render, config, output, compression, self.ppt_config, cancel)
+            except asyncio.CancelledError:
+                # 線程無法被中斷: 通知渲染在下一張投影片前停止
+                if cancel is not None:
+                    cancel.set()
+                raise
+            finally:
+                self.active -= 1
+
+    async def render(self, config, output=None, compression=None, timeout=None):
+        """
+        生成一份簡報
+
+        Args:
+            config: 配置字典 (與 JSON 配置文件格式相同) 或 JSON 配置文件路徑
+            output: 寫入的 .pptx 路徑,默認返回 bytes
+            compression: zip 壓縮方式 'deflate' 或 'stored',默認使用配置值
+            timeout: 逾時秒數,默認使用構造時的 timeout
+
+        Returns:
+            .pptx bytes,或 output 路徑
+
+        Raises:
+            asyncio.TimeoutError: 超過逾時限制 (渲染隨即被取消)
+            ManifestValidationError: 配置不符合佈局的 schema
+        """
+        timeout = self.timeout if timeout is None else timeout
+        return await asyncio.wait_for(self._run(config, output, compression), timeout)
+
+    def close(self):
+        """關閉自行創建的執行器 (不等待仍在進行的渲染)"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+        return False
+
+
+_default_renderer = None
+_default_lock = threading.Lock()
+
+
+def default_renderer():
+    """進程內共用的 AsyncRenderer (線程池,並發數為 CPU 核心數)"""
+    global _default_renderer
+    with _default_lock:
+        if _default_renderer is None:
+            _default_renderer = AsyncRenderer()
+        return _default_renderer
+
+
+async def render_async(config, output=None, compression=None, timeout=None, renderer=None):
+    """
+    非同步生成一份簡報
+
+    Args:
+        config: 配置字典或 JSON 配置文件路徑
+        output: 寫入的 .pptx 路徑,默認返回 bytes
+        compression: zip 壓縮方式 'deflate' 或 'stored'
+        timeout: 逾時秒數,默認不限
+        renderer: 使用的 AsyncRenderer,默認為 default_renderer()
+
+    Returns:
+        .pptx bytes,或 output 路徑
+    """
+    return await (renderer or default_renderer()).render(config, output, compression, timeout)
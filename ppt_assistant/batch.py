@@ -0,0 +1,135 @@
+"""
+批量生成模式
+
+將大量 JSON 配置文件分派到進程池中並行生成簡報。
+每個工作進程只初始化一次 (載入 python-pptx 並預熱預設模板),
+之後重複使用,避免每份簡報都重新啟動解譯器與重新匯入模組。
+"""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+# 目錄輸入時收集的配置文件副檔名 (.jsonl 逐張串流讀取)
+CONFIG_PATTERNS = ('*.json', '*.jsonl')
+
+
+def expand_inputs(pattern):
+    """
+    展開批量輸入
+
+    Args:
+        pattern: 目錄路徑 (取其中所有 .json 與 .jsonl) 或 glob 模式 (支援 **)
+
+    Returns:
+        排序後的配置文件路徑列表
+    """
+    if os.path.isdir(pattern):
+        files = [f for ext in CONFIG_PATTERNS for f in glob.glob(os.path.join(pattern, ext))]
+    else:
+        files = glob.glob(pattern, recursive=True)
+    return sorted(f for f in files if os.path.isfile(f))
+
+
+def _init_worker():
+    """工作進程初始化: 匯入 python-pptx 並預熱預設模板快取"""
+    from . import core  # noqa: F401
+    from .template import load_presentation
+    load_presentation()
+
+
+def _create(json_file, stream=False, stream_output=False, incremental=False, profiler=None):
+    """生成單份簡報,返回 PPTAssistant"""
+    from .core import PPTAssistant
+
+    assistant = PPTAssistant(json_file, stream=stream, profiler=profiler)
+    assistant.create_presentation(incremental=incremental, stream_output=stream_output)
+    return assistant
+
+
+def _render_one(json_file, options=None):
+    """在工作進程中生成單份簡報,返回結果字典"""
+    options = dict(options or {})
+    profile = options.pop('profile', False)
+
+    start = time.perf_counter()
+    report_path = None
+    try:
+        if profile:
+            from .profiling import Profiler
+
+            with Profiler() as profiler:
+                assistant = _create(json_file, profiler=profiler, **options)
+            report_path = f"{assistant.output_path}.profile.json"
+            profiler.write_report(report_path)
+        else:
+            assistant = _create(json_file, **options)
+    except Exception as e:
+        return {
+            'input': json_file,
+            'ok': False,
+            'seconds': time.perf_counter() - start,
+            'error': f"{type(e).__name__}: {e}",
+        }
+    result = {
+        'input': json_file,
+        'ok': True,
+        'seconds': time.perf_counter() - start,
+        'output': assistant.output_path,
+    }
+    if report_path:
+        result['profile'] = report_path
+    return result
+
+
+def run_batch(json_files, jobs=None, stream=False, stream_output=False, incremental=False, profile=False):
+    """
+    並行生成多份簡報
+
+    Args:
+        json_files: JSON 配置文件路徑列表
+        jobs: 工作進程數,默認為 CPU 核心數; 1 表示在當前進程內依序執行
+        stream: 逐張串流讀取配置 (.jsonl 總是串流)
+        stream_output: 邊渲染邊寫出每份簡報
+        incremental: 增量重建,只重新渲染配置有變化的投影片
+        profile: 為每份簡報寫出 <output>.profile.json 剖析報告
+
+    Returns:
+        每份簡報的結果字典列表 (與輸入順序相同)
+    """
+    render = partial(_render_one, options={
+        'stream': stream, 'stream_output': stream_output,
+        'incremental': incremental, 'profile': profile,
+    })
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(json_files) <= 1:
+        return [render(f) for f in json_files]
+
+    # 小任務分批派送,降低進程間通訊開銷,同時保持負載平衡
+    chunksize = max(1, min(16, len(json_files) // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+        return list(executor.map(render, json_files, chunksize=chunksize))
+
+
+def print_summary(results, elapsed):
+    """
+    輸出批量生成摘要
+
+    Args:
+        results: run_batch 返回的結果列表
+        elapsed: 總耗時 (秒)
+    """
+    for result in results:
+        if result['ok']:
+            profile = f", 剖析報告 {result['profile']}" if 'profile' in result else ''
+            print(f"  ✓ {result['input']} -> {result['output']} ({result['seconds']:.2f}s{profile})")
+        else:
+            print(f"  ✗ {result['input']} ({result['seconds']:.2f}s): {result['error']}")
+
+    succeeded = sum(1 for r in results if r['ok'])
+    failed = len(results) - succeeded
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+    print(f"批量生成完成: 成功 {succeeded} 份, 失敗 {failed} 份, "
+          f"總耗時 {elapsed:.2f}s ({rate:.1f} 份/秒)")
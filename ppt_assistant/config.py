@@ -9,8 +9,44 @@ Units:
 - Spacing: inches or points as noted
 """
 
-from typing import Dict, Tuple
-from pptx.dml.color import RGBColor
+from typing import Dict, NamedTuple, Optional, Tuple
+
+EMUS_PER_INCH = 914400
+
+
+def _emu(inches: float) -> int:
+    """Convert inches to EMU exactly as pptx.util.Inches does."""
+    return int(inches * EMUS_PER_INCH)
+
+
+class Box(NamedTuple):
+    """A shape position and size in EMU, in add_textbox/add_chart argument order."""
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+class Geometry(NamedTuple):
+    """
+    Slide geometry compiled from a PPTConfig, with every box already in EMU.
+
+    Immutable (a tuple with empty __slots__) and picklable, so it can be shared
+    by the render loop and shipped to worker processes with its config.
+    """
+    slide_width: int
+    slide_height: int
+    title: Box  # Title slide: title placeholder
+    subtitle: Box  # Title slide: subtitle placeholder
+    slide_title: Box  # Title text box on all other layouts
+    body: Box
+    left_column: Box
+    right_column: Box
+    image: Box  # Height is 0: pictures keep their aspect ratio
+    image_width_inches: float  # Placed width used for image preprocessing
+    caption: Box
+    table: Box
+    chart: Box
 
 
 class PPTConfig:
@@ -38,6 +74,12 @@ class PPTConfig:
     CONTENT_LAYOUT_INDEX: int = 6  # Fallback to 5 if not available
     CONTENT_LAYOUT_FALLBACK_INDEX: int = 5
 
+    # User templates: fill the layout placeholders (titles, bodies, columns) and place
+    # images, tables and charts in the content placeholder, keeping the template's
+    # slide size; layouts are chosen by their placeholders unless named here
+    TEMPLATE_PLACEHOLDERS: bool = True
+    TEMPLATE_LAYOUTS: Dict[str, str] = {}  # Layout type (e.g. "content") -> template layout name
+
     # Font sizes (in points)
     TITLE_FONT_SIZE: int = 54
     SUBTITLE_FONT_SIZE: int = 32
@@ -70,15 +112,56 @@ class PPTConfig:
     CAPTION_TOP_FROM_BOTTOM: float = 1.0
     CAPTION_HEIGHT: float = 0.6
 
+    # Image preprocessing: downscale to the placed size before embedding
+    IMAGE_PREPROCESS: bool = True
+    IMAGE_TARGET_DPI: int = 150  # Pixels per inch of placed width
+    IMAGE_RECOMPRESS: bool = False  # Re-encode even when no downscale is needed
+    IMAGE_JPEG_QUALITY: int = 85
+    IMAGE_CACHE_DIR: Optional[str] = None  # On-disk cache of processed images
+    IMAGE_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # On-disk cache size cap (LRU)
+    MEDIA_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # In-process media cache size cap (LRU)
+
+    # Text fitting for content and two-column bodies: None (off), "shrink"
+    # (reduce the font size) or "split" (continue on further slides)
+    TEXT_FIT: Optional[str] = None
+    TEXT_MIN_FONT_SIZE: int = 12  # Smallest size "shrink" may use
+    TEXT_LINE_SPACING: float = 1.2  # Line height as a multiple of font size
+    TEXT_FONT_FILE: Optional[str] = None  # TTF/OTF used to measure Latin text
+    TEXT_EA_FONT_FILE: Optional[str] = None  # TTF/OTF/TTC used to measure CJK text
+
     # Table layout
     TABLE_WIDTH_RATIO: float = 0.95  # 95% of content width
     TABLE_HEIGHT_RATIO: float = 0.9  # 90% of content height
 
+    # Table pagination: rows that do not fit continue on further slides
+    TABLE_PAGINATE: bool = True
+    TABLE_LINE_SPACING: float = 1.2  # Estimated line height as a multiple of font size
+    TABLE_CELL_MARGIN: float = 0.1  # Top + bottom cell margin (inches)
+    TABLE_CONTINUATION_TITLE: str = "{title} (cont. {page}/{pages})"
+    TABLE_CONTINUATION_TITLE_UNCOUNTED: str = "{title} (cont. {page})"  # Row count unknown
+
     # Chart layout
     CHART_WIDTH_RATIO: float = 0.9  # 90% of content width
     CHART_HEIGHT_RATIO: float = 0.9  # 90% of content height
     CHART_LEGEND_POSITION: int = 2  # Right side
 
+    # Line chart downsampling: None (off), "lttb" (keeps shape) or "minmax" (keeps peaks)
+    CHART_DOWNSAMPLE: Optional[str] = None
+    CHART_POINTS_PER_INCH: int = 150  # Points kept per inch of chart width
+    CHART_MAX_POINTS: Optional[int] = None  # Optional hard cap on points per chart
+
+    # Embedded chart workbook: "fast" (minimal streamed .xlsx), "xlsxwriter"
+    # (python-pptx default) or "none" (cached values only, data not editable)
+    CHART_WORKBOOK: str = "fast"
+    DEDUP_WORKBOOKS: bool = True  # Charts with identical data share one embedded workbook part
+
+    # Check every slide against its layout schema before rendering
+    VALIDATE_MANIFEST: bool = True
+
+    # Output package: "deflate" (smaller) or "stored" (no compression, fastest)
+    OUTPUT_COMPRESSION: str = "deflate"
+    OUTPUT_COMPRESS_LEVEL: Optional[int] = None  # 0-9 for deflate, None = zlib default
+
     # Colors (RGB tuples)
     TABLE_HEADER_BG_COLOR: Tuple[int, int, int] = (68, 114, 196)  # Blue
     TABLE_HEADER_TEXT_COLOR: Tuple[int, int, int] = (255, 255, 255)  # White
@@ -105,6 +188,12 @@ class PPTConfig:
         """Initialize with default values and validate configuration."""
         self._validate_config()
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Any setting may move a box; recompile the geometry on next use
+        if name.isupper():
+            self.__dict__.pop('_geometry', None)
+
     def _validate_config(self):
         """Validate that configuration values are reasonable."""
         if self.SLIDE_WIDTH <= 2 * self.MARGIN:
@@ -116,18 +205,57 @@ class PPTConfig:
         if not (0 < self.IMAGE_WIDTH_RATIO <= 1):
             raise ValueError("Image width ratio must be between 0 and 1")
 
+        if self.IMAGE_TARGET_DPI <= 0:
+            raise ValueError("Image target DPI must be positive")
+
+        if not (1 <= self.IMAGE_JPEG_QUALITY <= 95):
+            raise ValueError("Image JPEG quality must be between 1 and 95")
+
+        if self.IMAGE_CACHE_MAX_BYTES < 0 or self.MEDIA_CACHE_MAX_BYTES < 0:
+            raise ValueError("Cache size caps must not be negative")
+
+        if self.TEXT_FIT not in (None, "shrink", "split"):
+            raise ValueError("Text fit must be None, 'shrink' or 'split'")
+
+        if self.TEXT_MIN_FONT_SIZE <= 0 or self.TEXT_LINE_SPACING <= 0:
+            raise ValueError("Text min font size and line spacing must be positive")
+
         if not (0 < self.TABLE_WIDTH_RATIO <= 1):
             raise ValueError("Table width ratio must be between 0 and 1")
 
         if not (0 < self.TABLE_HEIGHT_RATIO <= 1):
             raise ValueError("Table height ratio must be between 0 and 1")
 
+        if self.TABLE_LINE_SPACING <= 0 or self.TABLE_CELL_MARGIN < 0:
+            raise ValueError("Table line spacing must be positive and cell margin non-negative")
+
         if not (0 < self.CHART_WIDTH_RATIO <= 1):
             raise ValueError("Chart width ratio must be between 0 and 1")
 
         if not (0 < self.CHART_HEIGHT_RATIO <= 1):
             raise ValueError("Chart height ratio must be between 0 and 1")
 
+        if self.CHART_DOWNSAMPLE not in (None, "lttb", "minmax"):
+            raise ValueError("Chart downsample must be None, 'lttb' or 'minmax'")
+
+        if self.CHART_POINTS_PER_INCH <= 0:
+            raise ValueError("Chart points per inch must be positive")
+
+        if self.CHART_MAX_POINTS is not None and self.CHART_MAX_POINTS < 3:
+            raise ValueError("Chart max points must be at least 3")
+
+        if self.CHART_WORKBOOK not in ("fast", "xlsxwriter", "none"):
+            raise ValueError("Chart workbook must be 'fast', 'xlsxwriter' or 'none'")
+
+        if not all(isinstance(name, str) for name in self.TEMPLATE_LAYOUTS.values()):
+            raise ValueError("Template layouts must map layout types to layout names")
+
+        if self.OUTPUT_COMPRESSION not in ("deflate", "stored"):
+            raise ValueError("Output compression must be 'deflate' or 'stored'")
+
+        if self.OUTPUT_COMPRESS_LEVEL is not None and not (0 <= self.OUTPUT_COMPRESS_LEVEL <= 9):
+            raise ValueError("Output compress level must be between 0 and 9")
+
         # Validate color values
         for color_name, color_value in [
             ("TABLE_HEADER_BG_COLOR", self.TABLE_HEADER_BG_COLOR),
@@ -137,6 +265,57 @@ class PPTConfig:
             if not all(0 <= c <= 255 for c in color_value):
                 raise ValueError(f"{color_name} values must be between 0 and 255")
 
+        self._geometry = self._compile_geometry()
+
+    def _compile_geometry(self) -> Geometry:
+        """Compute every layout box once, in EMU."""
+        margin = self.MARGIN
+        content_width = self.content_width
+        content_top = self.content_top
+        content_height = self.content_height
+
+        column_width = (content_width - self.COLUMN_GAP) / 2
+        right_left = margin + column_width + self.COLUMN_GAP
+
+        image_width = content_width * self.IMAGE_WIDTH_RATIO
+        image_left = margin + (content_width - image_width) / 2
+
+        table_width = content_width * self.TABLE_WIDTH_RATIO
+        table_left = margin + (content_width - table_width) / 2
+
+        chart_width = content_width * self.CHART_WIDTH_RATIO
+        chart_left = margin + (content_width - chart_width) / 2
+
+        def box(left, top, width, height):
+            return Box(_emu(left), _emu(top), _emu(width), _emu(height))
+
+        return Geometry(
+            slide_width=_emu(self.SLIDE_WIDTH),
+            slide_height=_emu(self.SLIDE_HEIGHT),
+            title=box(margin, self.TITLE_TOP_POSITION, content_width, self.TITLE_HEIGHT_SIZE),
+            subtitle=box(margin, self.SUBTITLE_TOP_POSITION, content_width, self.SUBTITLE_HEIGHT_SIZE),
+            slide_title=box(margin, self.SLIDE_TITLE_TOP, content_width, self.SLIDE_TITLE_HEIGHT),
+            body=box(margin, content_top, content_width, content_height),
+            left_column=box(margin, content_top, column_width, content_height),
+            right_column=box(right_left, content_top, column_width, content_height),
+            image=box(image_left, content_top + self.IMAGE_TOP_OFFSET, image_width, 0),
+            image_width_inches=image_width,
+            caption=box(margin, self.SLIDE_HEIGHT - self.CAPTION_TOP_FROM_BOTTOM,
+                        content_width, self.CAPTION_HEIGHT),
+            table=box(table_left, content_top, table_width,
+                      content_height * self.TABLE_HEIGHT_RATIO),
+            chart=box(chart_left, content_top, chart_width,
+                      content_height * self.CHART_HEIGHT_RATIO),
+        )
+
+    @property
+    def geometry(self) -> Geometry:
+        """Layout boxes in EMU, compiled after validation and again after any change."""
+        geometry = self.__dict__.get('_geometry')
+        if geometry is None:
+            geometry = self._geometry = self._compile_geometry()
+        return geometry
+
     # Calculated dimensions
     @property
     def content_width(self) -> float:
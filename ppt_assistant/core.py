@@ -1,78 +1,511 @@
 import json
 import os
-from pptx import Presentation
-from pptx.util import Inches, Pt
+from functools import cached_property
+from itertools import zip_longest
+from pptx.util import Pt
 from pptx.enum.text import PP_ALIGN, PP_PARAGRAPH_ALIGNMENT
-from pptx.chart.data import CategoryChartData
-from pptx.enum.chart import XL_CHART_TYPE
-from pptx.dml.color import RGBColor
-from .config import DEFAULT_CONFIG
+from .config import DEFAULT_CONFIG, EMUS_PER_INCH, Box
+from .images import prepare_image
+from .layouts import LAYOUTS, SharedParts
+from .manifest import SlideStream
+from .parts import PartStore, add_picture
+from .profiling import NULL_PROFILER
+from .slides import PartNamer, SlideAppender
+from .sources import resolve_chart_data, resolve_table_data
+from .table import add_table, continuation_title, page_count, paginate_rows, rows_per_page
+from .template import load_presentation, template_index
 
 
 class PPTAssistant:
     """PPT 助手類"""
 
-    def __init__(self, json_file, ppt_config=None):
+    def __init__(self, json_file, ppt_config=None, template=None, stream=False, profiler=None):
         """
         初始化 PPT 助手
 
         Args:
-            json_file: JSON 配置文件路徑
+            json_file: JSON 配置文件路徑或已打開的文件對象 (.jsonl 文件總是以串流模式讀取)
             ppt_config: PPT 配置對象，默認為 DEFAULT_CONFIG
+            template: .pptx 模板路徑，默認使用 JSON 中的 template 或內建模板
+            stream: 是否逐張串流讀取投影片，適用於超大配置文件
+            profiler: 記錄各階段耗時的 profiling.Profiler，默認不記錄
         """
-        with open(json_file, 'r', encoding='utf-8') as f:
-            self.json_config = json.load(f)
+        self.profiler = profiler or NULL_PROFILER
+        with self.profiler.phase('load_json'):
+            if hasattr(json_file, 'read'):
+                if stream:
+                    raise ValueError("串流模式需要文件路徑")
+                self._slide_stream = None
+                self.json_config = json.load(json_file)
+                self.slides_data = self.json_config.get('slides', [])
+            elif stream or json_file.lower().endswith('.jsonl'):
+                self._slide_stream = SlideStream(json_file)
+                self.json_config = self._slide_stream.header
+                self.slides_data = self._slide_stream
+            else:
+                self._slide_stream = None
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    self.json_config = json.load(f)
+                self.slides_data = self.json_config.get('slides', [])
 
-        self.ppt_config = ppt_config or DEFAULT_CONFIG
+        self._configure(ppt_config, template)
+
+    @classmethod
+    def from_dict(cls, config, ppt_config=None, template=None, profiler=None):
+        """
+        以已解析的配置字典創建 PPT 助手 (格式與 JSON 配置文件相同)
 
+        Args:
+            config: 配置字典
+            ppt_config: PPT 配置對象，默認為 DEFAULT_CONFIG
+            template: .pptx 模板路徑，默認使用配置中的 template 或內建模板
+            profiler: 記錄各階段耗時的 profiling.Profiler，默認不記錄
+        """
+        assistant = cls.__new__(cls)
+        assistant.profiler = profiler or NULL_PROFILER
+        assistant._slide_stream = None
+        assistant.json_config = config
+        assistant.slides_data = config.get('slides', [])
+        assistant._configure(ppt_config, template)
+        return assistant
+
+    @classmethod
+    def from_slides(cls, slides, ppt_config=None, template=None, profiler=None):
+        """
+        直接以投影片列表創建 PPT 助手 (不讀取 JSON 文件)
+
+        Args:
+            slides: 投影片字典的列表或可迭代對象
+            ppt_config: PPT 配置對象，默認為 DEFAULT_CONFIG
+            template: .pptx 模板路徑，默認使用內建模板
+            profiler: 記錄各階段耗時的 profiling.Profiler，默認不記錄
+        """
+        assistant = cls.__new__(cls)
+        assistant.profiler = profiler or NULL_PROFILER
+        assistant._slide_stream = None
+        assistant.json_config = {}
+        assistant.slides_data = slides
+        assistant.output_path = None
+        assistant._setup(ppt_config, template)
+        return assistant
+
+    def _configure(self, ppt_config, template):
+        """讀取配置中的輸出路徑與模板,然後創建空白簡報"""
         self.output_path = self.json_config.get('output')
-        self.slides_data = self.json_config.get('slides', [])
-
-        # 創建新簡報
-        self.prs = Presentation()
-
-        # 設置為 16:9 比例 (PowerPoint 標準寬屏尺寸)
-        self.prs.slide_width = Inches(self.ppt_config.SLIDE_WIDTH)
-        self.prs.slide_height = Inches(self.ppt_config.SLIDE_HEIGHT)
-
-    def create_presentation(self):
-        """創建完整的簡報"""
-        for slide_data in self.slides_data:
-            layout_type = slide_data.get('layout')
-            content = slide_data.get('content', {})
-
-            if layout_type == 'title':
-                self._add_title_slide(content)
-            elif layout_type == 'content':
-                self._add_content_slide(content)
-            elif layout_type == 'two_column':
-                self._add_two_column_slide(content)
-            elif layout_type == 'image':
-                self._add_image_slide(content)
-            elif layout_type == 'table':
-                self._add_table_slide(content)
-            elif layout_type == 'chart':
-                self._add_chart_slide(content)
+
+        if template is None:
+            template = self.json_config.get('template')
+            if template and not os.path.exists(template):
+                print(f"警告: 找不到模板文件 '{template}'，改用預設模板")
+                template = None
+
+        self._setup(ppt_config, template)
+
+    def _setup(self, ppt_config, template):
+        """載入配置與模板,創建空白簡報"""
+        with self.profiler.phase('template'):
+            self._setup_presentation(ppt_config, template)
+
+    def _setup_presentation(self, ppt_config, template):
+        """_setup 的實際步驟 (計入剖析的 template 階段)"""
+        self.ppt_config = ppt_config or DEFAULT_CONFIG
+        self.template_path = template
+
+        # 從快取的模板創建新簡報
+        self.prs = load_presentation(self.template_path)
+
+        # 使用者模板: 按快取的佔位符索引選擇版面配置並填入佔位符,保留模板的投影片尺寸
+        self.template_index = None
+        self._template_layouts = {}
+        if self.template_path and self.ppt_config.TEMPLATE_PLACEHOLDERS:
+            self.template_index = template_index(self.template_path)
+            # 提前檢查 TEMPLATE_LAYOUTS 指定的版面配置名稱
+            for kind in self.ppt_config.TEMPLATE_LAYOUTS:
+                self._template_layout(kind)
+        else:
+            # 設置為 16:9 比例 (PowerPoint 標準寬屏尺寸)
+            geometry = self.ppt_config.geometry
+            self.prs.slide_width = geometry.slide_width
+            self.prs.slide_height = geometry.slide_height
+
+        # 以 O(1) 成本追加投影片 (python-pptx 的 add_slide 隨投影片數線性變慢)
+        self._slides = SlideAppender(self.prs)
+        # 同樣只掃描一次套件,為圖表、工作簿等新部件分配名稱
+        self._partnames = PartNamer(self.prs.part.package)
+        # 內容相同的圖片、內嵌工作簿等二進位部件只保存一份
+        self.part_store = PartStore(self.prs.part.package, self._partnames,
+                                    share_workbooks=self.ppt_config.DEDUP_WORKBOOKS)
+
+        # 佈局註冊表與每份簡報只構建一次的共享部件 (如標題文字框原型)
+        self.layouts = LAYOUTS
+        self.shared_parts = SharedParts(self.ppt_config)
+
+        # 生成過程的統計 (如增量重建重用的投影片數)
+        self.summary = {}
+        self._rendered = False
+        self._sidecar_entries = None
+        # 串流輸出時的 StreamingPackageWriter;寫出完成後投影片已釋放,不能再次保存
+        self._writer = None
+        self._streamed = False
+
+    @cached_property
+    def _title_layout(self):
+        """標題頁使用的版面配置 (首次使用時解析)"""
+        return self.prs.slide_layouts[self.ppt_config.TITLE_LAYOUT_INDEX]
+
+    @cached_property
+    def _content_layout(self):
+        """其餘頁面使用的版面配置,模板版面不足時使用備用索引 (首次使用時解析)"""
+        layouts = self.prs.slide_layouts
+        cfg = self.ppt_config
+        index = cfg.CONTENT_LAYOUT_INDEX if len(layouts) > cfg.CONTENT_LAYOUT_INDEX else cfg.CONTENT_LAYOUT_FALLBACK_INDEX
+        return layouts[index]
+
+    def _template_layout(self, kind):
+        """
+        佈局類型在使用者模板中對應的版面配置
+
+        Returns:
+            (TemplateLayout, SlideLayout);未使用佔位符或模板中沒有合適的版面配置時為 (None, None)
+        """
+        entry = self._template_layouts.get(kind)
+        if entry is None:
+            layout = None
+            if self.template_index is not None:
+                layout = self.template_index.layout_for(kind, self.ppt_config.TEMPLATE_LAYOUTS)
+            entry = self._template_layouts[kind] = (layout, layout.resolve(self.prs) if layout else None)
+        return entry
+
+    def _content_boxes(self, kind):
+        """使用者模板中佈局類型的文字佔位符位置 (由左至右),未使用佔位符時返回空列表"""
+        layout = self._template_layout(kind)[0]
+        return [ph.box for ph in layout.bodies] if layout is not None else []
+
+    @staticmethod
+    def _slide_placeholder(slide, placeholder):
+        """投影片上與版面配置佔位符 idx 相同的佔位符,沒有時返回 None"""
+        if placeholder is None:
+            return None
+        return next((ph for ph in slide.placeholders if ph.placeholder_format.idx == placeholder.idx), None)
+
+    def _body_placeholder(self, slide, kind, n=0):
+        """投影片上第 n 個文字佔位符,沒有時返回 None"""
+        layout = self._template_layout(kind)[0]
+        if layout is None or len(layout.bodies) <= n:
+            return None
+        return self._slide_placeholder(slide, layout.bodies[n])
+
+    def _take_placeholder(self, slide, kind, box):
+        """
+        返回圖片、表格或圖表的放置位置
+
+        使用者模板的版面配置有可放置內容的佔位符時,使用其位置並從投影片移除該佔位符
+        (內容取而代之);否則返回 box。
+        """
+        layout = self._template_layout(kind)[0]
+        placeholder = self._slide_placeholder(slide, layout.slot(kind) if layout is not None else None)
+        if placeholder is None:
+            return box
+        element = placeholder._element
+        box = Box(placeholder.left, placeholder.top, placeholder.width, placeholder.height)
+        element.getparent().remove(element)
+        return box
+
+    def render(self, workers=None, incremental=False):
+        """
+        渲染全部投影片 (不保存)
+
+        Args:
+            workers: 並行渲染的工作進程數，默認 (None 或 1) 在當前進程內依序渲染
+            incremental: 是否增量重建，重用上一版輸出中未變化的投影片
+        """
+        if incremental and self.output_path is None:
+            print("警告: 增量重建需要在 slides 之前指定 output，改為完整生成")
+            incremental = False
+
+        if self.ppt_config.VALIDATE_MANIFEST:
+            self.validate()
+
+        if incremental:
+            from .incremental import render_incremental
+            with self.profiler.phase('render', mode='incremental'):
+                self._sidecar_entries = render_incremental(self)
+        elif workers and workers > 1:
+            from .merge import render_parallel
+            with self.profiler.phase('render', mode='parallel', workers=workers):
+                render_parallel(self, workers)
+        else:
+            with self.profiler.phase('render', mode='sequential'):
+                self.render_slides(self.slides_data)
+        self._rendered = True
+        self._record_dedup()
+
+        # 串流模式下,位於 slides 之後的頂層設定在讀完後才可取得
+        if self.output_path is None and self._slide_stream is not None:
+            self.output_path = self._slide_stream.header.get('output')
+
+    def validate(self):
+        """
+        渲染前檢查全部投影片配置，一併報告所有錯誤
+
+        一次性的迭代器 (如生成器) 無法預先遍歷，不作檢查。
+
+        Returns:
+            投影片數，未檢查時返回 None
+
+        Raises:
+            ManifestValidationError: 任一投影片不符合佈局的 schema
+        """
+        from .validation import validate_slides
+
+        if not isinstance(self.slides_data, (list, tuple, SlideStream)):
+            return None
+        with self.profiler.phase('validate'):
+            return validate_slides(self.slides_data, self.layouts)
+
+    def write_streaming(self, target=None, workers=None, compression=None, compress_level=None):
+        """
+        邊渲染邊寫出簡報 (串流輸出)
+
+        每張投影片渲染完成即連同其圖表、工作簿與圖片寫入 zip 並從記憶體釋放，
+        最後寫出簡報部件、模板部件與 [Content_Types].xml，記憶體峰值不隨投影片數增長。
+        輸出為一般的 .pptx；寫出後 self.prs 中的投影片已替換為存根，不能再次保存。
+
+        Args:
+            target: 輸出路徑或可寫二進位流，默認為配置中的 output (須位於 slides 之前)
+            workers: 並行渲染的工作進程數，默認在當前進程內依序渲染
+            compression: zip 壓縮方式 'deflate' 或 'stored'，默認為 OUTPUT_COMPRESSION
+            compress_level: deflate 壓縮等級 0-9，默認為 OUTPUT_COMPRESS_LEVEL
+
+        Raises:
+            ValueError: 已經渲染過或未指定輸出路徑
+        """
+        from .writer import StreamingPackageWriter
+
+        if self._rendered:
+            raise ValueError("簡報已渲染，串流輸出只能在渲染前使用")
+        if target is None:
+            target = self.output_path
+        if target is None:
+            raise ValueError("未指定輸出路徑 (串流輸出需要在 slides 之前指定 output)")
+        if self.ppt_config.VALIDATE_MANIFEST:
+            self.validate()
+
+        writer = StreamingPackageWriter(self.prs, target, *self._compression(compression, compress_level),
+                                        store=self.part_store)
+        self._writer = writer
+        self._slides.on_append = writer.add_slide
+        try:
+            if workers and workers > 1:
+                from .merge import render_parallel
+                with self.profiler.phase('render', mode='parallel', workers=workers, streaming=True):
+                    render_parallel(self, workers)
             else:
-                print(f"警告: 不支援的佈局類型 '{layout_type}'")
+                with self.profiler.phase('render', mode='streaming'):
+                    self.render_slides(self.slides_data)
+            with self.profiler.phase('save'):
+                writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+        finally:
+            self._slides.on_append = None
+            self._writer = None
+        self._rendered = True
+        self._streamed = True
+        self._record_dedup()
+
+    def _check_not_streamed(self):
+        if self._streamed:
+            raise ValueError("簡報已以串流模式寫出，投影片已釋放，不能再次保存")
+
+    def save(self, target=None, compression=None, compress_level=None):
+        """
+        保存簡報 (尚未渲染時先渲染)
+
+        Args:
+            target: 輸出路徑或可寫二進位流，默認為配置中的 output
+            compression: zip 壓縮方式 'deflate' 或 'stored'，默認為 OUTPUT_COMPRESSION
+            compress_level: deflate 壓縮等級 0-9，默認為 OUTPUT_COMPRESS_LEVEL
+        """
+        from .writer import write_package
+
+        self._check_not_streamed()
+        if not self._rendered:
+            self.render()
+        if target is None:
+            target = self.output_path
+        if target is None:
+            raise ValueError("未指定輸出路徑 (配置中沒有 output)")
+
+        with self.profiler.phase('save'):
+            write_package(self.prs, target, *self._compression(compression, compress_level))
+        if self._sidecar_entries is not None and target == self.output_path:
+            from .incremental import save_sidecar
+            save_sidecar(self.output_path, self._sidecar_entries)
+
+    def to_bytes(self, compression=None, compress_level=None):
+        """
+        返回 .pptx 內容 (尚未渲染時先渲染)
+
+        Args:
+            compression: zip 壓縮方式 'deflate' 或 'stored'，默認為 OUTPUT_COMPRESSION
+            compress_level: deflate 壓縮等級 0-9，默認為 OUTPUT_COMPRESS_LEVEL
 
-        # 保存簡報
-        self.prs.save(self.output_path)
+        Returns:
+            bytes
+        """
+        from .writer import package_bytes
+
+        self._check_not_streamed()
+        if not self._rendered:
+            self.render()
+        with self.profiler.phase('save'):
+            return package_bytes(self.prs, *self._compression(compression, compress_level))
+
+    def iter_bytes(self, chunk_size=None, compression=None, compress_level=None):
+        """
+        逐塊產生 .pptx 內容 (尚未渲染時先渲染)，適合直接寫入 socket 或分段上傳
+
+        Args:
+            chunk_size: 每塊的大小，默認 64KB
+            compression: zip 壓縮方式 'deflate' 或 'stored'，默認為 OUTPUT_COMPRESSION
+            compress_level: deflate 壓縮等級 0-9，默認為 OUTPUT_COMPRESS_LEVEL
+
+        Yields:
+            bytes 區塊
+        """
+        from .writer import STREAM_CHUNK_SIZE, iter_package
+
+        self._check_not_streamed()
+        if not self._rendered:
+            self.render()
+        yield from iter_package(self.prs, chunk_size or STREAM_CHUNK_SIZE,
+                                *self._compression(compression, compress_level))
+
+    def _compression(self, compression, compress_level):
+        """未指定的壓縮參數使用配置值"""
+        if compression is None:
+            compression = self.ppt_config.OUTPUT_COMPRESSION
+        if compress_level is None:
+            compress_level = self.ppt_config.OUTPUT_COMPRESS_LEVEL
+        return compression, compress_level
+
+    def create_presentation(self, workers=None, incremental=False, stream_output=False):
+        """
+        創建完整的簡報並保存到配置中的 output
+
+        Args:
+            workers: 並行渲染的工作進程數，默認 (None 或 1) 在當前進程內依序渲染
+            incremental: 是否增量重建，重用上一版輸出中未變化的投影片
+            stream_output: 是否邊渲染邊寫出 (見 write_streaming)，適用於投影片數以千計的簡報
+        """
+        if stream_output and incremental:
+            print("警告: 串流輸出不支援增量重建，改為一般輸出")
+            stream_output = False
+        if stream_output:
+            self.write_streaming(workers=workers)
+        else:
+            self.render(workers, incremental)
+            self.save()
         print(f"簡報已成功生成: {self.output_path}")
+        if 'downsampling' in self.summary:
+            stats = self.summary['downsampling']
+            print(f"降採樣: {stats['charts']} 個折線圖，數據點 {stats['points_before']:,} → "
+                  f"{stats['points_after']:,}，估計減少 {stats['estimated_bytes_saved'] / 1048576:.1f} MB")
+        if 'text_fit' in self.summary:
+            stats = self.summary['text_fit']
+            print(f"文字適配: 縮小字號 {stats['shrunk']} 個文字框，續頁 {stats['continuation_slides']} 張")
+        if 'slides_reused' in self.summary:
+            print(f"增量重建: 重用 {self.summary['slides_reused']} 張，"
+                  f"重新渲染 {self.summary['slides_rebuilt']} 張")
+        if self.summary.get('dedup', {}).get('parts_shared'):
+            stats = self.summary['dedup']
+            print(f"部件共用: {stats['parts_shared']} 個重複的工作簿等部件，"
+                  f"減少 {stats['bytes_saved'] / 1048576:.1f} MB")
+
+    def render_slides(self, slides):
+        """依序渲染投影片到 self.prs"""
+        for slide_data in slides:
+            self._render_slide(slide_data)
+            if self._writer is not None:
+                self._writer.flush()
+        self._rendered = True
+
+    def _render_slide(self, slide_data):
+        """按佈局類型渲染一張投影片 (經由佈局註冊表分派)"""
+        layout_type = slide_data.get('layout')
+        with self.profiler.slide(layout_type, self._slides.count + 1):
+            rendered = self.layouts.render(self, layout_type, slide_data.get('content', {}))
+        if not rendered:
+            print(f"警告: 不支援的佈局類型 '{layout_type}'")
+
+    def add_slide(self, layout='content'):
+        """
+        追加一張空白投影片 (供佈局渲染器使用)
+
+        使用者模板按佈局類型選擇版面配置 (見 TemplateIndex.layout_for) 並複製其佔位符;
+        否則 'title' 使用標題頁版面配置,其餘使用內容頁版面配置。
+
+        Args:
+            layout: 佈局類型,如 'title'、'content'、'two_column'
+
+        Returns:
+            新的 Slide
+        """
+        slide_layout = self._template_layout(layout)[1]
+        if slide_layout is None:
+            slide_layout = self._title_layout if layout == 'title' else self._content_layout
+        return self._slides.add_slide(slide_layout)
+
+    def add_title_box(self, slide, text):
+        """
+        以共享的標題文字框原型添加頁面標題 (使用者模板的標題佔位符則直接填入)
+
+        Args:
+            slide: 目標投影片
+            text: 標題文字
+
+        Returns:
+            標題文字框 Shape (使用者模板的標題佔位符,沒有時為新的文字框)
+        """
+        if self.template_index is not None:
+            title = slide.shapes.title
+            if title is not None:
+                title.text_frame.text = text
+                return title
+
+        shapes = slide.shapes
+        sp = self.shared_parts.clone('title_box')
+        shape_id = shapes._next_shape_id
+        sp.nvSpPr.cNvPr.id = shape_id
+        sp.nvSpPr.cNvPr.name = 'TextBox %d' % (shape_id - 1)
+        shapes._spTree.insert_element_before(sp, 'p:extLst')
+        shape = shapes._shape_factory(sp)
+        shape.text_frame.paragraphs[0].text = text
+        return shape
 
     def _add_title_slide(self, content):
         """添加標題頁"""
-        slide_layout = self.prs.slide_layouts[self.ppt_config.TITLE_LAYOUT_INDEX]
-        slide = self.prs.slides.add_slide(slide_layout)
+        geometry = self.ppt_config.geometry
+        slide = self.add_slide('title')
+
+        layout = self._template_layout('title')[0]
+        if layout is not None:
+            # 使用者模板: 沿用佔位符的位置與文字樣式
+            if slide.shapes.title is not None:
+                slide.shapes.title.text_frame.text = content.get('title', '')
+            subtitle = layout.find('subTitle') or next(iter(layout.bodies), None)
+            for placeholder in slide.placeholders:
+                if subtitle is not None and placeholder.placeholder_format.idx == subtitle.idx:
+                    placeholder.text_frame.text = content.get('subtitle', '')
+            return
 
         # 設置標題
         if slide.shapes.title:
             title = slide.shapes.title
             title.text = content.get('title', '')
-            title.left = Inches(self.ppt_config.MARGIN)
-            title.top = Inches(self.ppt_config.TITLE_TOP_POSITION)
-            title.width = Inches(self.ppt_config.content_width)
-            title.height = Inches(self.ppt_config.TITLE_HEIGHT_SIZE)
+            title.left, title.top, title.width, title.height = geometry.title
             tf = title.text_frame
             tf.paragraphs[0].alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
             tf.paragraphs[0].font.size = Pt(self.ppt_config.TITLE_FONT_SIZE)
@@ -82,160 +515,209 @@ class PPTAssistant:
         if len(slide.placeholders) > 1:
             subtitle = slide.placeholders[1]
             subtitle.text = content.get('subtitle', '')
-            subtitle.left = Inches(self.ppt_config.MARGIN)
-            subtitle.top = Inches(self.ppt_config.SUBTITLE_TOP_POSITION)
-            subtitle.width = Inches(self.ppt_config.content_width)
-            subtitle.height = Inches(self.ppt_config.SUBTITLE_HEIGHT_SIZE)
+            subtitle.left, subtitle.top, subtitle.width, subtitle.height = geometry.subtitle
             tf = subtitle.text_frame
             tf.paragraphs[0].alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
             tf.paragraphs[0].font.size = Pt(self.ppt_config.SUBTITLE_FONT_SIZE)
 
     def _add_content_slide(self, content):
-        """添加內容頁"""
-        layout_index = self.ppt_config.CONTENT_LAYOUT_INDEX if len(self.prs.slide_layouts) > self.ppt_config.CONTENT_LAYOUT_INDEX else self.ppt_config.CONTENT_LAYOUT_FALLBACK_INDEX
-        slide_layout = self.prs.slide_layouts[layout_index]
-        slide = self.prs.slides.add_slide(slide_layout)
+        """添加內容頁 (按 TEXT_FIT 縮小字號或拆分到續頁)"""
+        geometry = self.ppt_config.geometry
+        title = content.get('title', '')
+        body_text = content.get('body', '')
+        is_list = isinstance(body_text, list)
+        paragraphs = [str(item) for item in body_text] if is_list else [str(body_text)]
+        spacing = (self.ppt_config.PARAGRAPH_SPACE_BEFORE, self.ppt_config.PARAGRAPH_SPACE_AFTER) if is_list else (0, 0)
+
+        boxes = self._content_boxes('content')
+        pages, size = self._fit_text(paragraphs, boxes[0] if boxes else geometry.body,
+                                     self.ppt_config.BODY_FONT_SIZE, spacing)
+        self._record_text_fit(size != self.ppt_config.BODY_FONT_SIZE, len(pages) - 1)
+        for page, page_paragraphs in enumerate(pages, 1):
+            self._add_content_page(continuation_title(title, page, len(pages), self.ppt_config),
+                                   page_paragraphs, size, is_list)
+
+    def _add_content_page(self, title, paragraphs, font_size, is_list):
+        """添加單頁內容"""
+        geometry = self.ppt_config.geometry
+        slide = self.add_slide()
 
         # 添加標題
-        title_shape = slide.shapes.add_textbox(
-            Inches(self.ppt_config.MARGIN),
-            Inches(self.ppt_config.SLIDE_TITLE_TOP),
-            Inches(self.ppt_config.content_width),
-            Inches(self.ppt_config.SLIDE_TITLE_HEIGHT)
-        )
-        tf = title_shape.text_frame
-        p = tf.paragraphs[0]
-        p.text = content.get('title', '')
-        p.font.size = Pt(self.ppt_config.SLIDE_TITLE_FONT_SIZE)
-        p.font.bold = True
-        p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
+        self.add_title_box(slide, title)
+
+        body = self._body_placeholder(slide, 'content')
+        if body is not None:
+            self._fill_placeholder(body, paragraphs, font_size, self.ppt_config.BODY_FONT_SIZE)
+            return
 
         # 添加內容
-        body_shape = slide.shapes.add_textbox(
-            Inches(self.ppt_config.MARGIN),
-            Inches(self.ppt_config.content_top),
-            Inches(self.ppt_config.content_width),
-            Inches(self.ppt_config.content_height)
-        )
+        body_shape = slide.shapes.add_textbox(*geometry.body)
         tf = body_shape.text_frame
         tf.word_wrap = True
 
-        body_text = content.get('body', '')
-        if isinstance(body_text, list):
-            for idx, item in enumerate(body_text):
+        if is_list:
+            for idx, item in enumerate(paragraphs):
                 if idx == 0:
                     p = tf.paragraphs[0]
                 else:
                     p = tf.add_paragraph()
-                p.text = str(item)
+                p.text = item
                 p.level = 0
-                p.font.size = Pt(self.ppt_config.BODY_FONT_SIZE)
+                p.font.size = Pt(font_size)
                 p.space_before = Pt(self.ppt_config.PARAGRAPH_SPACE_BEFORE)
                 p.space_after = Pt(self.ppt_config.PARAGRAPH_SPACE_AFTER)
                 p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
         else:
             p = tf.paragraphs[0]
-            p.text = str(body_text)
-            p.font.size = Pt(self.ppt_config.BODY_FONT_SIZE)
+            p.text = paragraphs[0] if paragraphs else ''
+            p.font.size = Pt(font_size)
             p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
 
     def _add_two_column_slide(self, content):
-        """添加雙欄佈局頁"""
-        layout_index = self.ppt_config.CONTENT_LAYOUT_INDEX if len(self.prs.slide_layouts) > self.ppt_config.CONTENT_LAYOUT_INDEX else self.ppt_config.CONTENT_LAYOUT_FALLBACK_INDEX
-        slide_layout = self.prs.slide_layouts[layout_index]
-        slide = self.prs.slides.add_slide(slide_layout)
+        """添加雙欄佈局頁 (按 TEXT_FIT 縮小字號或拆分到續頁)"""
+        geometry = self.ppt_config.geometry
+        title = content.get('title', '')
+        font_size = self.ppt_config.COLUMN_FONT_SIZE
+
+        boxes = self._content_boxes('two_column')
+        left_box, right_box = boxes[:2] if len(boxes) >= 2 else (geometry.left_column, geometry.right_column)
+        left_pages, left_size = self._fit_text([str(content.get('left', ''))], left_box, font_size)
+        right_pages, right_size = self._fit_text([str(content.get('right', ''))], right_box, font_size)
+        # 兩欄使用相同字號
+        size = min(left_size, right_size)
+        pages = list(zip_longest(left_pages, right_pages, fillvalue=['']))
+        self._record_text_fit((left_size != font_size) + (right_size != font_size), len(pages) - 1)
+        for page, (left, right) in enumerate(pages, 1):
+            self._add_two_column_page(continuation_title(title, page, len(pages), self.ppt_config),
+                                      left[0], right[0], size)
+
+    def _add_two_column_page(self, title, left, right, font_size):
+        """添加單頁雙欄內容"""
+        geometry = self.ppt_config.geometry
+        slide = self.add_slide('two_column')
 
         # 添加標題
-        title_shape = slide.shapes.add_textbox(
-            Inches(self.ppt_config.MARGIN),
-            Inches(self.ppt_config.SLIDE_TITLE_TOP),
-            Inches(self.ppt_config.content_width),
-            Inches(self.ppt_config.SLIDE_TITLE_HEIGHT)
-        )
-        tf = title_shape.text_frame
-        p = tf.paragraphs[0]
-        p.text = content.get('title', '')
-        p.font.size = Pt(self.ppt_config.SLIDE_TITLE_FONT_SIZE)
-        p.font.bold = True
-        p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
-
-        # 計算雙欄尺寸
-        column_width = (self.ppt_config.content_width - self.ppt_config.COLUMN_GAP) / 2
+        self.add_title_box(slide, title)
+
+        columns = [self._body_placeholder(slide, 'two_column', n) for n in range(2)]
+        if None not in columns:
+            for placeholder, text in zip(columns, (left, right)):
+                self._fill_placeholder(placeholder, [text], font_size, self.ppt_config.COLUMN_FONT_SIZE)
+            return
 
         # 左欄
-        left_box = slide.shapes.add_textbox(
-            Inches(self.ppt_config.MARGIN),
-            Inches(self.ppt_config.content_top),
-            Inches(column_width),
-            Inches(self.ppt_config.content_height)
-        )
+        left_box = slide.shapes.add_textbox(*geometry.left_column)
         left_tf = left_box.text_frame
         left_tf.word_wrap = True
         left_p = left_tf.paragraphs[0]
-        left_p.text = str(content.get('left', ''))
-        left_p.font.size = Pt(self.ppt_config.COLUMN_FONT_SIZE)
+        left_p.text = left
+        left_p.font.size = Pt(font_size)
         left_p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
         left_p.space_after = Pt(self.ppt_config.COLUMN_SPACE_AFTER)
 
         # 右欄
-        right_left_pos = self.ppt_config.MARGIN + column_width + self.ppt_config.COLUMN_GAP
-        right_box = slide.shapes.add_textbox(
-            Inches(right_left_pos),
-            Inches(self.ppt_config.content_top),
-            Inches(column_width),
-            Inches(self.ppt_config.content_height)
-        )
+        right_box = slide.shapes.add_textbox(*geometry.right_column)
         right_tf = right_box.text_frame
         right_tf.word_wrap = True
         right_p = right_tf.paragraphs[0]
-        right_p.text = str(content.get('right', ''))
-        right_p.font.size = Pt(self.ppt_config.COLUMN_FONT_SIZE)
+        right_p.text = right
+        right_p.font.size = Pt(font_size)
         right_p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
         right_p.space_after = Pt(self.ppt_config.COLUMN_SPACE_AFTER)
 
+    @staticmethod
+    def _fill_placeholder(placeholder, paragraphs, font_size, configured_size):
+        """
+        以段落填入佔位符,沿用模板的文字樣式
+
+        Args:
+            placeholder: 投影片上的佔位符
+            paragraphs: 段落文字列表
+            font_size: 文字適配後的字號
+            configured_size: 配置的字號;font_size 與之不同 (已縮小) 時才設置字號
+        """
+        tf = placeholder.text_frame
+        for idx, text in enumerate(paragraphs or ['']):
+            p = tf.paragraphs[0] if idx == 0 else tf.add_paragraph()
+            p.text = text
+            if font_size != configured_size:
+                p.font.size = Pt(font_size)
+
+    @cached_property
+    def _text_fitter(self):
+        """文字適配引擎 (僅在啟用 TEXT_FIT 時載入)"""
+        from .textfit import TextFitter
+        return TextFitter(self.ppt_config)
+
+    def _fit_text(self, paragraphs, box, font_size, spacing=(0, 0)):
+        """
+        按 TEXT_FIT 處理放不下的文字
+
+        Args:
+            paragraphs: 段落文字列表
+            box: 文字框 (Box)
+            font_size: 配置的字號
+            spacing: (段前, 段後) 間距 (點)
+
+        Returns:
+            (每頁的段落列表, 字號);未啟用時原樣返回單頁
+        """
+        mode = self.ppt_config.TEXT_FIT
+        if mode == 'shrink':
+            return [paragraphs], self._text_fitter.shrink(paragraphs, box, font_size, spacing)
+        if mode == 'split':
+            return self._text_fitter.split(paragraphs, box, font_size, spacing), font_size
+        return [paragraphs], font_size
+
+    def _record_text_fit(self, shrunk, continuation_slides):
+        """在生成統計中記錄縮小字號的文字框數與續頁數"""
+        if not (shrunk or continuation_slides):
+            return
+        stats = self.summary.setdefault('text_fit', {'shrunk': 0, 'continuation_slides': 0})
+        stats['shrunk'] += int(shrunk)
+        stats['continuation_slides'] += continuation_slides
+
     def _add_image_slide(self, content):
         """添加圖片頁"""
-        layout_index = self.ppt_config.CONTENT_LAYOUT_INDEX if len(self.prs.slide_layouts) > self.ppt_config.CONTENT_LAYOUT_INDEX else self.ppt_config.CONTENT_LAYOUT_FALLBACK_INDEX
-        slide_layout = self.prs.slide_layouts[layout_index]
-        slide = self.prs.slides.add_slide(slide_layout)
+        geometry = self.ppt_config.geometry
+        slide = self.add_slide('image')
 
         # 添加標題
-        title_shape = slide.shapes.add_textbox(
-            Inches(self.ppt_config.MARGIN),
-            Inches(self.ppt_config.SLIDE_TITLE_TOP),
-            Inches(self.ppt_config.content_width),
-            Inches(self.ppt_config.SLIDE_TITLE_HEIGHT)
-        )
-        tf = title_shape.text_frame
-        p = tf.paragraphs[0]
-        p.text = content.get('title', '')
-        p.font.size = Pt(self.ppt_config.SLIDE_TITLE_FONT_SIZE)
-        p.font.bold = True
-        p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
+        self.add_title_box(slide, content.get('title', ''))
+
+        # 圖片居中,使用大部分內容區域 (使用者模板: 圖片或內容佔位符的區域,
+        # 另一個文字佔位符用於圖片說明,沒有時圖片說明放在區域底部)
+        caption = content.get('caption', '')
+        layout = self._template_layout('image')[0]
+        caption_placeholder = self._slide_placeholder(slide, layout.caption('image') if layout is not None else None)
+        box = self._take_placeholder(slide, 'image', geometry.image)
+        placed = box is not geometry.image
+        caption_box = geometry.caption
+        if placed and caption and caption_placeholder is None:
+            height = geometry.caption.height
+            caption_box = Box(box.left, box.top + box.height - height, box.width, height)
+            box = box._replace(height=box.height - height)
 
         # 添加圖片
         image_path = content.get('image', '')
         if image_path and os.path.exists(image_path):
-            # 圖片居中,使用大部分內容區域
-            img_width = self.ppt_config.content_width * self.ppt_config.IMAGE_WIDTH_RATIO
-            img_left = self.ppt_config.MARGIN + (self.ppt_config.content_width - img_width) / 2
-            img_top = self.ppt_config.content_top + self.ppt_config.IMAGE_TOP_OFFSET
-            slide.shapes.add_picture(
-                image_path,
-                Inches(img_left),
-                Inches(img_top),
-                width=Inches(img_width)
-            )
+            width_inches = box.width / EMUS_PER_INCH if placed else geometry.image_width_inches
+            with self.profiler.phase('image'):
+                picture = add_picture(slide, prepare_image(image_path, width_inches, self.ppt_config),
+                                      box.left, box.top, box.width, self.part_store)
+            if placed and picture.height > box.height:
+                # 按區域高度縮小並水平居中
+                picture.width = int(picture.width * box.height / picture.height)
+                picture.height = box.height
+                picture.left = box.left + (box.width - picture.width) // 2
+            # 從記憶體嵌入時保留原文件名作為替代文字
+            picture._element.nvPicPr.cNvPr.set('descr', os.path.basename(image_path))
 
         # 添加圖片說明(可選)
-        caption = content.get('caption', '')
-        if caption:
-            caption_shape = slide.shapes.add_textbox(
-                Inches(self.ppt_config.MARGIN),
-                Inches(self.ppt_config.SLIDE_HEIGHT - self.ppt_config.CAPTION_TOP_FROM_BOTTOM),
-                Inches(self.ppt_config.content_width),
-                Inches(self.ppt_config.CAPTION_HEIGHT)
-            )
+        if caption and caption_placeholder is not None:
+            caption_placeholder.text_frame.text = caption
+        elif caption:
+            caption_shape = slide.shapes.add_textbox(*caption_box)
             caption_tf = caption_shape.text_frame
             caption_p = caption_tf.paragraphs[0]
             caption_p.text = caption
@@ -244,135 +726,111 @@ class PPTAssistant:
             caption_p.font.italic = True
 
     def _add_table_slide(self, content):
-        """添加表格頁"""
-        layout_index = self.ppt_config.CONTENT_LAYOUT_INDEX if len(self.prs.slide_layouts) > self.ppt_config.CONTENT_LAYOUT_INDEX else self.ppt_config.CONTENT_LAYOUT_FALLBACK_INDEX
-        slide_layout = self.prs.slide_layouts[layout_index]
-        slide = self.prs.slides.add_slide(slide_layout)
-
-        # 添加標題
-        title_shape = slide.shapes.add_textbox(
-            Inches(self.ppt_config.MARGIN),
-            Inches(self.ppt_config.SLIDE_TITLE_TOP),
-            Inches(self.ppt_config.content_width),
-            Inches(self.ppt_config.SLIDE_TITLE_HEIGHT)
-        )
-        tf = title_shape.text_frame
-        p = tf.paragraphs[0]
-        p.text = content.get('title', '')
-        p.font.size = Pt(self.ppt_config.SLIDE_TITLE_FONT_SIZE)
-        p.font.bold = True
-        p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
+        """添加表格頁 (數據行超出單頁容量時,自動分頁並在續頁重複表頭)"""
+        title = content.get('title', '')
 
         # 獲取表格數據
-        table_data = content.get('table', {})
-        headers = table_data.get('headers', [])
-        rows = table_data.get('rows', [])
+        headers, rows = resolve_table_data(content.get('table', {}))
+
+        # rows 可能是生成器,空行由下方的分頁循環處理
+        if rows is None or not len(headers):
+            self._add_table_page(title, headers, [])
+            return
+
+        layout = self._template_layout('table')[0]
+        slot = layout.slot('table') if layout is not None else None
+        per_page = None
+        if self.ppt_config.TABLE_PAGINATE:
+            per_page = rows_per_page(self.ppt_config, slot.box.height / EMUS_PER_INCH if slot else None)
+        pages = page_count(rows, per_page)
+        page = 0
+        for page, page_rows in enumerate(paginate_rows(rows, per_page), 1):
+            self._add_table_page(continuation_title(title, page, pages, self.ppt_config), headers, page_rows)
+        if page == 0:
+            self._add_table_page(title, headers, [])
+
+    def _add_table_page(self, title, headers, rows):
+        """添加單頁表格"""
+        geometry = self.ppt_config.geometry
+        slide = self.add_slide('table')
+
+        # 添加標題
+        self.add_title_box(slide, title)
 
         if headers and rows:
-            # 計算表格尺寸
-            rows_count = len(rows) + 1  # +1 for header
-            cols_count = len(headers)
-
-            # 添加表格 - 使用完整內容區域
-            table_width = self.ppt_config.content_width * self.ppt_config.TABLE_WIDTH_RATIO
-            table_left = self.ppt_config.MARGIN + (self.ppt_config.content_width - table_width) / 2
-
-            table_shape = slide.shapes.add_table(
-                rows_count,
-                cols_count,
-                Inches(table_left),
-                Inches(self.ppt_config.content_top),
-                Inches(table_width),
-                Inches(self.ppt_config.content_height * self.ppt_config.TABLE_HEIGHT_RATIO)
-            )
-            table = table_shape.table
-
-            # 填充表頭
-            for col_idx, header in enumerate(headers):
-                cell = table.cell(0, col_idx)
-                cell.text = str(header)
-                # 格式化表頭
-                for paragraph in cell.text_frame.paragraphs:
-                    paragraph.font.bold = True
-                    paragraph.font.size = Pt(self.ppt_config.TABLE_HEADER_FONT_SIZE)
-                    paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
-                # 設置表頭背景色
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(*self.ppt_config.TABLE_HEADER_BG_COLOR)
-                # 設置文字顏色為白色
-                for paragraph in cell.text_frame.paragraphs:
-                    paragraph.font.color.rgb = RGBColor(*self.ppt_config.TABLE_HEADER_TEXT_COLOR)
-
-            # 填充數據行
-            for row_idx, row_data in enumerate(rows):
-                for col_idx, cell_data in enumerate(row_data):
-                    cell = table.cell(row_idx + 1, col_idx)
-                    cell.text = str(cell_data)
-                    # 格式化數據單元格
-                    for paragraph in cell.text_frame.paragraphs:
-                        paragraph.font.size = Pt(self.ppt_config.TABLE_DATA_FONT_SIZE)
-                        paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
-                    # 交替行背景色
-                    if row_idx % 2 == 0:
-                        cell.fill.solid()
-                        cell.fill.fore_color.rgb = RGBColor(*self.ppt_config.TABLE_ALT_ROW_BG_COLOR)
+            # 添加表格 - 使用完整內容區域 (一次性生成表格 XML)
+            add_table(slide, headers, rows, *self._take_placeholder(slide, 'table', geometry.table),
+                      self.ppt_config)
 
     def _add_chart_slide(self, content):
         """添加圖表頁"""
-        layout_index = self.ppt_config.CONTENT_LAYOUT_INDEX if len(self.prs.slide_layouts) > self.ppt_config.CONTENT_LAYOUT_INDEX else self.ppt_config.CONTENT_LAYOUT_FALLBACK_INDEX
-        slide_layout = self.prs.slide_layouts[layout_index]
-        slide = self.prs.slides.add_slide(slide_layout)
+        geometry = self.ppt_config.geometry
+        slide = self.add_slide('chart')
 
         # 添加標題
-        title_shape = slide.shapes.add_textbox(
-            Inches(self.ppt_config.MARGIN),
-            Inches(self.ppt_config.SLIDE_TITLE_TOP),
-            Inches(self.ppt_config.content_width),
-            Inches(self.ppt_config.SLIDE_TITLE_HEIGHT)
-        )
-        tf = title_shape.text_frame
-        p = tf.paragraphs[0]
-        p.text = content.get('title', '')
-        p.font.size = Pt(self.ppt_config.SLIDE_TITLE_FONT_SIZE)
-        p.font.bold = True
-        p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
+        self.add_title_box(slide, content.get('title', ''))
 
         # 獲取圖表數據
         chart_config = content.get('chart', {})
         chart_type = chart_config.get('type', 'bar')
-        chart_data_config = chart_config.get('data', {})
-
-        categories = chart_data_config.get('categories', [])
-        series_list = chart_data_config.get('series', [])
+        categories, series_list = resolve_chart_data(chart_config.get('data', {}))
+
+        # 折線圖數據點遠多於圖表寬度可呈現的點數時降採樣
+        points_kept = None
+        if self.ppt_config.CHART_DOWNSAMPLE and chart_type == 'line':
+            from .downsample import downsample_chart, max_points
+            # 點數按圖表的實際擺放寬度計算 (使用者模板的佔位符可能比默認區域窄)
+            layout = self._template_layout('chart')[0]
+            slot = layout.slot('chart') if layout is not None else None
+            limit = max_points(self.ppt_config, slot.box.width if slot else geometry.chart.width)
+            points_before = len(categories) * len(series_list)
+            categories, series_list, points_kept = downsample_chart(
+                categories, series_list, limit, self.ppt_config.CHART_DOWNSAMPLE)
 
         if categories and series_list:
+            # 圖表模組 (含 XlsxWriter) 在首次生成圖表時才匯入
+            from pptx.enum.chart import XL_CHART_TYPE
+            from .workbook import ChartData, add_chart
+
             # 創建圖表數據
-            chart_data = CategoryChartData()
+            chart_data = ChartData(self.ppt_config.CHART_WORKBOOK)
             chart_data.categories = categories
 
             for series in series_list:
                 series_name = series.get('name', '')
                 series_values = series.get('values', [])
-                chart_data.add_series(series_name, series_values)
+                chart_data.add_series(series_name, series_values, series.get('number_format'))
 
             # 確定圖表類型
             chart_type_attr = getattr(XL_CHART_TYPE, self.ppt_config.CHART_TYPE_MAPPING.get(chart_type, 'COLUMN_CLUSTERED'))
 
             # 添加圖表 - 使用完整內容區域
-            chart_width = self.ppt_config.content_width * self.ppt_config.CHART_WIDTH_RATIO
-            chart_left = self.ppt_config.MARGIN + (self.ppt_config.content_width - chart_width) / 2
-
-            chart_shape = slide.shapes.add_chart(
-                chart_type_attr,
-                Inches(chart_left),
-                Inches(self.ppt_config.content_top),
-                Inches(chart_width),
-                Inches(self.ppt_config.content_height * self.ppt_config.CHART_HEIGHT_RATIO),
-                chart_data
-            )
+            box = self._take_placeholder(slide, 'chart', geometry.chart)
+            chart_shape = add_chart(slide, chart_type_attr, box, chart_data, self._partnames,
+                                    self.profiler, self.part_store)
             chart = chart_shape.chart
 
+            if points_kept is not None:
+                self._record_downsampling(chart_shape.chart_part, points_before, points_kept * len(series_list))
+
             # 設置圖表樣式
             chart.has_legend = True
             chart.legend.position = self.ppt_config.CHART_LEGEND_POSITION
-            chart.legend.include_in_layout = False
\ No newline at end of file
+            chart.legend.include_in_layout = False
+
+    def _record_dedup(self):
+        """在生成統計中記錄共用的部件數與節省的位元組數"""
+        if self.part_store.parts_shared or self.part_store.images_shared:
+            self.summary['dedup'] = self.part_store.summary()
+
+    def _record_downsampling(self, chart_part, points_before, points_after):
+        """在生成統計中記錄降採樣的數據點數與估計減少的文件大小"""
+        xlsx_part = chart_part.chart_workbook.xlsx_part
+        size = len(chart_part.blob) + (len(xlsx_part.blob) if xlsx_part is not None else 0)
+        stats = self.summary.setdefault('downsampling', {
+            'charts': 0, 'points_before': 0, 'points_after': 0, 'estimated_bytes_saved': 0})
+        stats['charts'] += 1
+        stats['points_before'] += points_before
+        stats['points_after'] += points_after
+        # 圖表 XML 與工作簿大小大致與數據點數成正比
+        stats['estimated_bytes_saved'] += int(size * (points_before / points_after - 1))
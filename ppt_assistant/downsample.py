@@ -0,0 +1,160 @@
+"""
+折線圖數據降採樣
+
+數據點遠多於圖表實際寬度能呈現的像素時 (例如 11 英寸寬的圖表放 10 萬個點),
+嵌入的工作簿與圖表 XML 會非常龐大,PowerPoint 打開也很慢。
+此模組按圖表的實際擺放寬度 (CHART_POINTS_PER_INCH) 與 CHART_MAX_POINTS
+選出保留的數據點,提供兩種演算法:
+
+- lttb: Largest-Triangle-Three-Buckets,保留視覺形狀,適合一般趨勢線
+- minmax: 每個區間保留最小值與最大值,保證尖峰不被抹平,適合監控類數據
+
+同一圖表的所有序列共用分類軸,因此選出的索引取各序列結果的聯集。
+需要 NumPy。打開時間的效果以 benchmarks/bench_downsample.py 測量。
+"""
+
+import math
+
+from .sources import _numpy
+
+
+def _fill_missing(y):
+    """以線性插值填補缺失值 (僅用於選點,輸出仍保留原始的空白數據點)"""
+    np = _numpy()
+    missing = np.isnan(y)
+    if not missing.any():
+        return y
+    if missing.all():
+        return np.zeros_like(y)
+    x = np.arange(len(y))
+    return np.where(missing, np.interp(x, x[~missing], y[~missing]), y)
+
+
+def lttb_indices(y, n_out):
+    """
+    Largest-Triangle-Three-Buckets 降採樣
+
+    Args:
+        y: 一維數值數組 (可含 NaN)
+        n_out: 保留的點數 (至少 3)
+
+    Returns:
+        保留點的索引數組 (遞增,包含首尾兩點)
+    """
+    np = _numpy()
+    y = _fill_missing(np.asarray(y, dtype=np.float64))
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # 首尾兩點固定保留,其餘 n - 2 個點分為 n_out - 2 個區間
+    every = (n - 2) / (n_out - 2)
+    edges = (np.arange(n_out - 1) * every).astype(np.int64) + 1
+    edges[-1] = n - 1
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo = hi
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = (next_lo + next_hi - 1) / 2
+        avg_y = y[next_lo:next_hi].mean()
+        # 與上一個選中點、下一區間平均點組成的三角形面積 (省略常數 1/2)
+        xs = np.arange(lo, hi)
+        area = np.abs((a - avg_x) * (y[lo:hi] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """
+    最小/最大值區間降採樣
+
+    Args:
+        y: 一維數值數組 (可含 NaN)
+        n_out: 保留的點數上限
+
+    Returns:
+        保留點的索引數組 (遞增,包含首尾兩點)
+    """
+    np = _numpy()
+    y = _fill_missing(np.asarray(y, dtype=np.float64))
+    n = len(y)
+    buckets = (n_out - 2) // 2
+    if n_out >= n or buckets < 1:
+        return np.arange(n)
+
+    # 補齊為等長區間後一次性求每個區間的最小與最大值位置
+    size = math.ceil(n / buckets)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    rows = padded.reshape(buckets, size)
+    filled = np.where(np.isnan(rows), np.inf, rows)
+    mins = filled.argmin(axis=1)
+    maxs = np.where(np.isnan(rows), -np.inf, rows).argmax(axis=1)
+    offsets = np.arange(buckets) * size
+    indices = np.concatenate(([0, n - 1], offsets + mins, offsets + maxs))
+    return np.unique(indices[indices < n])
+
+
+ALGORITHMS = {
+    'lttb': lttb_indices,
+    'minmax': minmax_indices,
+}
+
+
+def max_points(ppt_config, width=None):
+    """
+    按圖表實際寬度與 CHART_MAX_POINTS 計算保留的點數上限
+
+    Args:
+        ppt_config: PPT 配置對象
+        width: 圖表的擺放寬度 (EMU),如使用者模板佔位符的寬度;默認為配置中的圖表寬度
+
+    Returns:
+        點數上限
+    """
+    if width is None:
+        width = ppt_config.geometry.chart.width
+    width_inches = width / 914400
+    limit = math.ceil(width_inches * ppt_config.CHART_POINTS_PER_INCH)
+    if ppt_config.CHART_MAX_POINTS is not None:
+        limit = min(limit, ppt_config.CHART_MAX_POINTS)
+    return limit
+
+
+def downsample_chart(categories, series_list, limit, algorithm='lttb'):
+    """
+    對圖表的全部序列降採樣
+
+    Args:
+        categories: 分類列表
+        series_list: 序列字典列表 ({'name', 'values', ...})
+        limit: 保留點數上限
+        algorithm: 'lttb' 或 'minmax'
+
+    Returns:
+        (分類, 序列列表, 保留的點數);點數未超過上限時原樣返回,保留點數為 None
+    """
+    np = _numpy()
+    n = len(categories)
+    if n <= limit or not series_list:
+        return categories, series_list, None
+
+    select = ALGORITHMS[algorithm]
+    per_series = max(3, limit // len(series_list))
+    indices = np.unique(np.concatenate([
+        select(np.asarray(series.get('values', []), dtype=np.float64), per_series)
+        for series in series_list
+    ])).tolist()
+
+    categories = [categories[i] for i in indices]
+    resampled = []
+    for series in series_list:
+        values = series.get('values', [])
+        resampled.append({**series, 'values': [values[i] for i in indices]})
+    return categories, resampled, len(indices)
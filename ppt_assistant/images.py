@@ -0,0 +1,335 @@
+"""
+圖片預處理與媒體快取
+
+嵌入前將圖片重採樣到實際擺放尺寸所需的解析度 (IMAGE_TARGET_DPI),
+並可選擇重新壓縮 (JPEG 品質 / PNG 優化)。
+
+處理結果有兩層快取:
+- 進程內 LRU 快取 (MEDIA_CACHE): 以文件路徑、修改時間、大小與目標尺寸為鍵,
+  保存處理後的 bytes 與圖片元數據。批量生成時重複使用的圖片 (如標誌)
+  只需 stat 一次,無需再讀取或解碼文件。
+- 磁碟快取 (IMAGE_CACHE_DIR): 以圖片內容雜湊加目標尺寸為鍵,跨進程共享,
+  總大小超過 IMAGE_CACHE_MAX_BYTES 時刪除最久未使用的文件。
+  內容雜湊經由 stat 索引 (路徑、修改時間、大小 -> 雜湊) 取得,文件未變時
+  命中只需一次 stat 與讀取快取文件,不再讀取並雜湊整個原圖。
+"""
+
+import hashlib
+import io
+import math
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+
+# 重新編碼時保留原格式;其餘格式 (BMP、TIFF 等) 統一轉為 PNG
+_KEEP_FORMATS = {'JPEG': '.jpg', 'PNG': '.png'}
+
+# EXIF 方向標籤;相機照片常以此標記旋轉,PowerPoint 不會套用
+_EXIF_ORIENTATION = 0x0112
+
+# 磁碟快取格式版本,處理方式改變時遞增以避免使用舊結果
+_DISK_CACHE_VERSION = 3
+
+# 快取項: 要嵌入的 bytes 及其像素尺寸、DPI 與格式
+MediaEntry = namedtuple('MediaEntry', ['data', 'width', 'height', 'dpi', 'format'])
+
+
+class MediaCache:
+    """進程內的 LRU 媒體快取,按 bytes 總量限制大小"""
+
+    def __init__(self, max_bytes):
+        """
+        Args:
+            max_bytes: 快取 bytes 總量上限, 0 表示停用
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """查找快取項,命中時將其移到最近使用的位置"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry):
+        """加入快取項,必要時淘汰最久未使用的項目"""
+        size = len(entry.data)
+        with self._lock:
+            if size > self.max_bytes:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old.data)
+            self._entries[key] = entry
+            self.current_bytes += size
+            self._evict()
+
+    def resize(self, max_bytes):
+        """調整大小上限"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self):
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, old = self._entries.popitem(last=False)
+            self.current_bytes -= len(old.data)
+            self.evictions += 1
+
+    def clear(self):
+        """清空快取並重置計數器"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """返回命中/未命中等統計,用於評估快取大小"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+
+MEDIA_CACHE = MediaCache(256 * 1024 * 1024)
+
+# stat 索引: (絕對路徑, 修改時間, 大小) -> 內容 SHA-256;磁碟上另存為 .idx 文件供其他進程使用
+_DIGESTS = {}
+_DIGESTS_MAX = 4096
+
+
+def _file_digest(image_path):
+    """計算圖片文件內容的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(image_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _encoding(ppt_config):
+    """
+    影響編碼結果的配置 (快取鍵的一部分)
+
+    縮小或轉正時 JPEG 總以 IMAGE_JPEG_QUALITY 編碼;IMAGE_RECOMPRESS 另決定
+    PNG 是否優化,以及無需縮小的圖片是否重新編碼。
+    """
+    return ppt_config.IMAGE_JPEG_QUALITY, ppt_config.IMAGE_RECOMPRESS
+
+
+def _write_atomic(path, data):
+    """先寫入臨時文件再改名,其他進程不會讀到寫了一半的文件"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _indexed_digest(image_path, stat, cache_dir):
+    """
+    經由 stat 索引取得圖片內容的 SHA-256,只在文件首次出現或已修改時讀取並雜湊原圖
+
+    Args:
+        image_path: 原始圖片路徑
+        stat: 圖片文件的 os.stat 結果
+        cache_dir: 磁碟快取目錄
+
+    Returns:
+        十六進位 SHA-256
+    """
+    key = (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+    digest = _DIGESTS.get(key)
+    if digest is not None:
+        return digest
+    name = hashlib.sha1('\0'.join(map(str, key)).encode('utf-8')).hexdigest()
+    index_path = os.path.join(cache_dir, f"{name}_v{_DISK_CACHE_VERSION}.idx")
+    try:
+        with open(index_path, 'rb') as f:
+            digest = f.read().decode('ascii')
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    if digest is None or len(digest) != 64:
+        digest = _file_digest(image_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_atomic(index_path, digest.encode('ascii'))
+    if len(_DIGESTS) >= _DIGESTS_MAX:
+        _DIGESTS.clear()
+    _DIGESTS[key] = digest
+    return digest
+
+
+def _read_bytes(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _entry(data, img):
+    """由 bytes 與 (已打開的) 圖片構建快取項"""
+    return MediaEntry(data, img.width, img.height, img.info.get('dpi', (72, 72)), img.format)
+
+
+def _entry_from_bytes(data):
+    """讀取圖片文件頭以取得元數據 (不解碼像素)"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as img:
+        return _entry(data, img)
+
+
+def _encode(img, fmt, ppt_config, icc_profile=None):
+    """按配置將圖片編碼為 bytes (保留原圖的 ICC 色彩描述檔)"""
+    buf = io.BytesIO()
+    options = {'icc_profile': icc_profile} if icc_profile else {}
+    if fmt == 'JPEG':
+        if img.mode not in ('RGB', 'L', 'CMYK'):
+            img = img.convert('RGB')
+        img.save(buf, 'JPEG', quality=ppt_config.IMAGE_JPEG_QUALITY, optimize=True, **options)
+    else:
+        img.save(buf, 'PNG', optimize=ppt_config.IMAGE_RECOMPRESS, **options)
+    return buf.getvalue()
+
+
+def _process(image_path, target_px, ppt_config):
+    """
+    按 EXIF 方向轉正後,按目標寬度重採樣並重新編碼
+
+    Returns:
+        (MediaEntry, 副檔名);圖片無需處理時返回 (原圖的 MediaEntry, None)
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(image_path) as img:
+        fmt = img.format if img.format in _KEEP_FORMATS else 'PNG'
+        icc_profile = img.info.get('icc_profile')
+        rotated = img.getexif().get(_EXIF_ORIENTATION, 1) != 1
+        if rotated:
+            # 轉正後寬高可能互換,目標寬度以轉正後的圖片計算
+            img = ImageOps.exif_transpose(img)
+        needs_resize = img.width > target_px
+        if not (needs_resize or rotated) and not ppt_config.IMAGE_RECOMPRESS:
+            return _entry(_read_bytes(image_path), img), None
+
+        if needs_resize:
+            target_height = max(1, round(img.height * target_px / img.width))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            img = img.resize((target_px, target_height), Image.LANCZOS)
+        else:
+            img.load()
+        data = _encode(img, fmt, ppt_config, icc_profile)
+
+    # 僅重新壓縮卻沒有變小時,保留原圖
+    if not (needs_resize or rotated) and len(data) >= os.path.getsize(image_path):
+        return _entry_from_bytes(_read_bytes(image_path)), None
+    return _entry_from_bytes(data), _KEEP_FORMATS[fmt]
+
+
+def _prune_disk_cache(cache_dir, max_bytes):
+    """磁碟快取超過上限時,按最後使用時間刪除最舊的文件"""
+    files = []
+    total = 0
+    with os.scandir(cache_dir) as it:
+        for item in it:
+            if item.is_file() and not item.name.endswith('.tmp'):
+                stat = item.stat()
+                files.append((stat.st_mtime_ns, stat.st_size, item.path))
+                total += stat.st_size
+    files.sort()
+    for _, size, path in files:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def _load_from_disk(image_path, stat, target_px, ppt_config):
+    """經由磁碟快取取得處理結果"""
+    cache_dir = ppt_config.IMAGE_CACHE_DIR
+    quality, recompress = _encoding(ppt_config)
+    digest = _indexed_digest(image_path, stat, cache_dir)
+    stem = os.path.join(cache_dir, f"{digest}_{target_px}_{quality}{'r' if recompress else ''}_v{_DISK_CACHE_VERSION}")
+    for ext in ('.jpg', '.png', '.orig'):
+        path = stem + ext
+        if os.path.exists(path):
+            os.utime(path)  # 標記為最近使用
+            source = image_path if ext == '.orig' else path
+            return _entry_from_bytes(_read_bytes(source))
+
+    entry, ext = _process(image_path, target_px, ppt_config)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    if ext is None:
+        # 記錄「無需處理」,下次直接使用原圖
+        open(stem + '.orig', 'wb').close()
+    else:
+        _write_atomic(stem + ext, entry.data)
+        _prune_disk_cache(cache_dir, ppt_config.IMAGE_CACHE_MAX_BYTES)
+    return entry
+
+
+def load_image(image_path, width_inches, ppt_config):
+    """
+    取得按擺放寬度處理後的圖片 (經由媒體快取)
+
+    Args:
+        image_path: 原始圖片路徑
+        width_inches: 圖片在投影片上的實際寬度 (英寸)
+        ppt_config: PPT 配置對象
+
+    Returns:
+        MediaEntry
+    """
+    target_px = math.ceil(width_inches * ppt_config.IMAGE_TARGET_DPI)
+    stat = os.stat(image_path)
+    key = (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size, target_px, *_encoding(ppt_config))
+
+    if MEDIA_CACHE.max_bytes != ppt_config.MEDIA_CACHE_MAX_BYTES:
+        MEDIA_CACHE.resize(ppt_config.MEDIA_CACHE_MAX_BYTES)
+    entry = MEDIA_CACHE.get(key)
+    if entry is not None:
+        return entry
+
+    if ppt_config.IMAGE_CACHE_DIR:
+        entry = _load_from_disk(image_path, stat, target_px, ppt_config)
+    else:
+        entry, _ = _process(image_path, target_px, ppt_config)
+    MEDIA_CACHE.put(key, entry)
+    return entry
+
+
+def prepare_image(image_path, width_inches, ppt_config):
+    """
+    按擺放寬度準備要嵌入的圖片
+
+    Args:
+        image_path: 原始圖片路徑
+        width_inches: 圖片在投影片上的實際寬度 (英寸)
+        ppt_config: PPT 配置對象
+
+    Returns:
+        可直接傳給 add_picture 的路徑或 BytesIO
+    """
+    if not ppt_config.IMAGE_PREPROCESS:
+        return image_path
+    return io.BytesIO(load_image(image_path, width_inches, ppt_config).data)
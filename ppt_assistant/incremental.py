@@ -0,0 +1,168 @@
+"""
+增量重建
+
+為每張投影片的配置 (連同生效的 PPTConfig、模板與引用的文件) 計算雜湊,
+並在輸出文件旁保存側車清單 (<output>.manifest.json)。下次生成時,
+雜湊未變的投影片直接從上一版 .pptx 複製,只重新渲染有變化的投影片。
+"""
+
+import hashlib
+import json
+import os
+
+from .merge import SlideMerger, export_slide
+
+SIDECAR_SUFFIX = '.manifest.json'
+SIDECAR_VERSION = 1
+
+
+def sidecar_path(output_path):
+    """返回輸出文件對應的側車清單路徑"""
+    return output_path + SIDECAR_SUFFIX
+
+
+def _file_stamp(path):
+    """文件的修改時間與大小;文件不存在時返回 None"""
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def config_fingerprint(ppt_config, template_path):
+    """
+    計算生效配置的指紋
+
+    Args:
+        ppt_config: PPT 配置對象
+        template_path: 模板路徑 (None 表示內建模板)
+
+    Returns:
+        十六進位雜湊字串
+    """
+    values = {name: getattr(ppt_config, name) for name in dir(ppt_config) if name.isupper()}
+    payload = {
+        'config': values,
+        'template': template_path,
+        'template_stamp': _file_stamp(template_path),
+        # 文字適配的度量結果取決於字體文件
+        'font_stamps': [_file_stamp(ppt_config.TEXT_FONT_FILE), _file_stamp(ppt_config.TEXT_EA_FONT_FILE)],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=repr).encode('utf-8')).hexdigest()
+
+
+def _dependencies(slide_data):
+    """投影片引用的外部文件 (內容變化時須重新渲染)"""
+    content = slide_data.get('content') or {}
+    layout = slide_data.get('layout')
+    if layout == 'image' and content.get('image'):
+        return [content['image']]
+    if layout == 'chart':
+        source = (content.get('chart') or {}).get('data', {}).get('source')
+    elif layout == 'table':
+        source = (content.get('table') or {}).get('source')
+    else:
+        source = None
+    return [source] if isinstance(source, str) else []
+
+
+def _json_default(value):
+    """序列化 JSON 無法表示的值 (如經 Python API 傳入的 NumPy 數組)"""
+    if hasattr(value, 'tobytes') and hasattr(value, 'dtype'):
+        return [str(value.dtype), list(value.shape), hashlib.sha256(value.tobytes()).hexdigest()]
+    return repr(value)
+
+
+def slide_hash(slide_data, fingerprint):
+    """
+    計算單張投影片的雜湊
+
+    Args:
+        slide_data: 投影片配置字典
+        fingerprint: config_fingerprint 的結果
+
+    Returns:
+        十六進位雜湊字串
+    """
+    payload = {
+        'slide': slide_data,
+        'config': fingerprint,
+        'files': [[path, _file_stamp(path)] for path in _dependencies(slide_data)],
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False, default=_json_default).encode('utf-8')
+    ).hexdigest()
+
+
+def _load_previous(output_path):
+    """
+    載入上一版輸出與側車清單
+
+    Returns:
+        (上一版 Presentation, {雜湊: (起始投影片序號, 投影片數)});沒有可用的上一版時返回 (None, {})
+    """
+    manifest_path = sidecar_path(output_path)
+    if not (os.path.exists(output_path) and os.path.exists(manifest_path)):
+        return None, {}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None, {}
+    if manifest.get('version') != SIDECAR_VERSION:
+        return None, {}
+
+    from pptx import Presentation
+    prs = Presentation(output_path)
+
+    index = {}
+    start = 0
+    for entry in manifest.get('slides', []):
+        index.setdefault(entry['hash'], (start, entry['count']))
+        start += entry['count']
+    if start != len(prs.slides):
+        # 清單與文件不一致 (例如文件被手動修改),放棄重用
+        return None, {}
+    return prs, index
+
+
+def render_incremental(assistant):
+    """
+    增量渲染: 重用上一版中未變化的投影片
+
+    Args:
+        assistant: PPTAssistant 實例 (output_path 需已確定)
+
+    Returns:
+        側車清單的投影片項目列表,保存簡報後傳給 save_sidecar
+    """
+    previous, index = _load_previous(assistant.output_path)
+    previous_slides = list(previous.slides) if previous is not None else []
+    fingerprint = config_fingerprint(assistant.ppt_config, assistant.template_path)
+    merger = SlideMerger(assistant.prs, assistant._slides, assistant._partnames, assistant.part_store)
+
+    entries = []
+    reused = rebuilt = 0
+    for slide_data in assistant.slides_data:
+        digest = slide_hash(slide_data, fingerprint)
+        before = assistant._slides.count
+        if digest in index:
+            start, count = index[digest]
+            for slide in previous_slides[start:start + count]:
+                merger.append(export_slide(slide))
+            reused += 1
+        else:
+            assistant._render_slide(slide_data)
+            rebuilt += 1
+        entries.append({'hash': digest, 'count': assistant._slides.count - before})
+
+    assistant.summary['slides_reused'] = reused
+    assistant.summary['slides_rebuilt'] = rebuilt
+    return entries
+
+
+def save_sidecar(output_path, entries):
+    """寫入側車清單"""
+    with open(sidecar_path(output_path), 'w', encoding='utf-8') as f:
+        json.dump({'version': SIDECAR_VERSION, 'slides': entries}, f)
@@ -0,0 +1,226 @@
+"""
+佈局註冊表
+
+將佈局名稱 (JSON 中的 layout) 映射到渲染器對象,以字典查找分派,
+並記錄每種佈局的調用次數與累計耗時。第三方可註冊自訂佈局:
+
+    from ppt_assistant.layouts import LayoutRenderer, register_layout
+
+    @register_layout('quote')
+    class QuoteRenderer(LayoutRenderer):
+        uses = ('title_box',)
+        schema = {'title': 'text', 'quote': 'paragraphs'}
+
+        def render(self, assistant, content):
+            slide = assistant.add_slide()
+            assistant.add_title_box(slide, content.get('title', ''))
+            ...
+
+渲染器以 uses 聲明使用的共享部件 (如預先構建的標題文字框原型),
+共享部件在每份簡報中只構建一次,之後複製使用;以 schema 聲明 content
+各欄位的類型,渲染前由 validation 模組統一檢查。
+"""
+
+import copy
+import threading
+import time
+
+
+def _title_box_prototype(ppt_config):
+    """頁面標題文字框原型: 位置、字號、粗體與對齊已設置,文字為空"""
+    from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT
+    from pptx.oxml.shapes.autoshape import CT_Shape
+    from pptx.text.text import TextFrame
+    from pptx.util import Pt
+
+    sp = CT_Shape.new_textbox_sp(0, '', *ppt_config.geometry.slide_title)
+    p = TextFrame(sp.get_or_add_txBody(), None).paragraphs[0]
+    p.font.size = Pt(ppt_config.SLIDE_TITLE_FONT_SIZE)
+    p.font.bold = True
+    p.alignment = PP_PARAGRAPH_ALIGNMENT.LEFT
+    return sp
+
+
+# 共享部件名稱 → 構建函數 (參數為 PPT 配置對象)
+SHARED_PARTS = {
+    'title_box': _title_box_prototype,
+}
+
+
+class SharedParts:
+    """一份簡報的共享部件,首次使用時構建"""
+
+    def __init__(self, ppt_config):
+        self._ppt_config = ppt_config
+        self._parts = {}
+
+    def get(self, name):
+        """返回共享部件 (呼叫方須複製後再使用)"""
+        part = self._parts.get(name)
+        if part is None:
+            part = self._parts[name] = SHARED_PARTS[name](self._ppt_config)
+        return part
+
+    def prepare(self, names):
+        """預先構建渲染器聲明的共享部件"""
+        for name in names:
+            self.get(name)
+
+    def clone(self, name):
+        """返回共享部件的副本"""
+        return copy.deepcopy(self.get(name))
+
+
+class LayoutRenderer:
+    """
+    佈局渲染器基類
+
+    子類實作 render(assistant, content),可使用 assistant.add_slide()、
+    assistant.add_title_box() 與 assistant.ppt_config 等。
+    """
+
+    # 使用的共享部件名稱 (見 SHARED_PARTS)
+    uses = ()
+
+    # content 欄位名稱 → 類型 (見 validation.FIELD_TYPES);None 表示不檢查欄位
+    schema = None
+
+    def render(self, assistant, content):
+        """
+        渲染一個佈局 (可產生多張投影片)
+
+        Args:
+            assistant: PPTAssistant 實例
+            content: 投影片配置中的 content 字典
+        """
+        raise NotImplementedError
+
+
+class _MethodRenderer(LayoutRenderer):
+    """內建佈局: 委派給 PPTAssistant 的 _add_*_slide 方法"""
+
+    def __init__(self, method, uses=('title_box',), schema=None):
+        self.method = method
+        self.uses = uses
+        self.schema = schema
+
+    def render(self, assistant, content):
+        getattr(assistant, self.method)(content)
+
+
+class LayoutRegistry:
+    """佈局名稱到渲染器的註冊表,並記錄每種佈局的調用次數與累計耗時"""
+
+    def __init__(self):
+        self._renderers = {}
+        self._lock = threading.Lock()
+        self._stats = {}
+        # 每次註冊或移除佈局時遞增 (驗證器據此重新編譯)
+        self.version = 0
+
+    def register(self, name, renderer, replace=False):
+        """
+        註冊佈局
+
+        Args:
+            name: 佈局名稱 (JSON 中的 layout)
+            renderer: LayoutRenderer 實例
+            replace: 是否允許覆蓋已註冊的佈局
+
+        Raises:
+            ValueError: 名稱已註冊或渲染器聲明了未知的共享部件
+        """
+        if name in self._renderers and not replace:
+            raise ValueError(f"佈局 '{name}' 已註冊")
+        unknown = [part for part in renderer.uses if part not in SHARED_PARTS]
+        if unknown:
+            raise ValueError(f"佈局 '{name}' 使用了未知的共享部件: {', '.join(unknown)}")
+        self._renderers[name] = renderer
+        self.version += 1
+
+    def unregister(self, name):
+        """移除佈局"""
+        if self._renderers.pop(name, None) is not None:
+            self.version += 1
+
+    def get(self, name):
+        """返回渲染器,未註冊時返回 None"""
+        return self._renderers.get(name)
+
+    def names(self):
+        """已註冊的佈局名稱"""
+        return list(self._renderers)
+
+    def __contains__(self, name):
+        return name in self._renderers
+
+    def render(self, assistant, name, content):
+        """
+        以註冊的渲染器渲染佈局並記錄耗時
+
+        Returns:
+            佈局已註冊時返回 True,否則返回 False
+        """
+        renderer = self._renderers.get(name)
+        if renderer is None:
+            return False
+        assistant.shared_parts.prepare(renderer.uses)
+        start = time.perf_counter()
+        try:
+            renderer.render(assistant, content)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stat = self._stats.get(name)
+                if stat is None:
+                    stat = self._stats[name] = [0, 0.0]
+                stat[0] += 1
+                stat[1] += elapsed
+        return True
+
+    def stats(self):
+        """返回每種佈局的調用次數、累計與平均耗時 (秒),按累計耗時排序"""
+        with self._lock:
+            items = [(name, calls, seconds) for name, (calls, seconds) in self._stats.items()]
+        items.sort(key=lambda item: item[2], reverse=True)
+        return {
+            name: {'calls': calls, 'seconds': seconds, 'mean': seconds / calls}
+            for name, calls, seconds in items
+        }
+
+    def reset_stats(self):
+        """清空統計"""
+        with self._lock:
+            self._stats.clear()
+
+
+LAYOUTS = LayoutRegistry()
+LAYOUTS.register('title', _MethodRenderer('_add_title_slide', uses=(),
+                                          schema={'title': 'text', 'subtitle': 'text'}))
+LAYOUTS.register('content', _MethodRenderer('_add_content_slide',
+                                            schema={'title': 'text', 'body': 'paragraphs'}))
+LAYOUTS.register('two_column', _MethodRenderer('_add_two_column_slide',
+                                               schema={'title': 'text', 'left': 'scalar', 'right': 'scalar'}))
+LAYOUTS.register('image', _MethodRenderer('_add_image_slide',
+                                          schema={'title': 'text', 'image': 'image', 'caption': 'text'}))
+LAYOUTS.register('table', _MethodRenderer('_add_table_slide', schema={'title': 'text', 'table': 'table'}))
+LAYOUTS.register('chart', _MethodRenderer('_add_chart_slide', schema={'title': 'text', 'chart': 'chart'}))
+
+
+def register_layout(name, renderer=None, replace=False):
+    """
+    在預設註冊表中註冊佈局,也可作為類裝飾器使用
+
+    Args:
+        name: 佈局名稱
+        renderer: LayoutRenderer 實例;省略時返回裝飾器,以被裝飾的類創建實例
+        replace: 是否允許覆蓋已註冊的佈局
+    """
+    if renderer is not None:
+        LAYOUTS.register(name, renderer, replace)
+        return renderer
+
+    def decorator(cls):
+        LAYOUTS.register(name, cls(), replace)
+        return cls
+    return decorator
@@ -0,0 +1,159 @@
+"""
+串流讀取簡報配置
+
+大型配置 (巨大的 table.rows 或 chart series.values) 不必一次載入記憶體:
+SlideStream 逐張投影片解析並產出字典,生成完畢即可釋放,
+記憶體峰值只取決於最大的單張投影片。
+
+支援兩種格式:
+- .json: 一般配置文件,以增量解析器讀取 "slides" 陣列中的元素
+- .jsonl: JSON Lines,每行一張投影片;第一行若沒有 "layout" 鍵則視為
+  頂層設定 (如 {"output": "out.pptx"})
+"""
+
+import json
+
+CHUNK_SIZE = 1 << 20  # 每次讀取 1 MB
+
+
+class _Scanner:
+    """在分塊讀入的文字緩衝區上逐個解析 JSON 值"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, min_size=0):
+        """讀入更多數據,丟棄已解析的部分;已到文件結尾時返回 False"""
+        if self._eof:
+            return False
+        chunk = self._f.read(max(self._chunk_size, min_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """跳過空白並返回下一個字元 (文件結尾時返回空字串)"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        """消耗指定字元,否則拋出 ValueError"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"JSON 格式錯誤: 預期 '{char}',但讀到 '{found or 'EOF'}'")
+        self._pos += 1
+
+    def value(self):
+        """解析下一個完整的 JSON 值"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # 值被分塊截斷: 至少讀入與當前緩衝區等量的數據後重試,
+                # 使超大單值的總解析成本保持線性
+                if not self._fill(len(self._buf)):
+                    raise
+                continue
+            # 位於緩衝區末端的數字或字面量可能尚未讀完
+            if end == len(self._buf) and not isinstance(obj, (dict, list, str)):
+                if self._fill():
+                    continue
+            self._pos = end
+            return obj
+
+
+def _iter_json(f, header, chunk_size=CHUNK_SIZE, header_only=False):
+    """增量解析頂層物件,頂層設定寫入 header,逐個產出 slides 中的元素"""
+    scanner = _Scanner(f, chunk_size)
+    scanner.expect('{')
+    if scanner.peek() == '}':
+        return
+    while True:
+        key = scanner.value()
+        scanner.expect(':')
+        if key == 'slides':
+            if header_only:
+                return
+            scanner.expect('[')
+            if scanner.peek() == ']':
+                scanner.expect(']')
+            else:
+                while True:
+                    yield scanner.value()
+                    if scanner.peek() == ',':
+                        scanner.expect(',')
+                    else:
+                        scanner.expect(']')
+                        break
+        else:
+            header[key] = scanner.value()
+        if scanner.peek() == ',':
+            scanner.expect(',')
+        else:
+            scanner.expect('}')
+            return
+
+
+def _iter_jsonl(f, header):
+    """逐行解析 JSON Lines,首行的頂層設定寫入 header"""
+    first = True
+    for line_no, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON Lines 第 {line_no} 行格式錯誤: {e}") from e
+        if first and 'layout' not in obj:
+            header.update(obj)
+        else:
+            yield obj
+        first = False
+
+
+class SlideStream:
+    """
+    可重複迭代的投影片串流
+
+    header 保存頂層設定 (output、template 等)。位於 "slides" 之前的設定
+    在構造時即可取得;位於其後的設定在迭代完成後才會出現在 header 中。
+    """
+
+    def __init__(self, path, chunk_size=CHUNK_SIZE):
+        """
+        Args:
+            path: .json 或 .jsonl 配置文件路徑
+            chunk_size: 每次讀取的字元數
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.is_jsonl = path.lower().endswith('.jsonl')
+        self.header = {}
+        # 預先讀取 slides 之前的頂層設定
+        for _ in self._iter(self.header, header_only=True):
+            break
+
+    def _iter(self, header, header_only=False):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            if self.is_jsonl:
+                yield from _iter_jsonl(f, header)
+            else:
+                yield from _iter_json(f, header, self.chunk_size, header_only)
+
+    def __iter__(self):
+        return self._iter(self.header)
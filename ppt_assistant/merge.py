@@ -0,0 +1,215 @@
+"""
+並行渲染與合併
+
+將投影片切分為多個區塊,分派到工作進程各自渲染,每張投影片導出為
+獨立的記錄 (投影片 XML 連同圖片、圖表與內嵌工作簿等部件),
+再按配置順序追加到最終簡報中,重新編號部件名稱與關係 ID。
+合併結果與依序渲染的內容完全相同。
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory, XmlPart
+from pptx.oxml import parse_xml
+
+from .batch import _init_worker
+from .parts import PartStore, shareable
+from .slides import PartNamer, SlideAppender
+
+_R_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+
+def _remap_rids(element, rid_map):
+    """將 XML 中 r:id、r:embed 等屬性引用的關係 ID 改為新值"""
+    if all(old == new for old, new in rid_map.items()):
+        return
+    for el in element.iter():
+        for attr, value in el.attrib.items():
+            if attr.startswith(_R_NS) and value in rid_map:
+                el.set(attr, rid_map[value])
+
+
+def _export_rels(part, parts):
+    """導出部件的關係,並把目標部件 (遞歸) 加入 parts"""
+    rels = []
+    for rId, rel in part.rels.items():
+        if rel.is_external:
+            rels.append((rId, rel.reltype, True, rel.target_ref))
+        elif rel.reltype == RT.NOTES_SLIDE:
+            continue  # 渲染器不生成備註頁
+        else:
+            target = rel.target_part
+            key = str(target.partname)
+            if rel.reltype != RT.SLIDE_LAYOUT and key not in parts:
+                parts[key] = None  # 先佔位,避免循環引用
+                parts[key] = (key, target.content_type, target.blob, _export_rels(target, parts))
+            rels.append((rId, rel.reltype, False, key))
+    return rels
+
+
+def export_slide(slide):
+    """
+    將投影片導出為獨立的可序列化記錄
+
+    記錄包含投影片 XML、版面配置的部件名稱,以及它引用的全部部件
+    (圖片、圖表、內嵌工作簿等) 的內容與關係,可跨進程傳遞。
+
+    Args:
+        slide: 來源投影片
+
+    Returns:
+        投影片記錄字典
+    """
+    parts = {}
+    rels = _export_rels(slide.part, parts)
+    return {
+        'layout': str(slide.slide_layout.part.partname),
+        'xml': slide.part.blob,
+        'rels': rels,
+        'parts': parts,
+    }
+
+
+class SlideMerger:
+    """將導出的投影片記錄依序追加到目標簡報"""
+
+    def __init__(self, prs, appender=None, namer=None, store=None):
+        """
+        Args:
+            prs: 目標 Presentation (與來源簡報使用相同模板)
+            appender: 目標簡報共用的 SlideAppender,默認新建
+            namer: 目標簡報共用的 PartNamer,默認新建
+            store: 目標簡報共用的 PartStore,默認新建
+        """
+        self.prs = prs
+        self._appender = appender or SlideAppender(prs)
+        self._package = prs.part.package
+        self._namer = namer or PartNamer(self._package)
+        self._store = store or PartStore(self._package, self._namer)
+        self._layouts = {
+            str(layout.part.partname): layout
+            for master in prs.slide_masters
+            for layout in master.slide_layouts
+        }
+
+    def _relate(self, part, rels, parts, imported):
+        """按記錄建立關係,返回舊→新關係 ID 對照"""
+        rid_map = {}
+        for rId, reltype, is_external, target in rels:
+            if is_external:
+                rid_map[rId] = part.relate_to(target, reltype, is_external=True)
+            elif reltype == RT.SLIDE_LAYOUT:
+                rid_map[rId] = part.relate_to(self._layouts[target].part, reltype)
+            else:
+                rid_map[rId] = part.relate_to(self._import_part(target, parts, imported), reltype)
+        return rid_map
+
+    def _import_part(self, key, parts, imported):
+        """在目標套件中創建部件 (連同其關聯部件),分配新的部件名稱"""
+        if key in imported:
+            return imported[key]
+        partname, content_type, blob, rels = parts[key]
+        if shareable(content_type) and not rels:
+            # 圖片、內嵌工作簿等按內容共用,與依序渲染的行為一致
+            part = self._store.get_or_add(partname, content_type, blob)
+        else:
+            part = PartFactory(self._namer.next_partname(partname), content_type, self._package, blob)
+        imported[key] = part
+
+        rid_map = self._relate(part, rels, parts, imported)
+        if isinstance(part, XmlPart):
+            _remap_rids(part._element, rid_map)
+        return part
+
+    def append(self, record):
+        """
+        將一張投影片記錄追加到目標簡報末尾
+
+        Args:
+            record: export_slide 返回的記錄
+
+        Returns:
+            目標簡報中新建的投影片
+        """
+        layout = self._layouts[record['layout']]
+        slide_part = self._appender.append_part(layout, parse_xml(record['xml']))
+        self._namer.mark_used(slide_part.partname)
+
+        # 關係按來源順序建立: 版面配置已是 rId1,其餘部件依次編號
+        rels = [rel for rel in record['rels'] if rel[1] != RT.SLIDE_LAYOUT]
+        rid_map = self._relate(slide_part, rels, record['parts'], {})
+        rid_map.update((rel[0], 'rId1') for rel in record['rels'] if rel[1] == RT.SLIDE_LAYOUT)
+        _remap_rids(slide_part._element, rid_map)
+        return slide_part.slide
+
+    def append_all(self, records):
+        """依序追加多張投影片記錄"""
+        for record in records:
+            self.append(record)
+
+
+def _render_chunk(slides, ppt_config, template_path):
+    """工作進程: 渲染一個投影片區塊,返回 (投影片記錄列表, 生成統計)"""
+    from .core import PPTAssistant
+
+    assistant = PPTAssistant.from_slides(slides, ppt_config, template_path)
+    assistant.render_slides(slides)
+    return [export_slide(slide) for slide in assistant.prs.slides], assistant.summary
+
+
+def _merge_summary(target, source):
+    """將工作進程的生成統計累加到 target (數值相加,字典遞歸合併)"""
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _merge_summary(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+
+def _chunks(slides, size):
+    iterator = iter(slides)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def render_parallel(assistant, workers, chunk_size=None):
+    """
+    在工作進程中並行渲染投影片,並按順序合併到 assistant.prs
+
+    Args:
+        assistant: PPTAssistant 實例
+        workers: 工作進程數
+        chunk_size: 每個區塊的投影片數,默認依投影片數與進程數估算
+    """
+    slides = assistant.slides_data
+    if chunk_size is None:
+        try:
+            chunk_size = max(1, min(64, -(-len(slides) // (workers * 4))))
+        except TypeError:
+            chunk_size = 32
+
+    merger = SlideMerger(assistant.prs, assistant._slides, assistant._partnames, assistant.part_store)
+    pending = deque()
+
+    def merge_next():
+        records, summary = pending.popleft().result()
+        merger.append_all(records)
+        if assistant._writer is not None:
+            assistant._writer.flush()
+        _merge_summary(assistant.summary, summary)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        for chunk in _chunks(slides, chunk_size):
+            pending.append(executor.submit(
+                _render_chunk, chunk, assistant.ppt_config, assistant.template_path))
+            # 限制在途區塊數,串流讀取時記憶體保持有界
+            if len(pending) >= workers * 2:
+                merge_next()
+        while pending:
+            merge_next()
@@ -0,0 +1,140 @@
+"""
+內容定址的部件存儲
+
+同一份簡報中內容相同的二進位部件 (圖片、圖表內嵌工作簿、媒體) 只保存一份,
+之後的投影片或圖表經由關係引用同一部件,輸出更小、保存更快。
+部件以內容類型加 SHA1 為鍵,查找成本為 O(1)。圖片共用 python-pptx 本來就有
+(package.get_or_add_image_part,但每次都遍歷整個套件並重新計算全部圖片的 SHA1),
+因此只計入 images_shared;parts_shared 與 bytes_saved 只統計工作簿等新增的共用。
+
+圖表 XML 等 XML 部件不共用: 每個圖表框架須有自己的圖表部件。
+共用的內嵌工作簿在 PowerPoint 中「編輯數據」時會一併改變其他圖表的工作簿
+(不影響其顯示的數值),可以 DEDUP_WORKBOOKS 關閉。
+"""
+
+import hashlib
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory
+
+IMAGE_PARTNAME = '/ppt/media/image%d.'
+
+
+def shareable(content_type):
+    """是否為可共用的二進位部件 (非 XML)"""
+    return not (content_type.endswith('+xml') or content_type.endswith('/xml'))
+
+
+class PartStore:
+    """一份簡報的內容定址部件存儲,並統計共用的部件數與節省的位元組數"""
+
+    def __init__(self, package, namer, share_workbooks=True):
+        """
+        Args:
+            package: 目標簡報的套件
+            namer: 目標簡報共用的 PartNamer
+            share_workbooks: 數據相同的圖表是否共用內嵌工作簿
+        """
+        self._package = package
+        self._namer = namer
+        self.share_workbooks = share_workbooks
+        self._parts = {}  # (內容類型, SHA1) -> [部件, 大小]
+        self._keys = {}  # 部件名稱 -> 鍵
+        self.parts_shared = 0
+        self.bytes_saved = 0
+        self.images_shared = 0
+        # 模板自帶的圖片等部件同樣可被引用
+        for part in package.iter_parts():
+            if shareable(part.content_type):
+                self._register(self._key(part.content_type, part.blob), part, len(part.blob))
+
+    @staticmethod
+    def _key(content_type, blob):
+        return content_type, hashlib.sha1(blob).hexdigest()
+
+    def _register(self, key, part, size):
+        self._parts[key] = [part, size]
+        self._keys[str(part.partname)] = key
+
+    def get_or_add(self, partname, content_type, blob):
+        """
+        返回內容相同的已有部件,沒有時創建新部件
+
+        Args:
+            partname: 新部件的名稱模板 (如 /ppt/embeddings/Microsoft_Excel_Sheet%d.xlsx)
+                或同類部件的名稱
+            content_type: 內容類型
+            blob: 部件內容
+
+        Returns:
+            Part
+        """
+        part_name = self._namer.next_partname
+        if content_type == CT.SML_SHEET and not self.share_workbooks:
+            return PartFactory(part_name(partname), content_type, self._package, blob)
+        key = self._key(content_type, blob)
+        entry = self._parts.get(key)
+        if entry is not None:
+            if content_type.startswith('image/'):
+                self.images_shared += 1
+            else:
+                self.parts_shared += 1
+                self.bytes_saved += entry[1]
+            return entry[0]
+        part = PartFactory(part_name(partname), content_type, self._package, blob)
+        self._register(key, part, len(blob))
+        return part
+
+    def image_part(self, blob):
+        """
+        返回內容相同的圖片部件,沒有時創建 (部件名稱與 python-pptx 相同為 image<N>.<副檔名>)
+
+        Args:
+            blob: 圖片 bytes
+
+        Returns:
+            ImagePart
+        """
+        from pptx.parts.image import Image
+
+        image = Image.from_blob(blob)
+        return self.get_or_add(IMAGE_PARTNAME + image.ext, image.content_type, blob)
+
+    def replace(self, part, stub):
+        """以已寫出部件的存根取代存儲中的部件 (串流輸出釋放內容後調用)"""
+        key = self._keys.get(str(part.partname))
+        if key is not None and self._parts[key][0] is part:
+            self._parts[key][0] = stub
+
+    def summary(self):
+        """共用統計: 工作簿等部件的共用次數與節省的位元組數,以及重複圖片數"""
+        return {'parts_shared': self.parts_shared, 'bytes_saved': self.bytes_saved,
+                'images_shared': self.images_shared}
+
+
+def add_picture(slide, image_file, left, top, width, store):
+    """
+    添加圖片 (與 SlideShapes.add_picture 指定寬度時相同),圖片部件經由 store 共用
+
+    Args:
+        slide: 目標投影片
+        image_file: 圖片路徑或二進位流
+        left, top, width: 位置與寬度 (EMU),高度按圖片比例計算
+        store: 簡報的 PartStore
+
+    Returns:
+        Picture
+    """
+    if hasattr(image_file, 'read'):
+        image_file.seek(0)
+        blob = image_file.read()
+    else:
+        with open(image_file, 'rb') as f:
+            blob = f.read()
+    image_part = store.image_part(blob)
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+    shapes = slide.shapes
+    pic = shapes._add_pic_from_image_part(image_part, rId, left, top, width, None)
+    shapes._recalculate_extents()
+    return shapes._shape_factory(pic)
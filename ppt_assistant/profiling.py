@@ -0,0 +1,230 @@
+"""
+性能剖析
+
+記錄生成過程各階段 (JSON 讀取、模板初始化、渲染、圖片嵌入、圖表工作簿、保存)
+與每張投影片的牆鐘時間、CPU 時間與峰值常駐記憶體 (RSS),輸出 JSON 報告;
+可選同時以 cProfile 記錄,導出的 .prof 文件可用 snakeviz、flameprof 等工具
+查看或轉換為火焰圖。
+
+未啟用剖析時使用 NULL_PROFILER,每個階段只多一次空的 with 語句。
+"""
+
+import cProfile
+import json
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss():
+    """進程至今的峰值常駐記憶體 (bytes);平台不支援時返回 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 為單位,macOS 以 bytes 為單位
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _NullPhase:
+    """空操作的階段"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class NullProfiler:
+    """停用時使用的剖析器: 所有記錄都是空操作"""
+
+    enabled = False
+
+    def phase(self, name, **meta):
+        return _NULL_PHASE
+
+    def slide(self, layout, index):
+        return _NULL_PHASE
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class _Phase:
+    """計時中的階段 (with 語句結束時記錄)"""
+
+    __slots__ = ('_profiler', '_kind', '_record', '_wall', '_cpu')
+
+    def __init__(self, profiler, kind, record):
+        self._profiler = profiler
+        self._kind = kind
+        self._record = record
+
+    def __enter__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        record = self._record
+        record['wall_seconds'] = time.perf_counter() - self._wall
+        record['cpu_seconds'] = time.process_time() - self._cpu
+        record['peak_rss_bytes'] = peak_rss()
+        self._profiler._add(self._kind, record)
+        return False
+
+
+class Profiler:
+    """
+    記錄各階段與每張投影片的耗時與記憶體
+
+    階段可以嵌套 (如 render 包含各投影片,投影片包含 image、chart_workbook),
+    報告中按名稱彙總;每張投影片單獨記錄。
+    """
+
+    enabled = True
+
+    def __init__(self, cprofile=False, hooks=()):
+        """
+        Args:
+            cprofile: 是否同時以 cProfile 記錄 (start 至 stop 之間)
+            hooks: 每記錄一個階段或投影片時調用的函數 hook(kind, record),
+                kind 為 'phase' 或 'slide'
+        """
+        self._hooks = list(hooks)
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self.phases = {}
+        self.slides = []
+        self._started = None
+        self._total = None
+
+    def add_hook(self, hook):
+        """添加記錄回調 hook(kind, record)"""
+        self._hooks.append(hook)
+
+    def start(self):
+        """開始計時 (啟用 cProfile 時同時開始記錄)"""
+        self._started = (time.perf_counter(), time.process_time())
+        self._total = None
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        return self
+
+    def stop(self):
+        """結束計時"""
+        if self._started is None:
+            return
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        wall, cpu = self._started
+        self._total = {
+            'wall_seconds': time.perf_counter() - wall,
+            'cpu_seconds': time.process_time() - cpu,
+            'peak_rss_bytes': peak_rss(),
+        }
+        self._started = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    def phase(self, name, **meta):
+        """
+        記錄一個階段
+
+        Args:
+            name: 階段名稱 (如 'load_json'、'template'、'render'、'save')
+            **meta: 附加到記錄中的資料 (如 mode='parallel')
+        """
+        return _Phase(self, 'phase', {'name': name, **meta})
+
+    def slide(self, layout, index):
+        """
+        記錄一張投影片的渲染
+
+        Args:
+            layout: 佈局名稱
+            index: 該投影片在輸出簡報中的序號 (由 1 開始)
+        """
+        return _Phase(self, 'slide', {'index': index, 'layout': layout})
+
+    def _add(self, kind, record):
+        if kind == 'slide':
+            self.slides.append(record)
+        else:
+            stats = self.phases.setdefault(record['name'], {
+                'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_rss_bytes': None})
+            stats['calls'] += 1
+            stats['wall_seconds'] += record['wall_seconds']
+            stats['cpu_seconds'] += record['cpu_seconds']
+            stats['peak_rss_bytes'] = record['peak_rss_bytes']
+        for hook in self._hooks:
+            hook(kind, record)
+
+    def report(self):
+        """
+        返回剖析報告
+
+        Returns:
+            {'total', 'phases', 'layouts', 'slides'} 字典;
+            layouts 為按佈局彙總的投影片耗時
+        """
+        layouts = {}
+        for record in self.slides:
+            stats = layouts.setdefault(record['layout'], {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+            stats['calls'] += 1
+            stats['wall_seconds'] += record['wall_seconds']
+            stats['cpu_seconds'] += record['cpu_seconds']
+        return {
+            'total': self._total,
+            'phases': self.phases,
+            'layouts': layouts,
+            'slides': self.slides,
+        }
+
+    def write_report(self, path):
+        """將剖析報告寫為 JSON 文件"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def dump_stats(self, path):
+        """
+        導出 cProfile 記錄 (pstats 格式)
+
+        Raises:
+            ValueError: 創建時未啟用 cprofile
+        """
+        if self._cprofile is None:
+            raise ValueError("未啟用 cProfile 記錄 (Profiler(cprofile=True))")
+        self._cprofile.dump_stats(path)
+
+    def format_summary(self):
+        """返回各階段與各佈局耗時的文字摘要 (每項一行)"""
+        def line(name, stats):
+            rss = stats.get('peak_rss_bytes')
+            text = (f"  {name:<16} {stats['wall_seconds'] * 1000:10.1f} ms"
+                    f"  CPU {stats['cpu_seconds'] * 1000:10.1f} ms")
+            if 'calls' in stats:
+                text += f"  x{stats['calls']}"
+            if rss is not None:
+                text += f"  峰值 RSS {rss / 1048576:.1f} MB"
+            return text
+
+        lines = []
+        if self._total is not None:
+            lines.append(line('total', self._total))
+        lines.extend(line(name, stats) for name, stats in self.phases.items())
+        lines.extend(line(f"slide:{layout}", stats) for layout, stats in self.report()['layouts'].items())
+        return lines
@@ -0,0 +1,349 @@
+"""
+常駐渲染服務
+
+以 HTTP (TCP 或 Unix socket) 接收與 JSON 配置文件格式相同的請求,
+在預熱的工作進程中生成簡報,返回 .pptx 內容或寫入指定路徑。
+工作進程啟動時即匯入 python-pptx 並預熱模板快取,之後重複使用,
+請求不再需要承擔解譯器啟動與模組匯入的成本。
+
+端點:
+- POST /render: 請求內容為 JSON 配置,返回 .pptx;帶 ?output=PATH 時寫入該路徑並返回 JSON,
+  ?compression=stored 時不壓縮 (更快但文件較大)。配置在排隊前先行驗證,
+  不符合佈局 schema 時返回 400 並列出全部錯誤
+- GET /health: 返回工作進程與請求統計
+
+同時處理的請求數等於工作進程數,其餘請求排隊等候;
+排隊已滿時返回 503,超過逾時限制時返回 504 並重啟該工作進程。
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import parse_qs, urlparse
+
+from .batch import _init_worker
+from .validation import ManifestValidationError, validate_slides
+
+PPTX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+
+
+class QueueFullError(Exception):
+    """排隊中的請求已達上限"""
+
+
+class RenderTimeoutError(Exception):
+    """請求超過逾時限制"""
+
+
+class RenderError(Exception):
+    """工作進程生成簡報失敗"""
+
+
+def _render_request(config, output=None, compression=None):
+    """在工作進程中生成簡報,返回 .pptx bytes 或寫入 output 並返回路徑"""
+    from .core import PPTAssistant
+
+    assistant = PPTAssistant.from_dict(config)
+    if output:
+        assistant.save(output, compression)
+        return output
+    return assistant.to_bytes(compression)
+
+
+def _worker_main(conn):
+    """工作進程主循環: 預熱後逐個處理請求,連接關閉時退出"""
+    _init_worker()
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, _render_request(*request)))
+        except Exception as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    """單個常駐工作進程"""
+
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def render(self, request, timeout):
+        """
+        發送請求 (_render_request 的參數) 並等待結果
+
+        Raises:
+            RenderTimeoutError: 超過逾時限制
+            RenderError: 生成失敗或工作進程意外退出
+        """
+        try:
+            self.conn.send(request)
+            if not self.conn.poll(timeout):
+                raise RenderTimeoutError(f"渲染超過 {timeout} 秒")
+            ok, result = self.conn.recv()
+        except (EOFError, OSError) as e:
+            raise RenderError(f"工作進程意外退出: {e}")
+        if not ok:
+            raise RenderError(result)
+        return result
+
+    @property
+    def alive(self):
+        return self.process.is_alive()
+
+    def close(self):
+        """終止工作進程"""
+        self.conn.close()
+        self.process.terminate()
+        self.process.join()
+
+
+class WorkerPool:
+    """常駐工作進程池,提供排隊、並發限制與逾時"""
+
+    def __init__(self, workers=None, queue_size=32, timeout=120):
+        """
+        Args:
+            workers: 工作進程數 (即同時處理的請求數),默認為 CPU 核心數
+            queue_size: 允許排隊等候的請求數,超過時拒絕新請求
+            timeout: 每個請求的逾時秒數 (包括排隊時間)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_size = queue_size
+        self.timeout = timeout
+        # 服務進程是多線程的,以 spawn 啟動工作進程避免 fork 時繼承被持有的鎖
+        self._ctx = multiprocessing.get_context('spawn')
+        self._idle = queue.LifoQueue()
+        for _ in range(self.workers):
+            self._idle.put(_Worker(self._ctx))
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.stats = {'completed': 0, 'failed': 0, 'rejected': 0, 'timeouts': 0}
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def render(self, config, output=None, compression=None):
+        """
+        生成一份簡報
+
+        Args:
+            config: 配置字典 (與 JSON 配置文件格式相同)
+            output: 寫入的 .pptx 路徑,默認返回 bytes
+            compression: zip 壓縮方式 'deflate' 或 'stored',默認使用配置值
+
+        Returns:
+            .pptx bytes,或 output 路徑
+
+        Raises:
+            QueueFullError: 排隊已滿
+            RenderTimeoutError: 超過逾時限制
+            RenderError: 生成失敗
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.queue_size:
+                self.stats['rejected'] += 1
+                raise QueueFullError("排隊的請求已達上限")
+            self._pending += 1
+        try:
+            deadline = time.monotonic() + self.timeout
+            try:
+                worker = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                self._count('timeouts')
+                raise RenderTimeoutError(f"排隊超過 {self.timeout} 秒")
+            try:
+                result = worker.render((config, output, compression),
+                                       max(0, deadline - time.monotonic()))
+            except RenderTimeoutError:
+                self._count('timeouts')
+                worker = self._replace(worker)
+                raise
+            except RenderError:
+                self._count('failed')
+                if not worker.alive:
+                    worker = self._replace(worker)
+                raise
+            finally:
+                self._idle.put(worker)
+            self._count('completed')
+            return result
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _replace(self, worker):
+        """終止卡住或已退出的工作進程並啟動新的進程"""
+        worker.close()
+        return _Worker(self._ctx)
+
+    def health(self):
+        """返回工作進程與請求統計"""
+        with self._lock:
+            pending = self._pending
+            stats = dict(self.stats)
+        idle = self._idle.qsize()
+        return {
+            'status': 'ok',
+            'workers': self.workers,
+            'busy': self.workers - idle,
+            'queued': max(0, pending - (self.workers - idle)),
+            'queue_size': self.queue_size,
+            'timeout': self.timeout,
+            **stats,
+        }
+
+    def close(self):
+        """終止所有工作進程"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """渲染服務的 HTTP 請求處理器"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def address_string(self):
+        # Unix socket 沒有客戶端地址
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def _send(self, status, body, content_type='application/json'):
+        if isinstance(body, dict):
+            body = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if urlparse(self.path).path == '/health':
+            self._send(200, self.server.pool.health())
+        else:
+            self._send(404, {'error': '找不到端點'})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/render':
+            self._send(404, {'error': '找不到端點'})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            config = json.loads(self.rfile.read(length))
+            if not isinstance(config, dict):
+                raise ValueError("配置必須是 JSON 對象")
+        except ValueError as e:
+            self._send(400, {'error': f"無效的 JSON 配置: {e}"})
+            return
+        try:
+            validate_slides(config.get('slides', []))
+        except ManifestValidationError as e:
+            self._send(400, {'error': "配置驗證失敗", 'errors': [f"{path}: {message}" for path, message in e.errors]})
+            return
+        query = parse_qs(url.query)
+        output = query.get('output', [None])[0]
+        compression = query.get('compression', [None])[0]
+        if compression not in (None, 'deflate', 'stored'):
+            self._send(400, {'error': f"不支援的壓縮方式: {compression}"})
+            return
+
+        start = time.perf_counter()
+        try:
+            result = self.server.pool.render(config, output, compression)
+        except QueueFullError as e:
+            self._send(503, {'error': str(e)})
+        except RenderTimeoutError as e:
+            self._send(504, {'error': str(e)})
+        except RenderError as e:
+            self._send(500, {'error': str(e)})
+        else:
+            if output:
+                self._send(200, {'output': result, 'seconds': time.perf_counter() - start})
+            else:
+                self._send(200, result, PPTX_CONTENT_TYPE)
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """監聽 Unix socket 的多線程 HTTP 服務"""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+        super().server_bind()
+
+
+def make_server(pool, host='127.0.0.1', port=8765, socket_path=None):
+    """
+    創建渲染服務 (尚未開始監聽請求)
+
+    Args:
+        pool: WorkerPool
+        host: 監聽地址
+        port: 監聽端口 (0 表示自動分配)
+        socket_path: Unix socket 路徑,指定時忽略 host 與 port
+
+    Returns:
+        socketserver 服務對象,以 serve_forever() 啟動
+    """
+    if socket_path:
+        server = UnixHTTPServer(socket_path, RenderRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.pool = pool
+    return server
+
+
+def build_parser(prog=None):
+    """建立 serve 子命令的參數解析器"""
+    parser = argparse.ArgumentParser(
+        prog=prog or 'python -m ppt_assistant serve',
+        description='啟動常駐渲染服務',
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='監聽地址 (默認 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='監聽端口 (默認 8765)')
+    parser.add_argument('--socket', metavar='PATH', help='改為監聽 Unix socket')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='工作進程數,即同時處理的請求數 (默認為 CPU 核心數)')
+    parser.add_argument('--queue-size', type=int, default=32,
+                        help='允許排隊等候的請求數,超過時返回 503 (默認 32)')
+    parser.add_argument('--timeout', type=float, default=120,
+                        help='每個請求的逾時秒數,超過時返回 504 (默認 120)')
+    return parser
+
+
+def main(argv=None, prog=None):
+    """serve 子命令入口"""
+    args = build_parser(prog).parse_args(argv)
+
+    pool = WorkerPool(args.workers, args.queue_size, args.timeout)
+    server = make_server(pool, args.host, args.port, args.socket)
+    where = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"渲染服務已啟動: {where} (工作進程 {pool.workers} 個)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
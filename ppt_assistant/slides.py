@@ -0,0 +1,108 @@
+"""
+快速追加投影片
+
+python-pptx 的 add_slide 每次都會掃描簡報的全部關係與 sldId 以分配編號,
+投影片數量多時總成本為 O(n²)。SlideAppender 只在構造時掃描一次,
+之後以 O(1) 成本追加投影片,生成的部件名稱、關係 ID 與 sldId 與 python-pptx 相同。
+圖表等其他新部件的名稱同樣由 PartNamer 分配,而非每次調用 package.next_partname
+遍歷整個套件。
+"""
+
+import re
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml.slide import CT_Slide
+from pptx.parts.slide import SlidePart
+
+MIN_SLIDE_ID = 256
+
+_PARTNAME_INDEX = re.compile(r'\d+(\.\w+)$')
+
+
+class PartNamer:
+    """為新部件分配部件名稱 (只掃描一次目標套件)"""
+
+    def __init__(self, package):
+        self._used = {str(p.partname) for p in package.iter_parts()}
+        # 每個模板下一個候選編號;已用名稱只增不減,最小可用編號不會變小
+        self._next = {}
+
+    def mark_used(self, partname):
+        """記錄由 python-pptx 自行分配的部件名稱"""
+        self._used.add(str(partname))
+
+    def next_partname(self, partname):
+        """
+        按部件名稱的模板返回下一個可用名稱
+
+        Args:
+            partname: 模板 (如 /ppt/charts/chart%d.xml) 或同類部件的名稱 (如 /ppt/charts/chart3.xml)
+        """
+        tmpl = partname if '%d' in partname else _PARTNAME_INDEX.sub(r'%d\1', str(partname))
+        n = self._next.get(tmpl, 1)
+        while tmpl % n in self._used:
+            n += 1
+        self._used.add(tmpl % n)
+        self._next[tmpl] = n + 1
+        return PackURI(tmpl % n)
+
+
+class SlideAppender:
+    """向簡報末尾追加投影片"""
+
+    def __init__(self, prs):
+        """
+        Args:
+            prs: 目標 Presentation
+        """
+        self._prs_part = prs.part
+        self._sldIdLst = prs.part._element.get_or_add_sldIdLst()
+        used_ids = [int(i) for i in self._sldIdLst.xpath('./p:sldId/@id')]
+        self._next_id = max([MIN_SLIDE_ID - 1] + used_ids) + 1
+        self._count = len(used_ids)
+        # 追加投影片後的回調 on_append(rId, slide_part) (如串流寫出)
+        self.on_append = None
+
+    @property
+    def count(self):
+        """簡報目前的投影片數"""
+        return self._count
+
+    def append_part(self, slide_layout, element=None):
+        """
+        追加投影片部件
+
+        Args:
+            slide_layout: 投影片使用的版面配置
+            element: 投影片的 p:sld 根元素,默認為空白投影片
+
+        Returns:
+            新的 SlidePart (版面配置關係為 rId1)
+        """
+        self._count += 1
+        partname = PackURI('/ppt/slides/slide%d.xml' % self._count)
+        if element is None:
+            element = CT_Slide.new()
+        slide_part = SlidePart(partname, CT.PML_SLIDE, self._prs_part.package, element)
+        slide_part.relate_to(slide_layout.part, RT.SLIDE_LAYOUT)
+
+        # 新部件不可能已有關係,直接添加而不掃描現有關係
+        rId = self._prs_part.rels._add_relationship(RT.SLIDE, slide_part)
+        self._sldIdLst._add_sldId(id=self._next_id, rId=rId)
+        self._next_id += 1
+        if self.on_append is not None:
+            self.on_append(rId, slide_part)
+        return slide_part
+
+    def add_slide(self, slide_layout):
+        """
+        追加投影片並複製版面配置中的佔位符 (與 Slides.add_slide 相同)
+
+        Returns:
+            新的 Slide
+        """
+        slide = self.append_part(slide_layout).slide
+        slide.shapes.clone_layout_placeholders(slide_layout)
+        return slide
@@ -0,0 +1,275 @@
+"""
+外部數據源
+
+圖表與表格除了在 JSON 中直接列出數據,也可引用外部的列式數據:
+CSV、.npy/.npz、Parquet 文件,或經 Python API 傳入的 NumPy 數組。
+數值轉換、缺失值 (NaN → 空白) 與數字格式判斷均以 NumPy 向量化處理,
+避免大量數據點在 Python 層逐個處理。
+
+NumPy 與 pyarrow (Parquet) 為可選依賴,只有使用外部數據源時才需要安裝;
+純 JSON 列表的配置走原來的路徑,不會匯入 NumPy。
+"""
+
+import csv
+import os
+from collections.abc import Mapping
+
+# 自動判斷數字格式時最多保留的小數位數
+MAX_DECIMALS = 4
+
+# CSV 中視為缺失值的文字 (比較時忽略大小寫與前後空白)
+_MISSING = ('', 'nan', 'na', 'n/a', 'null', 'none')
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("讀取外部數據源需要安裝 numpy (pip install numpy)") from None
+    return numpy
+
+
+def is_array(value):
+    """是否為 NumPy 數組 (不匯入 NumPy)"""
+    return hasattr(value, 'dtype') and hasattr(value, 'shape')
+
+
+def _coerce(column):
+    """將 CSV 文字欄位轉為數值數組;含非數值文字時保留為文字"""
+    np = _numpy()
+    stripped = np.char.lower(np.char.strip(column))
+    missing = np.isin(stripped, _MISSING)
+    try:
+        values = np.where(missing, 'nan', column).astype(np.float64)
+    except ValueError:
+        return np.where(missing, '', column)
+    if not missing.any() and np.array_equal(values, np.round(values)) and np.abs(values).max(initial=0) < 2 ** 53:
+        return values.astype(np.int64)
+    return values
+
+
+def _read_csv(path):
+    np = _numpy()
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"CSV 文件為空: {path}")
+        rows = [row for row in reader if row]
+    if not rows:
+        return {name: np.array([], dtype=np.float64) for name in header}
+    try:
+        data = np.array(rows, dtype=str)
+    except ValueError:
+        raise ValueError(f"CSV 各行的欄位數不一致: {path}") from None
+    if data.shape[1] != len(header):
+        raise ValueError(f"CSV 數據欄位數與表頭不一致: {path}")
+    return {name: _coerce(data[:, i]) for i, name in enumerate(header)}
+
+
+def _array_columns(array):
+    """數組 → 欄位字典: 結構化數組按欄位名,二維數組按列序號,一維數組為單一欄位"""
+    if array.dtype.names:
+        return {name: array[name] for name in array.dtype.names}
+    if array.ndim == 1:
+        return {'0': array}
+    if array.ndim == 2:
+        return {str(i): array[:, i] for i in range(array.shape[1])}
+    raise ValueError(f"不支援 {array.ndim} 維數組作為數據源")
+
+
+def _read_parquet(path, columns):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("讀取 Parquet 文件需要安裝 pyarrow (pip install pyarrow)") from None
+    table = pq.read_table(path, columns=columns)
+    return {name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names}
+
+
+def load_columns(source, columns=None):
+    """
+    讀取外部數據源
+
+    Args:
+        source: 文件路徑 (.csv、.npy、.npz、.parquet/.pq)、NumPy 數組,或欄位名到數組的字典
+        columns: 需要的欄位名稱 (Parquet 只讀取這些欄位),默認全部
+
+    Returns:
+        欄位名 → 一維 NumPy 數組的字典 (保持來源順序)
+
+    Raises:
+        ValueError: 不支援的格式或數據形狀
+        ImportError: 缺少 numpy 或 pyarrow
+    """
+    np = _numpy()
+    if is_array(source):
+        return _array_columns(source)
+    if isinstance(source, Mapping):
+        return {str(name): np.asarray(values) for name, values in source.items()}
+
+    ext = os.path.splitext(source)[1].lower()
+    if ext == '.csv':
+        return _read_csv(source)
+    if ext == '.npy':
+        return _array_columns(np.load(source, allow_pickle=False))
+    if ext == '.npz':
+        with np.load(source, allow_pickle=False) as archive:
+            return {name: archive[name] for name in archive.files}
+    if ext in ('.parquet', '.pq'):
+        return _read_parquet(source, columns)
+    raise ValueError(f"不支援的數據源格式: {source}")
+
+
+def to_values(array):
+    """
+    將數組轉為 Python 列表,缺失值 (NaN、NaT) 轉為 None
+
+    datetime64 轉為 datetime/date 對象,圖表會使用日期坐標軸。
+    """
+    np = _numpy()
+    array = np.asarray(array)
+    kind = array.dtype.kind
+    if kind == 'f':
+        mask = np.isnan(array)
+    elif kind == 'M':
+        mask = np.isnat(array)
+        if array.dtype != np.dtype('datetime64[D]'):
+            array = array.astype('datetime64[us]')
+    elif kind == 'O':
+        mask = np.array([v is None or v != v for v in array.ravel()], dtype=bool).reshape(array.shape)
+    else:
+        return array.tolist()
+    if not mask.any():
+        return array.tolist()
+    out = array.astype(object)
+    out[mask] = None
+    return out.tolist()
+
+
+def number_format(values):
+    """
+    按數據判斷圖表數字格式
+
+    整數列與取整的浮點值使用 '0',小數位數不超過 MAX_DECIMALS 時使用固定小數位
+    (如 '0.00'),否則返回 None (即 Excel 的 General);布林列同樣返回 None。
+    """
+    np = _numpy()
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return '0'
+    if values.dtype.kind != 'f':
+        return None
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return None
+    tolerance = 1e-9 * max(1.0, float(np.abs(finite).max()))
+    for decimals in range(MAX_DECIMALS + 1):
+        scaled = finite * 10 ** decimals
+        if np.all(np.abs(scaled - np.round(scaled)) <= tolerance * 10 ** decimals):
+            return '0' if decimals == 0 else '0.' + '0' * decimals
+    return None
+
+
+def _is_plain(value):
+    """是否為 JSON 中直接列出的數據 (而非欄位名稱或數組)"""
+    return isinstance(value, (list, tuple))
+
+
+def resolve_chart_data(data):
+    """
+    解析圖表數據配置
+
+    data 可以直接列出數據 (categories 與 series[].values 為列表),
+    或以 source 引用外部數據源,此時 categories 與 series[].values 為欄位名稱;
+    省略 categories 時使用第一個欄位,省略 series 時使用其餘全部欄位。
+    經 Python API 傳入時,categories 與 values 也可以直接是 NumPy 數組。
+
+    Args:
+        data: 圖表配置中的 data 字典
+
+    Returns:
+        (分類列表, 序列列表);序列為 {'name', 'values', 'number_format'} 字典
+
+    Raises:
+        ValueError: 找不到欄位、數據不是一維數值或長度與分類不一致
+    """
+    source = data.get('source')
+    categories = data.get('categories', [])
+    series_list = data.get('series', [])
+    if source is None and _is_plain(categories) and all(
+            isinstance(series, dict) and _is_plain(series.get('values', [])) for series in series_list):
+        return categories, series_list
+
+    np = _numpy()
+    columns = load_columns(source) if source is not None else {}
+
+    def column(ref, label):
+        if isinstance(ref, str):
+            if ref not in columns:
+                raise ValueError(f"數據源中找不到欄位 '{ref}'")
+            return columns[ref]
+        values = np.asarray(ref)
+        if values.ndim != 1:
+            raise ValueError(f"{label} 必須是一維數據")
+        return values
+
+    if source is not None and not is_array(categories) and not categories:
+        categories = next(iter(columns), None)
+        if categories is None:
+            raise ValueError("數據源沒有任何欄位")
+    if source is not None and not series_list:
+        series_list = [name for name in columns if name != categories]
+
+    category_values = column(categories, "分類")
+    resolved = []
+    for series in series_list:
+        if isinstance(series, str):
+            series = {'name': series, 'values': series}
+        ref = series.get('values', [])
+        name = series.get('name', ref if isinstance(ref, str) else '')
+        values = column(ref, f"序列 '{name}'")
+        if values.dtype.kind not in 'biuf':
+            raise ValueError(f"序列 '{name}' 必須是數值數據")
+        if len(values) != len(category_values):
+            raise ValueError(f"序列 '{name}' 有 {len(values)} 個數據點,與分類數 {len(category_values)} 不一致")
+        resolved.append({
+            'name': name,
+            'values': to_values(values),
+            'number_format': series.get('number_format') or number_format(values),
+        })
+    return to_values(category_values), resolved
+
+
+def resolve_table_data(table):
+    """
+    解析表格數據配置
+
+    table 可以直接列出 headers 與 rows,或以 source 引用外部數據源
+    (可用 columns 選擇欄位,headers 默認為欄位名稱)。
+    經 Python API 傳入時,rows 也可以是二維 NumPy 數組。缺失值顯示為空白。
+
+    Args:
+        table: 表格配置中的 table 字典
+
+    Returns:
+        (表頭列表, 數據行)
+    """
+    headers = table.get('headers', [])
+    rows = table.get('rows', [])
+    source = table.get('source')
+    if source is None and not is_array(rows):
+        return headers, rows
+
+    if source is None:
+        matrix = to_values(rows)
+    else:
+        names = table.get('columns')
+        columns = load_columns(source, names)
+        names = names or list(columns)
+        missing = [name for name in names if name not in columns]
+        if missing:
+            raise ValueError(f"數據源中找不到欄位: {', '.join(missing)}")
+        headers = headers or names
+        matrix = zip(*(to_values(columns[name]) for name in names))
+    return headers, [['' if value is None else value for value in row] for row in matrix]
@@ -0,0 +1,215 @@
+"""
+表格快速生成
+
+直接一次性拼接 a:tbl XML,取代逐個單元格透過 python-pptx 代理物件
+設置文字、字體與填充。單元格樣式模板依配置只構建一次並重複使用,
+輸出與逐格設置的結果完全相同。
+"""
+
+import re
+from functools import lru_cache
+from itertools import islice
+from xml.sax.saxutils import escape
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Pt
+
+# python-pptx 預設表格樣式
+TABLE_STYLE_ID = '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}'
+
+# 與 python-pptx 相同: 除 tab 與換行外的控制字元轉義為 _xHHHH_
+_CTRL_CHARS = re.compile(r'([\x00-\x08\x0B-\x1F])')
+_LINE_BREAKS = re.compile('\n|\v')
+
+_EMPTY_CELL = '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p/></a:txBody><a:tcPr/></a:tc>'
+
+
+def _hex(rgb):
+    return '%02X%02X%02X' % tuple(rgb)
+
+
+@lru_cache(maxsize=32)
+def _cell_templates(header_size, data_size, header_bg, header_fg, alt_bg):
+    """
+    構建單元格樣式模板
+
+    Returns:
+        (表頭段落開頭, 數據段落開頭, 表頭單元格屬性, 交替行單元格屬性, 普通單元格屬性)
+    """
+    header_p = (
+        '<a:p><a:pPr algn="ctr"><a:defRPr b="1" sz="%d"><a:solidFill>'
+        '<a:srgbClr val="%s"/></a:solidFill></a:defRPr></a:pPr>'
+        % (Pt(header_size).centipoints, _hex(header_fg))
+    )
+    data_p = '<a:p><a:pPr algn="ctr"><a:defRPr sz="%d"/></a:pPr>' % Pt(data_size).centipoints
+    header_pr = '<a:tcPr><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:tcPr>' % _hex(header_bg)
+    alt_pr = '<a:tcPr><a:solidFill><a:srgbClr val="%s"/></a:solidFill></a:tcPr>' % _hex(alt_bg)
+    return header_p, data_p, header_pr, alt_pr, '<a:tcPr/>'
+
+
+def _runs(text):
+    """將單行文字轉換為 a:r / a:br 序列 (與 python-pptx 的 append_text 一致)"""
+    parts = []
+    for idx, r_str in enumerate(_LINE_BREAKS.split(text)):
+        if idx > 0:
+            parts.append('<a:br/>')
+        if r_str:
+            r_str = _CTRL_CHARS.sub(lambda m: '_x%04X_' % ord(m.group(1)), r_str)
+            parts.append('<a:r><a:t>%s</a:t></a:r>' % escape(r_str))
+    return ''.join(parts)
+
+
+def _cell_xml(text, p_open, tc_pr):
+    """單元格 XML: 每個換行符開始一個新段落"""
+    paragraphs = ''.join(p_open + _runs(line) + '</a:p>' for line in text.split('\n'))
+    return '<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>%s</a:txBody>%s</a:tc>' % (paragraphs, tc_pr)
+
+
+def build_table_xml(headers, rows, width, height, ppt_config):
+    """
+    生成完整的 a:tbl XML
+
+    Args:
+        headers: 表頭列表
+        rows: 數據行列表
+        width: 表格寬度 (EMU)
+        height: 表格高度 (EMU)
+        ppt_config: PPT 配置對象
+
+    Returns:
+        a:tbl 元素的 XML 字串
+
+    Raises:
+        IndexError: 數據行的單元格數多於表頭
+    """
+    header_p, data_p, header_pr, alt_pr, plain_pr = _cell_templates(
+        ppt_config.TABLE_HEADER_FONT_SIZE,
+        ppt_config.TABLE_DATA_FONT_SIZE,
+        tuple(ppt_config.TABLE_HEADER_BG_COLOR),
+        tuple(ppt_config.TABLE_HEADER_TEXT_COLOR),
+        tuple(ppt_config.TABLE_ALT_ROW_BG_COLOR),
+    )
+    cols_count = len(headers)
+    rows_count = len(rows) + 1
+
+    # 與 python-pptx 相同: 最後一欄/列吸收整除誤差
+    col_width = width // cols_count
+    row_height = height // rows_count
+    last_col_width = width - (cols_count - 1) * col_width
+    last_row_height = height - (rows_count - 1) * row_height
+
+    parts = [
+        '<a:tbl %s><a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>%s</a:tableStyleId>'
+        '</a:tblPr><a:tblGrid>' % (nsdecls('a'), TABLE_STYLE_ID)
+    ]
+    grid_col = '<a:gridCol w="%d"/>' % col_width
+    parts.append(grid_col * (cols_count - 1))
+    parts.append('<a:gridCol w="%d"/></a:tblGrid>' % last_col_width)
+
+    tr_open = '<a:tr h="%d">' % row_height
+    parts.append(tr_open if rows_count > 1 else '<a:tr h="%d">' % last_row_height)
+    for header in headers:
+        parts.append(_cell_xml(str(header), header_p, header_pr))
+    parts.append('</a:tr>')
+
+    for row_idx, row_data in enumerate(rows):
+        if len(row_data) > cols_count:
+            raise IndexError(
+                f"表格第 {row_idx + 1} 行有 {len(row_data)} 個單元格,超過表頭的 {cols_count} 欄"
+            )
+        parts.append(tr_open if row_idx < rows_count - 2 else '<a:tr h="%d">' % last_row_height)
+        tc_pr = alt_pr if row_idx % 2 == 0 else plain_pr
+        for cell_data in row_data:
+            parts.append(_cell_xml(str(cell_data), data_p, tc_pr))
+        parts.append(_EMPTY_CELL * (cols_count - len(row_data)))
+        parts.append('</a:tr>')
+
+    parts.append('</a:tbl>')
+    return ''.join(parts)
+
+
+def add_table(slide, headers, rows, left, top, width, height, ppt_config):
+    """
+    在投影片上添加已格式化的表格
+
+    Args:
+        slide: 目標投影片
+        headers: 表頭列表
+        rows: 數據行列表
+        left, top, width, height: 表格位置與尺寸 (EMU)
+        ppt_config: PPT 配置對象
+
+    Returns:
+        包含表格的 GraphicFrame
+    """
+    # 先以 1x1 表格創建外框 (形狀 id、名稱與位置),再整體替換 a:tbl
+    table_shape = slide.shapes.add_table(1, 1, left, top, width, height)
+    graphic_data = table_shape._element.graphic.graphicData
+    old_tbl = graphic_data[0]
+    graphic_data.replace(old_tbl, parse_xml(build_table_xml(headers, rows, width, height, ppt_config)))
+    return table_shape
+
+
+def _row_height(font_size, ppt_config):
+    """估算單行高度 (英寸): 字號 x 行距 + 上下邊距"""
+    return font_size * ppt_config.TABLE_LINE_SPACING / 72 + ppt_config.TABLE_CELL_MARGIN
+
+
+def rows_per_page(ppt_config, table_height=None):
+    """
+    估算每頁可容納的數據行數
+
+    Args:
+        ppt_config: PPT 配置對象
+        table_height: 表格高度 (英寸),默認為內容區高度乘以 TABLE_HEIGHT_RATIO
+
+    Returns:
+        每頁數據行數 (至少為 1)
+    """
+    if table_height is None:
+        table_height = ppt_config.content_height * ppt_config.TABLE_HEIGHT_RATIO
+    available = table_height - _row_height(ppt_config.TABLE_HEADER_FONT_SIZE, ppt_config)
+    return max(1, int(available // _row_height(ppt_config.TABLE_DATA_FONT_SIZE, ppt_config)))
+
+
+def paginate_rows(rows, per_page):
+    """
+    將數據行切分為每頁一塊,逐塊產出
+
+    rows 可為任意可迭代對象 (包括生成器),不會一次性構建所有行。
+
+    Args:
+        rows: 數據行
+        per_page: 每頁行數, None 表示不分頁
+
+    Yields:
+        每頁的數據行列表
+    """
+    if per_page is None:
+        yield list(rows)
+        return
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, per_page))
+        if not chunk:
+            return
+        yield chunk
+
+
+def page_count(rows, per_page):
+    """返回總頁數;無法預知行數 (如生成器) 時返回 None"""
+    try:
+        total = len(rows)
+    except TypeError:
+        return None
+    return max(1, -(-total // per_page)) if per_page else 1
+
+
+def continuation_title(title, page, pages, ppt_config):
+    """返回續頁標題,首頁保持原標題"""
+    if page == 1:
+        return title
+    if pages is None:
+        return ppt_config.TABLE_CONTINUATION_TITLE_UNCOUNTED.format(title=title, page=page)
+    return ppt_config.TABLE_CONTINUATION_TITLE.format(title=title, page=page, pages=pages)
@@ -0,0 +1,210 @@
+"""
+模板快取
+
+每個進程只解析一次模板 (.pptx 套件、母片與版面配置),
+之後每份新簡報都從快取的物件樹深拷貝而來,無需重新解壓與解析 XML。
+快取以模板的絕對路徑加修改時間為鍵,模板文件更新後會自動重新載入。
+
+使用者模板另可建立版面配置與佔位符索引 (TemplateIndex): 版面配置名稱、
+各佔位符的類型、idx 與位置尺寸 (EMU,含從母片繼承的值),同樣每個模板只建立一次,
+渲染時據此選擇版面配置並直接填入佔位符。
+"""
+
+import copy
+import os
+import threading
+from collections import namedtuple
+
+from .config import Box
+
+_lock = threading.Lock()
+_cache = {}  # 絕對路徑 -> (mtime_ns, Presentation)
+_indexes = {}  # 絕對路徑 -> (mtime_ns, TemplateIndex)
+
+# 佔位符類型 (p:ph 的 type 屬性): 標題、可填入文字的內容,以及圖片/表格/圖表的專用類型
+TITLE_TYPES = ('title', 'ctrTitle')
+TEXT_TYPES = ('body', 'obj')
+SLOT_TYPES = {'image': 'pic', 'table': 'tbl', 'chart': 'chart'}
+
+# 佔位符: idx、類型 (p:ph 的 type,默認 obj)、名稱與位置尺寸 (Box,無法確定時為 None)
+Placeholder = namedtuple('Placeholder', ['idx', 'type', 'name', 'box'])
+
+
+def default_template_path():
+    """返回 python-pptx 內建預設模板的路徑"""
+    import pptx
+    return os.path.join(os.path.dirname(pptx.__file__), 'templates', 'default.pptx')
+
+
+def _cached_base(template_path):
+    """返回快取中的模板物件,必要時 (首次或文件已更新) 重新解析"""
+    path = os.path.abspath(template_path or default_template_path())
+    mtime = os.stat(path).st_mtime_ns
+
+    entry = _cache.get(path)
+    if entry is None or entry[0] != mtime:
+        with _lock:
+            entry = _cache.get(path)
+            if entry is None or entry[0] != mtime:
+                from pptx import Presentation
+                entry = (mtime, Presentation(path))
+                _cache[path] = entry
+    return entry[1]
+
+
+def load_presentation(template_path=None):
+    """
+    從快取的模板創建新簡報
+
+    Args:
+        template_path: .pptx 模板路徑,默認為 python-pptx 內建模板
+
+    Returns:
+        可自由修改的全新 Presentation 對象
+
+    Raises:
+        FileNotFoundError: 模板文件不存在
+    """
+    return copy.deepcopy(_cached_base(template_path))
+
+
+class TemplateLayout:
+    """模板中的一個版面配置及其佔位符"""
+
+    def __init__(self, master, index, name, placeholders):
+        self.master = master
+        self.index = index
+        self.name = name
+        self.placeholders = tuple(placeholders)
+        self.by_idx = {ph.idx: ph for ph in self.placeholders}
+
+    def find(self, *types):
+        """返回第一個類型符合的佔位符,沒有時返回 None"""
+        for ph in self.placeholders:
+            if ph.type in types:
+                return ph
+        return None
+
+    @property
+    def title(self):
+        """標題佔位符"""
+        return self.find(*TITLE_TYPES)
+
+    @property
+    def bodies(self):
+        """可填入文字的佔位符 (正文或任意內容),由左至右、由上至下排列"""
+        bodies = [ph for ph in self.placeholders if ph.type in TEXT_TYPES and ph.box is not None]
+        return sorted(bodies, key=lambda ph: (ph.box.left, ph.box.top))
+
+    def slot(self, kind):
+        """放置圖片、表格或圖表的佔位符: 專用類型優先,其次為任意內容與正文佔位符"""
+        for ph_type in (SLOT_TYPES.get(kind), 'obj', 'body'):
+            ph = self.find(ph_type)
+            if ph is not None and ph.box is not None:
+                return ph
+        return None
+
+    def caption(self, kind):
+        """放置內容以外的第一個文字佔位符 (如圖片說明),沒有時返回 None"""
+        slot = self.slot(kind)
+        return next((ph for ph in self.bodies if slot is None or ph.idx != slot.idx), None)
+
+    def resolve(self, presentation):
+        """返回 presentation (模板的副本) 中對應的 SlideLayout"""
+        return presentation.slide_masters[self.master].slide_layouts[self.index]
+
+
+class TemplateIndex:
+    """模板的版面配置與佔位符索引"""
+
+    def __init__(self, prs):
+        """
+        Args:
+            prs: 已載入模板的 Presentation (只讀取,不修改)
+        """
+        self.slide_width = prs.slide_width
+        self.slide_height = prs.slide_height
+        self.layouts = []
+        for m, master in enumerate(prs.slide_masters):
+            for i, layout in enumerate(master.slide_layouts):
+                self.layouts.append(TemplateLayout(m, i, layout.name, (
+                    _placeholder(ph) for ph in layout.placeholders)))
+        self.by_name = {}
+        for layout in self.layouts:
+            self.by_name.setdefault(layout.name, layout)
+
+    def _first(self, predicate):
+        return next((layout for layout in self.layouts if predicate(layout)), None)
+
+    def layout_for(self, kind, names=None):
+        """
+        選擇佈局類型使用的版面配置
+
+        names 中指定的版面配置名稱優先;否則按佔位符選擇: 標題頁選有置中標題
+        (或標題加副標題) 的版面,雙欄選有標題與兩個內容佔位符的版面,
+        其餘選有標題與一個內容佔位符的版面。
+
+        Args:
+            kind: 佈局類型 (title、content、two_column、image、table、chart 或自訂佈局)
+            names: 佈局類型 → 版面配置名稱 (TEMPLATE_LAYOUTS)
+
+        Returns:
+            TemplateLayout,沒有合適的版面配置時返回 None
+
+        Raises:
+            ValueError: names 指定的版面配置不存在
+        """
+        name = (names or {}).get(kind)
+        if name is not None:
+            layout = self.by_name.get(name)
+            if layout is None:
+                raise ValueError(f"模板中找不到版面配置 '{name}' (佈局 '{kind}')")
+            return layout
+        if kind == 'title':
+            return (self._first(lambda l: l.find('ctrTitle'))
+                    or self._first(lambda l: l.title and l.find('subTitle')))
+        count = 2 if kind == 'two_column' else 1
+        return self._first(lambda l: l.title and len(l.bodies) == count)
+
+
+def _placeholder(ph):
+    """讀取版面配置佔位符的類型、idx 與 (含繼承的) 位置尺寸"""
+    element = ph._element.ph
+    box = None
+    if None not in (ph.left, ph.top, ph.width, ph.height):
+        box = Box(ph.left, ph.top, ph.width, ph.height)
+    return Placeholder(int(element.get('idx', 0)), element.get('type', 'obj'), ph.name, box)
+
+
+def template_index(template_path):
+    """
+    返回模板的版面配置與佔位符索引 (每個模板只建立一次,文件更新後重建)
+
+    Args:
+        template_path: .pptx 模板路徑
+
+    Returns:
+        TemplateIndex
+
+    Raises:
+        FileNotFoundError: 模板文件不存在
+    """
+    path = os.path.abspath(template_path)
+    mtime = os.stat(path).st_mtime_ns
+
+    entry = _indexes.get(path)
+    if entry is None or entry[0] != mtime:
+        base = _cached_base(path)
+        with _lock:
+            entry = _indexes.get(path)
+            if entry is None or entry[0] != mtime:
+                entry = (mtime, TemplateIndex(base))
+                _indexes[path] = entry
+    return entry[1]
+
+
+def clear_template_cache():
+    """清空模板快取與佔位符索引"""
+    with _lock:
+        _cache.clear()
+        _indexes.clear()
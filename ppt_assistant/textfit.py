@@ -0,0 +1,254 @@
+"""
+文字適配
+
+內容頁與雙欄頁的文字框大小固定,正文過長時會溢出。此模組以字體度量估算
+文字在文字框內換行後的高度,並按 TEXT_FIT 縮小字號 (shrink) 或將內容
+拆分到續頁 (split)。
+
+- 字體: TEXT_FONT_FILE 用於西文,TEXT_EA_FONT_FILE 用於中日韓文字
+  (與 PowerPoint 分別設定 latin / ea 字體的方式相同)。字體文件每個進程只載入一次;
+  未設定時按字元寬度估算 (全形字元 1 em,西文約 0.5 em)。
+- 換行: 西文按單詞換行,中日韓文字可在任意字元之間換行,過長的單詞按字元斷開。
+- 快取: 每個 (字體, 字串) 的寬度以 LRU 快取,字號只是比例縮放,
+  縮小字號時各候選字號共用同一批度量結果。
+"""
+
+import math
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+
+# 文字框默認內邊距 (EMU): 左右各 0.1 英寸、上下各 0.05 英寸
+_INSET_X = 91440 * 2
+_INSET_Y = 45720 * 2
+
+EMUS_PER_POINT = 12700
+
+# 度量時載入字體的參考字號;其他字號的寬度按比例縮放
+_REFERENCE_SIZE = 1000
+
+# 中日韓文字與全形符號 (可在任意字元之間換行)
+_WIDE = (
+    '\u1100-\u115f\u2e80-\u303e\u3041-\u33ff\u3400-\u4dbf\u4e00-\u9fff'
+    '\ua960-\ua97f\uac00-\ud7a3\uf900-\ufaff\ufe30-\ufe4f\uff00-\uff60\uffe0-\uffe6'
+)
+_TOKENS = re.compile(f'(\\s+)|([{_WIDE}]+)|([^\\s{_WIDE}]+)')
+_IS_WIDE = re.compile(f'[{_WIDE}]')
+_LINE_BREAKS = re.compile('\n|\v')
+
+# 無字體文件時的字元寬度估算 (em)
+_NARROW = frozenset(" !'(),-./:;I[]`fijlrt|")
+_WIDE_LATIN = frozenset('@MWmw%')
+
+
+@lru_cache(maxsize=8)
+def _load_font(path):
+    """載入字體文件 (每個進程每個文件只載入一次);失敗時返回 None 並改用估算"""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype(path, _REFERENCE_SIZE)
+    except OSError:
+        print(f"警告: 無法載入字體文件 {path},改用估算的字元寬度")
+        return None
+
+
+def _estimate(text):
+    """按字元類別估算寬度 (em)"""
+    width = 0.0
+    for ch in text:
+        if _IS_WIDE.match(ch):
+            width += 1.0
+        elif ch in _NARROW:
+            width += 0.3
+        elif ch in _WIDE_LATIN or ch.isupper():
+            width += 0.7
+        else:
+            width += 0.5
+    return width
+
+
+@lru_cache(maxsize=65536)
+def measure(font_path, text):
+    """
+    測量字串寬度
+
+    Args:
+        font_path: 字體文件路徑, None 表示使用估算
+        text: 字串
+
+    Returns:
+        寬度 (em,乘以字號即為點數)
+    """
+    font = _load_font(font_path) if font_path else None
+    if font is None:
+        return _estimate(text)
+    return font.getlength(text) / _REFERENCE_SIZE
+
+
+@lru_cache(maxsize=16384)
+def _tokens(latin_font, ea_font, line):
+    """
+    將一行文字切分為可換行的單元並測量寬度 (em)
+
+    Returns:
+        (總寬度, 單元元組);單元為 (起始位置, 結束位置, 類別, 寬度, 累計寬度),
+        類別 0 為空白、1 為西文單詞、2 為中日韓文字串 (累計寬度用於在任意字元處斷開)
+    """
+    tokens = []
+    total = 0.0
+    for match in _TOKENS.finditer(line):
+        token = match.group()
+        if match.group(2):
+            cum = tuple(accumulate(measure(ea_font, ch) for ch in token))
+            tokens.append((match.start(), match.end(), 2, cum[-1], cum))
+            total += cum[-1]
+        else:
+            width = measure(latin_font, token)
+            tokens.append((match.start(), match.end(), 0 if match.group(1) else 1, width, None))
+            total += width
+    return total, tuple(tokens)
+
+
+class TextFitter:
+    """按配置的字體與行距估算文字高度,縮小字號或拆分段落"""
+
+    def __init__(self, ppt_config):
+        """
+        Args:
+            ppt_config: PPT 配置對象
+        """
+        self.latin_font = ppt_config.TEXT_FONT_FILE
+        self.ea_font = ppt_config.TEXT_EA_FONT_FILE
+        self.line_spacing = ppt_config.TEXT_LINE_SPACING
+        self.min_size = ppt_config.TEXT_MIN_FONT_SIZE
+
+    def line_starts(self, text, width):
+        """
+        按寬度換行
+
+        Args:
+            text: 段落文字 (換行符開始新行)
+            width: 可用寬度 (em)
+
+        Returns:
+            每一行在 text 中的起始位置
+        """
+        starts = []
+        offset = 0
+        for line in _LINE_BREAKS.split(text):
+            starts.append(offset)
+            total, tokens = _tokens(self.latin_font, self.ea_font, line)
+            if total > width:
+                self._wrap(line, tokens, width, offset, starts)
+            offset += len(line) + 1
+        return starts
+
+    def _wrap(self, line, tokens, width, offset, starts):
+        """對超過一行的文字逐個單元換行,新行的起始位置追加到 starts"""
+        x = 0.0
+        for start, end, kind, w, cum in tokens:
+            if kind == 0 or x + w <= width:
+                # 行末的空白不會觸發換行
+                x += w
+                continue
+            if kind == 1 and w <= width:
+                starts.append(offset + start)
+                x = w
+                continue
+            # 中日韓文字串或比整行還寬的單詞: 在字元之間斷開
+            if cum is None:
+                cum = tuple(accumulate(measure(self.latin_font, ch) for ch in line[start:end]))
+            i, base, n = 0, 0.0, len(cum)
+            while i < n:
+                j = bisect_right(cum, base + width - x, i)
+                if j == i:
+                    if x > 0:
+                        starts.append(offset + start + i)
+                        x = 0.0
+                        continue
+                    j = i + 1
+                x += cum[j - 1] - base
+                base = cum[j - 1]
+                i = j
+                if i < n:
+                    starts.append(offset + start + i)
+                    x = 0.0
+
+    def _layout(self, box, size):
+        """文字框內可用寬度 (em)、高度 (點) 與行高 (點)"""
+        width = (box.width - _INSET_X) / EMUS_PER_POINT / size
+        height = (box.height - _INSET_Y) / EMUS_PER_POINT
+        return width, height, size * self.line_spacing
+
+    def height(self, paragraphs, box, size, spacing=(0, 0)):
+        """
+        估算段落在文字框內的總高度
+
+        Args:
+            paragraphs: 段落文字列表
+            box: 文字框 (Box,EMU)
+            size: 字號 (點)
+            spacing: (段前, 段後) 間距 (點),首段段前與末段段後不計
+
+        Returns:
+            高度 (點)
+        """
+        width, _, line_height = self._layout(box, size)
+        lines = sum(len(self.line_starts(text, width)) for text in paragraphs)
+        return lines * line_height + max(0, len(paragraphs) - 1) * sum(spacing)
+
+    def shrink(self, paragraphs, box, size, spacing=(0, 0)):
+        """
+        返回能容納全部段落的最大字號 (不小於 TEXT_MIN_FONT_SIZE)
+
+        Returns:
+            字號 (點);原字號已能容納時原樣返回
+        """
+        _, available, _ = self._layout(box, size)
+        if self.height(paragraphs, box, size, spacing) <= available:
+            return size
+        lo, hi = self.min_size, size - 1
+        best = self.min_size
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if self.height(paragraphs, box, mid, spacing) <= available:
+                best, lo = mid, mid + 1
+            else:
+                hi = mid - 1
+        return best
+
+    def split(self, paragraphs, box, size, spacing=(0, 0)):
+        """
+        將段落按文字框高度分頁;放不下的段落在行邊界處斷開,餘下部分移到下一頁
+
+        Returns:
+            每頁的段落列表 (至少一頁)
+        """
+        width, available, line_height = self._layout(box, size)
+        before, after = spacing
+        pages = [[]]
+        used = 0.0
+        queue = list(reversed(paragraphs))
+        while queue:
+            text = queue.pop()
+            page = pages[-1]
+            gap = (before + after) if page else 0
+            starts = self.line_starts(text, width)
+            fit = math.floor((available - used - gap) / line_height + 1e-9)
+            if not page:
+                # 每頁至少放入一行,避免文字框比單行還矮時無限分頁
+                fit = max(fit, 1)
+            if fit >= len(starts):
+                page.append(text)
+                used += gap + len(starts) * line_height
+                continue
+            if fit >= 1:
+                cut = starts[fit]
+                page.append(text[:cut].rstrip())
+                text = text[cut:].lstrip(' \t')
+            queue.append(text)
+            pages.append([])
+            used = 0.0
+        return pages
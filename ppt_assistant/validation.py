@@ -0,0 +1,339 @@
+"""
+配置驗證
+
+在渲染之前一次檢查全部投影片並彙總所有錯誤,避免大型簡報生成到一半才因
+格式錯誤失敗 (如數據行比表頭長、圖表序列與分類數不一致、圖片文件不存在)。
+
+每種佈局以渲染器的 schema 聲明 content 各欄位的類型 (見 FIELD_TYPES),
+驗證器將其編譯為檢查函數表,每個進程只編譯一次,佈局註冊表變更時才重新編譯。
+外部數據源 (source) 只檢查文件是否存在與格式,不讀取數據。
+"""
+
+import os
+import weakref
+from collections.abc import Iterable, Mapping
+from numbers import Real
+
+from .layouts import LAYOUTS
+from .sources import is_array
+
+# 錯誤訊息中最多列出的錯誤數
+MAX_LISTED_ERRORS = 20
+
+_SOURCE_EXTENSIONS = ('.csv', '.npy', '.npz', '.parquet', '.pq')
+_SEQUENCE = (list, tuple)
+_SCALAR = (str, Real)  # Real 包括 NumPy 標量 (如 np.int64)
+_NUMBER_TYPES = frozenset((int, float, type(None)))
+
+
+class ManifestValidationError(ValueError):
+    """配置驗證失敗;errors 為 (路徑, 訊息) 的列表"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        lines = [f"  {path}: {message}" for path, message in errors[:MAX_LISTED_ERRORS]]
+        if len(errors) > MAX_LISTED_ERRORS:
+            lines.append(f"  ... 另有 {len(errors) - MAX_LISTED_ERRORS} 個錯誤")
+        super().__init__(f"配置驗證失敗,共 {len(errors)} 個錯誤:\n" + "\n".join(lines))
+
+
+def _type_name(value):
+    return type(value).__name__
+
+
+def _check_text(value, path, errors, state):
+    if not isinstance(value, str):
+        errors.append((path, f"必須是字串,而不是 {_type_name(value)}"))
+
+
+def _check_scalar(value, path, errors, state):
+    if not isinstance(value, _SCALAR):
+        errors.append((path, f"必須是字串或數字,而不是 {_type_name(value)}"))
+
+
+def _check_paragraphs(value, path, errors, state):
+    if isinstance(value, list):
+        for i, item in enumerate(value):
+            if not isinstance(item, _SCALAR):
+                errors.append((f"{path}[{i}]", f"必須是字串或數字,而不是 {_type_name(item)}"))
+    else:
+        _check_scalar(value, path, errors, state)
+
+
+def _check_image(value, path, errors, state):
+    if not isinstance(value, str):
+        errors.append((path, f"必須是圖片文件路徑,而不是 {_type_name(value)}"))
+        return
+    exists = state.get(value)
+    if exists is None:
+        exists = state[value] = os.path.isfile(value)
+    if not exists:
+        errors.append((path, f"找不到圖片文件 '{value}'"))
+
+
+def _check_source(source, path, errors, state):
+    """外部數據源: 文件路徑 (檢查存在與格式)、NumPy 數組或欄位字典"""
+    if is_array(source) or isinstance(source, Mapping):
+        return
+    if not isinstance(source, str):
+        errors.append((path, f"必須是數據文件路徑,而不是 {_type_name(source)}"))
+    elif os.path.splitext(source)[1].lower() not in _SOURCE_EXTENSIONS:
+        errors.append((path, f"不支援的數據源格式 '{source}' (支援: {', '.join(_SOURCE_EXTENSIONS)})"))
+    elif not os.path.isfile(source):
+        errors.append((path, f"找不到數據文件 '{source}'"))
+
+
+def _check_table(table, path, errors, state):
+    if not isinstance(table, dict):
+        errors.append((path, f"必須是對象,而不是 {_type_name(table)}"))
+        return
+    headers = table.get('headers', [])
+    if not isinstance(headers, _SEQUENCE):
+        errors.append((f"{path}.headers", f"必須是列表,而不是 {_type_name(headers)}"))
+        return
+
+    source = table.get('source')
+    if source is not None:
+        _check_source(source, f"{path}.source", errors, state)
+        columns = table.get('columns')
+        if columns is not None and not (isinstance(columns, _SEQUENCE) and all(isinstance(c, str) for c in columns)):
+            errors.append((f"{path}.columns", "必須是欄位名稱的列表"))
+        return
+
+    rows = table.get('rows', [])
+    width = len(headers)
+    if is_array(rows):
+        if rows.ndim != 2:
+            errors.append((f"{path}.rows", f"必須是二維數組,而不是 {rows.ndim} 維"))
+        elif rows.shape[1] > width:
+            errors.append((f"{path}.rows", f"有 {rows.shape[1]} 欄,超過表頭的 {width} 欄"))
+        return
+    if not isinstance(rows, _SEQUENCE):
+        # 生成器等一次性迭代器留給渲染時逐頁讀取,不在此逐行檢查
+        if isinstance(rows, (str, Mapping)) or not isinstance(rows, Iterable):
+            errors.append((f"{path}.rows", f"必須是列表,而不是 {_type_name(rows)}"))
+        return
+    if rows and not width:
+        errors.append((f"{path}.headers", "有數據行但沒有表頭"))
+        return
+    for i, row in enumerate(rows):
+        if not isinstance(row, _SEQUENCE):
+            errors.append((f"{path}.rows[{i}]", f"必須是列表,而不是 {_type_name(row)}"))
+        elif len(row) > width:
+            errors.append((f"{path}.rows[{i}]", f"有 {len(row)} 個單元格,超過表頭的 {width} 欄"))
+        else:
+            for j, cell in enumerate(row):
+                if cell is not None and not isinstance(cell, _SCALAR):
+                    errors.append((f"{path}.rows[{i}][{j}]", f"必須是字串或數字,而不是 {_type_name(cell)}"))
+                    break
+
+
+def _is_number(value):
+    """數字 (含 NumPy 標量) 或 null;布林值不視為數字"""
+    return type(value) in _NUMBER_TYPES or (isinstance(value, Real) and not isinstance(value, bool))
+
+
+def _check_values(values, path, errors):
+    """數值序列: 數字或 null (缺失值)"""
+    if all(type(v) in _NUMBER_TYPES for v in values):
+        return
+    for i, v in enumerate(values):
+        if not _is_number(v):
+            errors.append((f"{path}[{i}]", f"必須是數字或 null,而不是 {_type_name(v)}"))
+            return
+
+
+def _check_chart(chart, path, errors, state):
+    if not isinstance(chart, dict):
+        errors.append((path, f"必須是對象,而不是 {_type_name(chart)}"))
+        return
+    chart_type = chart.get('type', 'bar')
+    if not isinstance(chart_type, str):
+        errors.append((f"{path}.type", f"必須是字串,而不是 {_type_name(chart_type)}"))
+    data = chart.get('data', {})
+    path = f"{path}.data"
+    if not isinstance(data, dict):
+        errors.append((path, f"必須是對象,而不是 {_type_name(data)}"))
+        return
+
+    categories = data.get('categories', [])
+    series_list = data.get('series', [])
+    if not isinstance(series_list, _SEQUENCE):
+        errors.append((f"{path}.series", f"必須是列表,而不是 {_type_name(series_list)}"))
+        return
+
+    source = data.get('source')
+    if source is not None:
+        # 引用數據源時 categories 與 values 為欄位名稱,長度在讀取時檢查
+        _check_source(source, f"{path}.source", errors, state)
+        return
+
+    if not (isinstance(categories, _SEQUENCE) or is_array(categories)):
+        errors.append((f"{path}.categories", f"必須是列表,而不是 {_type_name(categories)}"))
+        return
+    count = len(categories)
+    for i, series in enumerate(series_list):
+        series_path = f"{path}.series[{i}]"
+        if not isinstance(series, dict):
+            errors.append((series_path, f"必須是對象,而不是 {_type_name(series)}"))
+            continue
+        values = series.get('values', [])
+        if is_array(values):
+            if values.ndim != 1 or values.dtype.kind not in 'biuf':
+                errors.append((f"{series_path}.values", "必須是一維數值數組"))
+                continue
+        elif not isinstance(values, _SEQUENCE):
+            errors.append((f"{series_path}.values", f"必須是列表,而不是 {_type_name(values)}"))
+            continue
+        else:
+            _check_values(values, f"{series_path}.values", errors)
+        if len(values) != count:
+            errors.append((f"{series_path}.values", f"有 {len(values)} 個數據點,與分類數 {count} 不一致"))
+
+
+# schema 中可使用的欄位類型 → 檢查函數 check(value, path, errors, state)
+FIELD_TYPES = {
+    'text': _check_text,
+    'scalar': _check_scalar,
+    'paragraphs': _check_paragraphs,
+    'image': _check_image,
+    'table': _check_table,
+    'chart': _check_chart,
+}
+
+
+def _compile(schema):
+    """將 {欄位: 類型} 編譯為 content 的檢查函數;schema 為 None 時只檢查 content 是對象"""
+    if schema is None:
+        return None
+    unknown = [kind for kind in schema.values() if kind not in FIELD_TYPES]
+    if unknown:
+        raise ValueError(f"未知的欄位類型: {', '.join(unknown)}")
+    fields = tuple((key, FIELD_TYPES[kind]) for key, kind in schema.items())
+
+    def check(content, path, errors, state):
+        for key, checker in fields:
+            value = content.get(key)
+            if value is not None:
+                checker(value, f"{path}.{key}", errors, state)
+    return check
+
+
+class ManifestValidator:
+    """由佈局註冊表編譯的驗證器 (以 get_validator 取得,每個進程重用)"""
+
+    def __init__(self, registry):
+        """
+        Args:
+            registry: 佈局註冊表
+
+        Raises:
+            ValueError: 某個佈局的 schema 使用了未知的欄位類型
+        """
+        self._checks = {name: _compile(getattr(registry.get(name), 'schema', None)) for name in registry.names()}
+        self._names = ', '.join(registry.names())
+
+    def errors(self, slides):
+        """
+        檢查全部投影片
+
+        Args:
+            slides: 投影片字典的可迭代對象 (列表或 SlideStream)
+
+        Returns:
+            (錯誤列表, 投影片數);錯誤為 (路徑, 訊息)
+        """
+        errors = []
+        state = {}  # 本次驗證中已檢查過的圖片路徑
+        checks = self._checks
+        count = 0
+        for i, slide in enumerate(slides):
+            count += 1
+            path = f"slides[{i}]"
+            if not isinstance(slide, dict):
+                errors.append((path, f"必須是對象,而不是 {_type_name(slide)}"))
+                continue
+            layout = slide.get('layout')
+            if layout not in checks:
+                errors.append((f"{path}.layout", f"不支援的佈局類型 '{layout}' (可用: {self._names})"))
+                continue
+            content = slide.get('content', {})
+            if not isinstance(content, dict):
+                errors.append((f"{path}.content", f"必須是對象,而不是 {_type_name(content)}"))
+                continue
+            check = checks[layout]
+            if check is not None:
+                check(content, f"{path}.content", errors, state)
+        return errors, count
+
+    def validate(self, slides):
+        """
+        檢查全部投影片,有錯誤時一併拋出
+
+        Returns:
+            投影片數
+
+        Raises:
+            ManifestValidationError: 任一投影片不符合 schema
+        """
+        errors, count = self.errors(slides)
+        if errors:
+            raise ManifestValidationError(errors)
+        return count
+
+
+_VALIDATORS = weakref.WeakKeyDictionary()
+
+
+def get_validator(registry=None):
+    """
+    返回佈局註冊表的驗證器 (每個進程編譯一次,註冊表變更後重新編譯)
+
+    Args:
+        registry: 佈局註冊表,默認為 LAYOUTS
+    """
+    registry = registry or LAYOUTS
+    cached = _VALIDATORS.get(registry)
+    if cached is None or cached[0] != registry.version:
+        cached = _VALIDATORS[registry] = (registry.version, ManifestValidator(registry))
+    return cached[1]
+
+
+def validate_slides(slides, registry=None):
+    """
+    驗證投影片列表
+
+    Returns:
+        投影片數
+
+    Raises:
+        ManifestValidationError: 任一投影片不符合 schema
+    """
+    return get_validator(registry).validate(slides)
+
+
+def validate_manifest(json_file, stream=False):
+    """
+    驗證 JSON 配置文件 (不載入模板,也不渲染)
+
+    Args:
+        json_file: .json 或 .jsonl 配置文件路徑
+        stream: 是否逐張串流讀取 (.jsonl 總是串流)
+
+    Returns:
+        投影片數
+
+    Raises:
+        ManifestValidationError: 任一投影片不符合 schema
+    """
+    if stream or json_file.lower().endswith('.jsonl'):
+        from .manifest import SlideStream
+        return validate_slides(SlideStream(json_file))
+
+    import json
+    with open(json_file, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    slides = config.get('slides', []) if isinstance(config, dict) else None
+    if not isinstance(slides, list):
+        raise ManifestValidationError([('slides', "必須是投影片列表")])
+    return validate_slides(slides)
@@ -0,0 +1,309 @@
+"""
+圖表嵌入工作簿
+
+python-pptx 為每個圖表經 XlsxWriter 生成完整的 Excel 工作簿,
+分類欄位的寫入隨數據點數呈平方增長,在圖表較多的簡報中佔去大部分生成時間。
+此模組以 CHART_WORKBOOK 選擇工作簿的生成方式:
+
+- fast: 直接串流寫出最小的 .xlsx (單一工作表、行內字串、只含用到的數字格式),
+  儲存格佈局與 python-pptx 相同,圖表公式引用保持不變
+- xlsxwriter: python-pptx 原來的 XlsxWriter 路徑
+- none: 不嵌入工作簿,圖表只保存 XML 中的快取數值
+  (PowerPoint 可正常顯示,但無法「編輯數據」)
+
+兩種生成方式的結果都以數據內容雜湊快取在進程內 (WORKBOOK_CACHE),
+相同數據的圖表 (同一簡報內或批量生成的多份簡報之間) 只生成一次。
+多層分類的圖表始終使用 XlsxWriter 路徑。
+
+python-pptx 的 add_chart 為圖表與工作簿分配部件名稱時都會遍歷整個套件,
+圖表數量多時總成本為 O(n²);add_chart 改由共用的 PartNamer 分配名稱。
+"""
+
+import datetime
+import hashlib
+import io
+import math
+import zipfile
+from collections import namedtuple
+from numbers import Number
+from xml.sax.saxutils import escape
+
+from pptx.chart.data import CategoryChartData
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.chart import ChartPart
+from pptx.parts.embeddedpackage import EmbeddedXlsxPart
+
+from .images import MediaCache
+from .profiling import NULL_PROFILER
+
+WORKBOOK_MODES = ('fast', 'xlsxwriter', 'none')
+
+# 快取項: 工作簿 bytes (與 MediaCache 的項目介面一致)
+WorkbookEntry = namedtuple('WorkbookEntry', ['data'])
+
+WORKBOOK_CACHE = MediaCache(64 * 1024 * 1024)
+
+# 固定的 zip 時間戳,相同數據生成相同的 bytes
+_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+# Excel 的日期序號起點 (1900 日期系統,已計入 1900 年閏日的錯誤)
+_EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+# 每次寫入 zip 的行數
+_ROWS_PER_CHUNK = 1024
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<cols><col min="1" max="1" width="10.7109375" customWidth="1"/></cols>'
+    '<sheetData>'
+)
+
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def _column_letter(number):
+    """1 → 'A'、28 → 'AB'"""
+    letters = ''
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _number(value):
+    """數值 → 儲存格文字;None、NaN 與無限大返回 None (不寫出儲存格)"""
+    if value is None or isinstance(value, bool):
+        return None if value is None else str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        return repr((value.replace(tzinfo=None) - _EXCEL_EPOCH).total_seconds() / 86400)
+    if isinstance(value, datetime.date):
+        return str((value - _EXCEL_EPOCH.date()).days)
+    if isinstance(value, Number):
+        value = float(value)
+        return repr(value) if math.isfinite(value) else None
+    return None
+
+
+def _cell(ref, value, style):
+    """單一儲存格的 XML;非數值寫為行內字串"""
+    text = _number(value)
+    if text is not None:
+        return f'<c r="{ref}"{style}><v>{text}</v></c>'
+    if value is None or (isinstance(value, Number) and not isinstance(value, bool)):
+        return ''
+    value = str(value)
+    space = ' xml:space="preserve"' if value != value.strip() else ''
+    return f'<c r="{ref}" t="inlineStr"><is><t{space}>{escape(value)}</t></is></c>'
+
+
+def _styles(formats):
+    """styles.xml: 每個非 General 的數字格式對應一個儲存格樣式 (cellXfs 索引由 1 開始)"""
+    num_fmts = ''.join(
+        f'<numFmt numFmtId="{164 + i}" formatCode="{escape(code, {chr(34): "&quot;"})}"/>'
+        for i, code in enumerate(formats))
+    xfs = ''.join(
+        f'<xf numFmtId="{164 + i}" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+        for i in range(len(formats)))
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        + (f'<numFmts count="{len(formats)}">{num_fmts}</numFmts>' if formats else '')
+        + '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="{len(formats) + 1}"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        f'{xfs}</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    )
+
+
+def write_workbook(categories, series_list, category_format='General'):
+    """
+    串流寫出最小的圖表工作簿
+
+    儲存格佈局與 python-pptx 的 CategoryWorkbookWriter 相同:
+    分類在 A 欄 (由第 2 行開始),每個序列一欄,序列名稱在第 1 行。
+
+    Args:
+        categories: 分類標籤列表
+        series_list: (名稱, 數值列表, 數字格式) 元組列表
+        category_format: 分類的數字格式 (日期分類如 'yyyy\\-mm\\-dd')
+
+    Returns:
+        .xlsx 文件的 bytes
+    """
+    formats = []
+    style_of = {}
+
+    def style(code):
+        if not code or code == 'General':
+            return ''
+        if code not in style_of:
+            formats.append(code)
+            style_of[code] = f' s="{len(formats)}"'
+        return style_of[code]
+
+    category_style = style(category_format)
+    columns = [(_column_letter(2 + i), values, style(code))
+               for i, (_, values, code) in enumerate(series_list)]
+    n_rows = max([len(categories)] + [len(values) for _, values, _ in columns])
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zf:
+        def write(name, text):
+            zf.writestr(zipfile.ZipInfo(name, _ZIP_DATE), text, zipfile.ZIP_DEFLATED)
+
+        write('[Content_Types].xml', _CONTENT_TYPES)
+        write('_rels/.rels', _ROOT_RELS)
+        write('xl/workbook.xml', _WORKBOOK)
+        write('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS)
+
+        info = zipfile.ZipInfo('xl/worksheets/sheet1.xml', _ZIP_DATE)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        with zf.open(info, 'w') as sheet:
+            header = ''.join(_cell(f'{col}1', name, '') for (col, _, _), (name, _, _)
+                             in zip(columns, series_list) if name is not None)
+            sheet.write(f'{_SHEET_HEAD}<row r="1">{header}</row>'.encode('utf-8'))
+            for start in range(0, n_rows, _ROWS_PER_CHUNK):
+                rows = []
+                for i in range(start, min(start + _ROWS_PER_CHUNK, n_rows)):
+                    r = i + 2
+                    cells = _cell(f'A{r}', categories[i], category_style) if i < len(categories) else ''
+                    for col, values, s in columns:
+                        if i < len(values):
+                            cells += _cell(f'{col}{r}', values[i], s)
+                    rows.append(f'<row r="{r}">{cells}</row>')
+                sheet.write(''.join(rows).encode('utf-8'))
+            sheet.write(_SHEET_TAIL.encode('utf-8'))
+
+        write('xl/styles.xml', _styles(formats))
+    return buf.getvalue()
+
+
+class ChartData(CategoryChartData):
+    """
+    按 CHART_WORKBOOK 生成嵌入工作簿的 CategoryChartData
+
+    Args:
+        mode: 'fast'、'xlsxwriter' 或 'none'
+    """
+
+    def __init__(self, mode='fast', number_format='General'):
+        super().__init__(number_format)
+        self.mode = mode
+
+    def _content_key(self, labels):
+        """工作簿內容的雜湊 (包含生成方式,兩種路徑的結果不共用)"""
+        digest = hashlib.sha256(self.mode.encode('utf-8'))
+        digest.update(repr((self.categories.number_format, labels)).encode('utf-8'))
+        for series in self:
+            digest.update(repr((series.name, series.number_format, series.values)).encode('utf-8'))
+        return digest.hexdigest()
+
+    @property
+    def xlsx_blob(self):
+        """嵌入的工作簿 bytes (按內容雜湊快取)"""
+        labels = [category.label for category in self.categories]
+        key = self._content_key(labels)
+        entry = WORKBOOK_CACHE.get(key)
+        if entry is not None:
+            return entry.data
+
+        if self.mode == 'xlsxwriter' or self.categories.depth != 1:
+            data = super().xlsx_blob
+        else:
+            data = write_workbook(
+                labels,
+                [(series.name, series.values, series.number_format) for series in self],
+                self.categories.number_format)
+        WORKBOOK_CACHE.put(key, WorkbookEntry(data))
+        return data
+
+
+def add_chart(slide, chart_type, box, chart_data, namer, profiler=NULL_PROFILER, store=None):
+    """
+    添加圖表 (與 SlideShapes.add_chart 相同,部件名稱由 namer 分配)
+
+    Args:
+        slide: 目標投影片
+        chart_type: XL_CHART_TYPE 成員
+        box: (left, top, width, height)
+        chart_data: ChartData;mode 為 'none' 時不嵌入工作簿
+        namer: 簡報共用的 PartNamer
+        profiler: 記錄 chart_xml 與 chart_workbook 階段的剖析器
+        store: 簡報的 PartStore;提供時數據相同的圖表共用內嵌工作簿部件
+
+    Returns:
+        圖表的 GraphicFrame
+    """
+    package = slide.part.package
+    with profiler.phase('chart_xml'):
+        chart_part = ChartPart.load(
+            namer.next_partname(ChartPart.partname_template), CT.DML_CHART, package,
+            chart_data.xml_bytes(chart_type))
+    if chart_data.mode != 'none':
+        with profiler.phase('chart_workbook'):
+            xlsx_blob = chart_data.xlsx_blob
+        if store is not None:
+            xlsx_part = store.get_or_add(EmbeddedXlsxPart.partname_template, EmbeddedXlsxPart.content_type,
+                                         xlsx_blob)
+        else:
+            xlsx_part = EmbeddedXlsxPart(namer.next_partname(EmbeddedXlsxPart.partname_template),
+                                         EmbeddedXlsxPart.content_type, package, xlsx_blob)
+        chart_part.chart_workbook.xlsx_part = xlsx_part
+
+    rId = slide.part.relate_to(chart_part, RT.CHART)
+    shapes = slide.shapes
+    graphic_frame = shapes._add_chart_graphicFrame(rId, *box)
+    shapes._recalculate_extents()
+    return shapes._shape_factory(graphic_frame)
@@ -0,0 +1,239 @@
+"""
+簡報套件寫入
+
+與 python-pptx 的 PackageWriter 以相同順序寫出套件 ([Content_Types].xml、
+套件關係、各部件及其關係),但可選擇 zip 壓縮方式與等級,
+並支援寫入任意可寫二進位流 (包括不可定位的 socket) 或逐塊產生 bytes。
+
+StreamingPackageWriter 則在渲染過程中逐張寫出投影片並釋放其部件,
+適用於投影片數以千計、完整保留在記憶體中會佔用大量 RSS 的簡報。
+"""
+
+import io
+import os
+import threading
+import zipfile
+
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import Part, _Relationship
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.parts.image import ImagePart
+
+COMPRESSION = {
+    'deflate': zipfile.ZIP_DEFLATED,
+    'stored': zipfile.ZIP_STORED,
+}
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _members(prs):
+    """依 PackageWriter 的順序產生 (成員名稱, 內容)"""
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    yield CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts))
+    yield PACKAGE_URI.rels_uri.membername, package._rels.xml
+    for part in parts:
+        yield part.partname.membername, part.blob
+        if part._rels:
+            yield part.partname.rels_uri.membername, part.rels.xml
+
+
+def _open_zip(target, compression, compress_level):
+    if compression not in COMPRESSION:
+        raise ValueError(f"不支援的壓縮方式: {compression}")
+    if compression == 'stored':
+        compress_level = None
+    return zipfile.ZipFile(target, 'w', compression=COMPRESSION[compression],
+                           compresslevel=compress_level, strict_timestamps=False)
+
+
+def write_package(prs, target, compression='deflate', compress_level=None):
+    """
+    將簡報寫入文件或二進位流
+
+    Args:
+        prs: Presentation
+        target: 輸出路徑或可寫二進位流 (可不支援 seek)
+        compression: 'deflate' 或 'stored' (不壓縮,最快)
+        compress_level: deflate 壓縮等級 0-9, None 為 zlib 默認值
+
+    Raises:
+        ValueError: 不支援的壓縮方式
+    """
+    with _open_zip(target, compression, compress_level) as zf:
+        for name, blob in _members(prs):
+            zf.writestr(name, blob)
+
+
+def package_bytes(prs, compression='deflate', compress_level=None):
+    """返回簡報套件的 bytes"""
+    buf = io.BytesIO()
+    write_package(prs, buf, compression, compress_level)
+    return buf.getvalue()
+
+
+class _ChunkSink:
+    """收集 zip 輸出的不可定位寫入目標"""
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def write(self, data):
+        self._buf += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self, min_size):
+        """取出已累積的內容 (每塊至少 min_size,0 表示全部)"""
+        while self._buf and len(self._buf) >= max(min_size, 1):
+            size = min_size or len(self._buf)
+            chunk = bytes(self._buf[:size])
+            del self._buf[:size]
+            yield chunk
+
+
+def iter_package(prs, chunk_size=STREAM_CHUNK_SIZE, compression='deflate', compress_level=None):
+    """
+    逐塊產生簡報套件的 bytes,適合直接寫入 socket 或分段上傳
+
+    每個部件壓縮後即產生輸出,不在記憶體中保留完整的 .pptx。
+
+    Args:
+        prs: Presentation
+        chunk_size: 每塊的大小 (最後一塊可能較小)
+        compression: 'deflate' 或 'stored'
+        compress_level: deflate 壓縮等級 0-9
+
+    Yields:
+        bytes 區塊
+    """
+    sink = _ChunkSink()
+    zf = _open_zip(sink, compression, compress_level)
+    try:
+        for name, blob in _members(prs):
+            zf.writestr(name, blob)
+            yield from sink.take(chunk_size)
+    finally:
+        zf.close()
+    yield from sink.take(chunk_size)
+    yield from sink.take(0)
+
+
+class _WrittenImagePart(ImagePart):
+    """已寫出的圖片部件存根: 保留 SHA1 與原始尺寸,後續投影片按 SHA1 去重時可直接引用"""
+
+    sha1 = None
+    _native_size = None
+
+    def __init__(self, part):
+        super().__init__(part.partname, part.content_type, part.package, b'', part._filename)
+        self.sha1 = part.sha1
+        self._native_size = part._native_size
+
+
+def _stub(part):
+    """已寫出部件的存根: 只保留部件名稱與內容類型 (圖片另保留去重所需的資訊)"""
+    if isinstance(part, ImagePart):
+        return _WrittenImagePart(part)
+    return Part(part.partname, part.content_type, part.package)
+
+
+class StreamingPackageWriter:
+    """
+    邊渲染邊寫出簡報套件
+
+    flush 將新追加的投影片及其部件 (圖表、工作簿、圖片) 寫入 zip,並在套件中
+    以存根替換,原部件的 XML 與內容隨即可被回收;存根只保留部件名稱與內容類型,
+    使部件命名、圖片去重與 [Content_Types].xml 與一般寫出時相同。
+    close 時寫出其餘部件 (簡報部件、模板中的版面配置與母片等)、套件關係與 [Content_Types].xml。
+    輸出為一般的 .pptx,各成員內容與 write_package 相同,只是成員順序不同。
+    輸出到路徑時先寫入同目錄的臨時文件,close 成功後才改名,失敗時不會留下不完整的 .pptx。
+    """
+
+    def __init__(self, prs, target, compression='deflate', compress_level=None, store=None):
+        """
+        Args:
+            prs: Presentation (尚未追加投影片)
+            target: 輸出路徑或可寫二進位流 (可不支援 seek)
+            compression: 'deflate' 或 'stored'
+            compress_level: deflate 壓縮等級 0-9
+            store: 簡報的 PartStore;已寫出的共用部件在其中同樣以存根替換
+
+        Raises:
+            ValueError: 不支援的壓縮方式
+        """
+        self._prs_part = prs.part
+        self._package = prs.part.package
+        # 寫出前已存在的部件 (模板內容) 可能被之後的投影片引用,留到 close 時寫出
+        self._deferred = {str(part.partname) for part in self._package.iter_parts()}
+        self._written = {}
+        self._pending = []
+        self._path = self._tmp_path = None
+        if isinstance(target, (str, os.PathLike)):
+            self._path = os.fspath(target)
+            target = self._tmp_path = f"{self._path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self._zip = _open_zip(target, compression, compress_level)
+        self._store = store
+        self.parts_written = 0
+
+    def add_slide(self, rId, slide_part):
+        """登記新追加的投影片 (SlideAppender.on_append 回調),於下次 flush 時寫出"""
+        self._pending.append((rId, slide_part))
+
+    def _write(self, part):
+        """寫出部件及其關聯部件,返回替換用的存根 (模板部件原樣返回)"""
+        name = str(part.partname)
+        stub = self._written.get(name)
+        if stub is not None or name in self._deferred:
+            return stub or part
+        self._zip.writestr(part.partname.membername, part.blob)
+        stub = self._written[name] = _stub(part)
+        if self._store is not None:
+            self._store.replace(part, stub)
+        self.parts_written += 1
+        if part._rels:
+            self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+            # 存根保留對其他部件的關係,使其仍可經由套件遍歷到達
+            for rel in part.rels.values():
+                if not rel.is_external:
+                    stub.rels._add_relationship(rel.reltype, self._write(rel.target_part))
+        return stub
+
+    def flush(self):
+        """寫出已登記的投影片,並以存根替換簡報部件中的投影片關係"""
+        rels = self._prs_part.rels
+        for rId, slide_part in self._pending:
+            rels._rels[rId] = _Relationship(rels._base_uri, rId, rels[rId].reltype, RTM.INTERNAL,
+                                            self._write(slide_part))
+        self._pending.clear()
+
+    def close(self):
+        """寫出其餘部件、套件關係與 [Content_Types].xml,完成 zip"""
+        self.flush()
+        parts = tuple(self._package.iter_parts())
+        for part in parts:
+            if str(part.partname) in self._written:
+                continue
+            self._zip.writestr(part.partname.membername, part.blob)
+            if part._rels:
+                self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, self._package._rels.xml)
+        self._zip.writestr(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self._zip.close()
+        if self._tmp_path is not None:
+            os.replace(self._tmp_path, self._path)
+
+    def abort(self):
+        """渲染失敗時關閉 zip;輸出到路徑時刪除臨時文件,輸出到流時內容不完整"""
+        self._pending.clear()
+        self._zip.close()
+        if self._tmp_path is not None:
+            try:
+                os.remove(self._tmp_path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,31 @@
+"""Reference implementations the tests (and benchmarks) compare the fast paths against."""
+
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_PARAGRAPH_ALIGNMENT
+from pptx.util import Pt
+
+
+def add_table_with_proxies(slide, headers, rows, left, top, width, height, ppt_config):
+    """Reference implementation: style every cell through python-pptx proxies."""
+    table = slide.shapes.add_table(len(rows) + 1, len(headers), left, top, width, height).table
+    for col_idx, header in enumerate(headers):
+        cell = table.cell(0, col_idx)
+        cell.text = str(header)
+        for paragraph in cell.text_frame.paragraphs:
+            paragraph.font.bold = True
+            paragraph.font.size = Pt(ppt_config.TABLE_HEADER_FONT_SIZE)
+            paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
+        cell.fill.solid()
+        cell.fill.fore_color.rgb = RGBColor(*ppt_config.TABLE_HEADER_BG_COLOR)
+        for paragraph in cell.text_frame.paragraphs:
+            paragraph.font.color.rgb = RGBColor(*ppt_config.TABLE_HEADER_TEXT_COLOR)
+    for row_idx, row_data in enumerate(rows):
+        for col_idx, cell_data in enumerate(row_data):
+            cell = table.cell(row_idx + 1, col_idx)
+            cell.text = str(cell_data)
+            for paragraph in cell.text_frame.paragraphs:
+                paragraph.font.size = Pt(ppt_config.TABLE_DATA_FONT_SIZE)
+                paragraph.alignment = PP_PARAGRAPH_ALIGNMENT.CENTER
+            if row_idx % 2 == 0:
+                cell.fill.solid()
+                cell.fill.fore_color.rgb = RGBColor(*ppt_config.TABLE_ALT_ROW_BG_COLOR)
@@ -0,0 +1,30 @@
+"""Helpers shared by the test modules (plain functions, so module-level helpers can use them too)."""
+
+import io
+import zipfile
+
+
+def mixed_slides(image_path):
+    """A deck using every built-in layout, with a repeated image and two charts of the same data."""
+    chart = {"type": "line", "data": {"categories": ["a", "b", "c"],
+                                      "series": [{"name": "s", "values": [1, 2, 3]}]}}
+    return [
+        {"layout": "title", "content": {"title": "T", "subtitle": "S"}},
+        {"layout": "image", "content": {"title": "I1", "image": image_path, "caption": "c"}},
+        {"layout": "chart", "content": {"title": "C1", "chart": chart}},
+        {"layout": "content", "content": {"title": "B", "body": ["x", "y"]}},
+        {"layout": "table", "content": {"title": "Tb", "table": {
+            "headers": ["h1", "h2"], "rows": [[i, i * 2] for i in range(30)]}}},
+        {"layout": "image", "content": {"title": "I2", "image": image_path}},
+        {"layout": "two_column", "content": {"title": "2", "left": "l", "right": "r"}},
+        {"layout": "chart", "content": {"title": "C2", "chart": chart}},
+    ]
+
+
+def zip_members(data):
+    """Zip members by name; docProps/core.xml carries a creation timestamp."""
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        members = {name: zf.read(name) for name in zf.namelist() if name != 'docProps/core.xml'}
+    # embedded chart workbooks are zips with their own timestamps
+    return {name: zip_members(blob) if name.endswith('.xlsx') else blob
+            for name, blob in members.items()}
@@ -0,0 +1,131 @@
+"""Test the asyncio front end."""
+
+import asyncio
+import io
+import json
+import threading
+import time
+
+import pytest
+
+IMAGE = "examples/sample_image.png"
+
+
+def _config(count=3):
+    slides = [{"layout": "title", "content": {"title": "Async", "subtitle": "deck"}},
+              {"layout": "image", "content": {"title": "I", "image": IMAGE}}]
+    slides += [{"layout": "content", "content": {"title": f"S{i}", "body": ["a", "b"]}} for i in range(count)]
+    return {"slides": slides}
+
+
+def test_render_async_keeps_loop_responsive(tmp_path):
+    """Test that rendering runs off the event loop and returns bytes or a file."""
+    from pptx import Presentation
+
+    from ppt_assistant.aio import AsyncRenderer, render_async
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        data = await render_async(_config(30))
+        task.cancel()
+
+        path = tmp_path / "deck.json"
+        path.write_text(json.dumps(_config()), encoding="utf-8")
+        async with AsyncRenderer(max_concurrency=2) as renderer:
+            output = await renderer.render(str(path), str(tmp_path / "out.pptx"))
+        return data, ticks, output
+
+    data, ticks, output = asyncio.run(scenario())
+    assert len(Presentation(io.BytesIO(data)).slides) == 32
+    assert ticks > 1
+    assert len(Presentation(output).slides) == 5
+
+
+def test_concurrency_limited_by_semaphore():
+    """Test that no more than max_concurrency renders run at once."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ppt_assistant.aio import AsyncRenderer
+    from ppt_assistant.layouts import LAYOUTS, LayoutRenderer, register_layout
+
+    lock = threading.Lock()
+    state = {'running': 0, 'peak': 0}
+
+    @register_layout('probe')
+    class ProbeRenderer(LayoutRenderer):
+        def render(self, assistant, content):
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+            time.sleep(0.05)
+            with lock:
+                state['running'] -= 1
+
+    config = {"slides": [{"layout": "probe", "content": {}}]}
+
+    async def scenario(renderer):
+        return await asyncio.gather(*(renderer.render(config) for _ in range(6)))
+
+    try:
+        with ThreadPoolExecutor(6) as executor:
+            results = asyncio.run(scenario(AsyncRenderer(executor, max_concurrency=2)))
+    finally:
+        LAYOUTS.unregister('probe')
+    assert len(results) == 6
+    assert state['peak'] == 2
+
+
+def test_timeout_cancels_thread_render():
+    """Test that a timeout raises and stops the render between slides."""
+    from ppt_assistant.aio import AsyncRenderer
+    from ppt_assistant.layouts import LAYOUTS, LayoutRenderer, register_layout
+
+    rendered = []
+
+    @register_layout('slow')
+    class SlowRenderer(LayoutRenderer):
+        def render(self, assistant, content):
+            rendered.append(content['n'])
+            time.sleep(0.02)
+
+    config = {"slides": [{"layout": "slow", "content": {"n": i}} for i in range(200)]}
+    renderer = AsyncRenderer(max_concurrency=1)
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(renderer.render(config, timeout=0.2))
+        renderer._executor.shutdown(wait=True)
+    finally:
+        LAYOUTS.unregister('slow')
+    assert 0 < len(rendered) < 50
+    assert renderer.active == 0
+
+
+def test_validation_error_raised():
+    """Test that invalid manifests fail with the validation error."""
+    from ppt_assistant.aio import render_async
+    from ppt_assistant.validation import ManifestValidationError
+
+    with pytest.raises(ManifestValidationError):
+        asyncio.run(render_async({"slides": [{"layout": "nope"}]}))
+
+
+def test_process_executor():
+    """Test rendering in a process pool started with spawn (fork is unsafe under a threaded event loop)."""
+    from pptx import Presentation
+
+    from ppt_assistant.aio import AsyncRenderer
+
+    async def scenario():
+        async with AsyncRenderer('process', max_concurrency=1) as renderer:
+            assert renderer._executor._mp_context.get_start_method() == 'spawn'
+            return await renderer.render(_config(), compression='stored')
+
+    assert len(Presentation(io.BytesIO(asyncio.run(scenario()))).slides) == 5
@@ -0,0 +1,83 @@
+"""Test batch deck generation."""
+
+import json
+import os
+
+import pytest
+
+
+def _write_config(directory, name, slides):
+    path = os.path.join(directory, f"{name}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"output": os.path.join(directory, f"{name}.pptx"), "slides": slides}, f)
+    return path
+
+
+def test_expand_inputs_directory_and_glob(tmp_path):
+    """Test that a directory expands to sorted JSON and JSON Lines files, a glob to its matches."""
+    from ppt_assistant.batch import expand_inputs
+
+    for name in ("b", "a"):
+        _write_config(str(tmp_path), name, [])
+    (tmp_path / "c.jsonl").write_text("{}\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    expected = [str(tmp_path / "a.json"), str(tmp_path / "b.json")]
+    assert expand_inputs(str(tmp_path)) == expected + [str(tmp_path / "c.jsonl")]
+    assert expand_inputs(str(tmp_path / "*.json")) == expected
+
+
+def test_run_batch_reports_success_and_failure(tmp_path):
+    """Test that each deck gets a result and failures do not stop the run."""
+    from ppt_assistant.batch import run_batch
+
+    good = _write_config(str(tmp_path), "good", [
+        {"layout": "title", "content": {"title": "T", "subtitle": "S"}}
+    ])
+    bad = str(tmp_path / "missing.json")
+
+    results = run_batch([good, bad], jobs=1)
+
+    assert [r['input'] for r in results] == [good, bad]
+    assert results[0]['ok'] and os.path.exists(results[0]['output'])
+    assert not results[1]['ok'] and 'FileNotFoundError' in results[1]['error']
+    assert all(r['seconds'] >= 0 for r in results)
+
+
+def test_run_batch_passes_options_to_each_deck(tmp_path):
+    """Test that streaming, incremental and profiling options apply to every deck."""
+    from pptx import Presentation
+
+    from ppt_assistant.batch import run_batch
+
+    slides = [{"layout": "title", "content": {"title": "T", "subtitle": "S"}},
+              {"layout": "content", "content": {"title": "C", "body": ["a", "b"]}}]
+    config = _write_config(str(tmp_path), "deck", slides)
+    lines = tmp_path / "lines.jsonl"
+    lines.write_text("\n".join(json.dumps(line) for line in [{"output": str(tmp_path / "lines.pptx")}] + slides))
+
+    results = run_batch([config, str(lines)], jobs=1, stream=True, stream_output=True, profile=True)
+    assert all(r['ok'] for r in results), results
+    for result in results:
+        assert len(Presentation(result['output']).slides) == 2
+        with open(result['profile'], encoding='utf-8') as f:
+            assert len(json.load(f)['slides']) == 2
+
+    # the second incremental build reuses every slide of the first, so none are rendered
+    run_batch([config], jobs=1, incremental=True)
+    results = run_batch([config], jobs=1, incremental=True, profile=True)
+    with open(results[0]['profile'], encoding='utf-8') as f:
+        assert json.load(f)['slides'] == []
+    assert len(Presentation(results[0]['output']).slides) == 2
+
+
+@pytest.mark.parametrize("extra", [["--workers", "2"], ["--profile-dump", "out.pstats"],
+                                   ["--validate-only"], ["deck.json"]])
+def test_batch_rejects_per_deck_flags(extra, capsys):
+    """Test that flags --batch cannot apply are rejected instead of ignored."""
+    from ppt_assistant.__main__ import main
+
+    with pytest.raises(SystemExit) as exc:
+        main(["--batch", "configs/", *extra])
+    assert exc.value.code == 2
+    assert "--batch" in capsys.readouterr().err
@@ -0,0 +1,53 @@
+"""Test the benchmark suite generators and regression check."""
+
+
+def test_generators_cover_every_layout(tmp_path):
+    """Test that the synthetic decks use every layout and render at a small scale."""
+    from benchmarks.generators import SCENARIOS, generate, make_images
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.layouts import LAYOUTS
+
+    images = make_images(str(tmp_path))
+    layouts = set()
+    for name in SCENARIOS:
+        slides = generate(name, scale=0.01, images=images)
+        assert slides
+        layouts.update(slide['layout'] for slide in slides)
+    assert layouts == set(LAYOUTS.names())
+
+    slides = generate('mixed', scale=0.01, images=images)
+    assert generate('mixed', scale=0.01, images=images) == slides
+    assert PPTAssistant.from_slides(slides).to_bytes()
+
+
+def test_throughput_counts_manifest_slides():
+    """Test that throughput uses the same unit as the latencies, whatever the pagination."""
+    import pytest
+
+    from benchmarks.suite import run_scenario
+
+    metrics = run_scenario('table', 0.05, ())
+    assert metrics['manifest_slides'] == 1 < metrics['slides']
+    assert metrics['slides_per_second'] == pytest.approx(1 / metrics['seconds'], rel=0.01)
+
+
+def test_compare_flags_regressions():
+    """Test that only metrics worse than the threshold are reported, in the right direction."""
+    from benchmarks.suite import best_of, compare, percentile
+
+    assert percentile([5, 1, 4, 2, 3], 0.5) == 3
+    assert percentile([1.0], 0.99) == 1.0
+
+    baseline = {'text': {'slides_per_second': 100, 'p95_ms': 10, 'peak_rss_mb': 50, 'output_bytes': 1000}}
+    results = {
+        'text': {'slides_per_second': 70, 'p95_ms': 5, 'peak_rss_mb': 55, 'output_bytes': 1300},
+        'new': {'slides_per_second': 1},
+    }
+    regressions = compare(results, baseline, 0.2)
+    assert [(name, metric) for name, metric, *_ in regressions] == [
+        ('text', 'slides_per_second'), ('text', 'output_bytes')]
+
+    run = {'seconds': 2, 'slides_per_second': 10, 'p50_ms': 3, 'p95_ms': 4, 'p99_ms': 5,
+           'peak_rss_mb': None, 'output_bytes': 9}
+    best = best_of([run, dict(run, seconds=1, slides_per_second=20, p95_ms=6)])
+    assert best['seconds'] == 1 and best['slides_per_second'] == 20 and best['p95_ms'] == 4
@@ -0,0 +1,87 @@
+"""Test line chart downsampling."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def test_lttb_and_minmax_indices():
+    """Test both algorithms keep the end points and stay within budget."""
+    from ppt_assistant.downsample import lttb_indices, minmax_indices
+
+    y = np.sin(np.linspace(0, 20, 10000))
+    y[4321] = 50.0  # a single spike
+    y[100:200] = np.nan
+
+    lttb = lttb_indices(y, 500)
+    assert len(lttb) == 500
+    assert lttb[0] == 0 and lttb[-1] == len(y) - 1
+    assert np.all(np.diff(lttb) > 0)
+    assert 4321 in lttb
+
+    minmax = minmax_indices(y, 500)
+    assert len(minmax) <= 500
+    assert minmax[0] == 0 and minmax[-1] == len(y) - 1
+    assert np.all(np.diff(minmax) > 0)
+    assert 4321 in minmax
+
+    assert len(lttb_indices(y[:50], 500)) == 50
+
+
+def test_line_chart_downsampled_in_render():
+    """Test that oversized line charts are reduced and reported in the summary."""
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.config import PPTConfig
+
+    config = PPTConfig()
+    config.CHART_DOWNSAMPLE = 'minmax'
+    config.CHART_MAX_POINTS = 100
+
+    n = 5000
+    values = np.cos(np.linspace(0, 10, n)).tolist()
+    values[7] = None
+    data = {"categories": list(range(n)), "series": [
+        {"name": "a", "values": values},
+        {"name": "b", "values": list(range(n))},
+    ]}
+    slides = [
+        {"layout": "chart", "content": {"title": "L", "chart": {"type": "line", "data": data}}},
+        {"layout": "chart", "content": {"title": "B", "chart": {"type": "bar", "data": {
+            "categories": list(range(150)), "series": [{"name": "c", "values": list(range(150))}]}}}},
+    ]
+    assistant = PPTAssistant.from_slides(slides, config)
+    assistant.render_slides(slides)
+
+    line, bar = [next(s.chart for s in slide.shapes if s.has_chart) for slide in assistant.prs.slides]
+    kept = len(line.plots[0].categories)
+    assert kept <= 104
+    assert len(bar.plots[0].categories) == 150
+
+    stats = assistant.summary['downsampling']
+    assert stats['charts'] == 1
+    assert stats['points_before'] == 2 * n
+    assert stats['points_after'] == 2 * kept
+    assert stats['estimated_bytes_saved'] > 0
+
+
+def test_downsampling_uses_placeholder_width(tmp_path):
+    """Test that charts placed in a narrower template placeholder keep fewer points."""
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.config import PPTConfig
+    from ppt_assistant.template import load_presentation
+
+    template = str(tmp_path / "brand.pptx")
+    load_presentation().save(template)
+    config = PPTConfig()
+    config.CHART_DOWNSAMPLE = 'minmax'
+    config.CHART_POINTS_PER_INCH = 10
+
+    n = 5000
+    data = {"categories": list(range(n)), "series": [{"name": "a", "values": np.sin(np.linspace(0, 50, n)).tolist()}]}
+    slides = [{"layout": "chart", "content": {"title": "L", "chart": {"type": "line", "data": data}}}]
+    assistant = PPTAssistant.from_slides(slides, config, template)
+    assistant.render_slides(slides)
+
+    frame = next(shape for shape in assistant.prs.slides[0].shapes if shape.has_chart)
+    assert frame.width < config.geometry.chart.width
+    assert len(frame.chart.plots[0].categories) <= frame.width / 914400 * 10
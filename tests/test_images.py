@@ -0,0 +1,135 @@
+"""Test image preprocessing and the media cache."""
+
+import io
+import os
+
+from PIL import Image
+
+
+def _make_image(path, size, fmt):
+    Image.new('RGB', size, (200, 30, 30)).save(path, fmt)
+    return str(path)
+
+
+def test_large_image_downscaled_to_target_dpi(tmp_path):
+    """Test that oversized images are resampled to the placed width."""
+    from ppt_assistant import PPTConfig
+    from ppt_assistant.images import prepare_image
+
+    config = PPTConfig()
+    source = _make_image(tmp_path / "photo.jpg", (4000, 3000), 'JPEG')
+
+    with Image.open(prepare_image(source, 4.0, config)) as img:
+        assert img.size == (600, 450)
+        assert img.format == 'JPEG'
+
+
+def test_exif_orientation_applied_before_resize(tmp_path):
+    """Test that rotated camera photos are turned upright, sized on the upright width, and keep their ICC profile."""
+    from PIL import ImageCms
+    from ppt_assistant import PPTConfig
+    from ppt_assistant.images import prepare_image
+
+    icc = ImageCms.ImageCmsProfile(ImageCms.createProfile('sRGB')).tobytes()
+    exif = Image.Exif()
+    exif[0x0112] = 6  # rotate 90° clockwise on display
+    source = str(tmp_path / "camera.jpg")
+    Image.new('RGB', (4000, 1000), (200, 30, 30)).save(source, 'JPEG', exif=exif, icc_profile=icc)
+
+    with Image.open(prepare_image(source, 4.0, PPTConfig())) as img:
+        assert img.size == (600, 2400)
+        assert img.getexif().get(0x0112, 1) == 1
+        assert img.info.get('icc_profile') == icc
+
+    small = str(tmp_path / "small.jpg")
+    Image.new('RGB', (200, 100)).save(small, 'JPEG', exif=exif)
+    with Image.open(prepare_image(small, 4.0, PPTConfig())) as img:
+        assert img.size == (100, 200)
+
+
+def test_small_image_embedded_unchanged(tmp_path):
+    """Test that images already below the target size are passed through."""
+    from ppt_assistant import PPTConfig
+    from ppt_assistant.images import prepare_image
+
+    source = _make_image(tmp_path / "logo.png", (100, 50), 'PNG')
+    assert prepare_image(source, 4.0, PPTConfig()).getvalue() == open(source, 'rb').read()
+
+    config = PPTConfig()
+    config.IMAGE_PREPROCESS = False
+    big = _make_image(tmp_path / "big.png", (4000, 100), 'PNG')
+    assert prepare_image(big, 4.0, config) == big
+
+
+def test_processed_images_cached_on_disk(tmp_path, monkeypatch):
+    """Test that processed images are shared through the on-disk cache without rehashing the source."""
+    from ppt_assistant import PPTConfig
+    from ppt_assistant import images
+    from ppt_assistant.images import MEDIA_CACHE, load_image
+
+    config = PPTConfig()
+    config.IMAGE_CACHE_DIR = str(tmp_path / "cache")
+    source = _make_image(tmp_path / "scan.bmp", (3000, 1000), 'BMP')
+
+    first = load_image(source, 2.0, config)
+    cached = sorted(os.listdir(config.IMAGE_CACHE_DIR))
+    assert sorted(os.path.splitext(name)[1] for name in cached) == ['.idx', '.png']
+    assert (first.width, first.height, first.format) == (300, 100, 'PNG')
+
+    # a fresh process finds the content digest through the on-disk stat index
+    MEDIA_CACHE.clear()
+    monkeypatch.setattr(images, '_DIGESTS', {})
+    monkeypatch.setattr(images, '_file_digest', None)
+    assert load_image(source, 2.0, config) == first
+    assert sorted(os.listdir(config.IMAGE_CACHE_DIR)) == cached
+    monkeypatch.undo()
+
+    config.IMAGE_CACHE_MAX_BYTES = 0
+    load_image(source, 3.0, config)
+    assert os.listdir(config.IMAGE_CACHE_DIR) == []
+
+
+def test_jpeg_quality_keys_the_caches(tmp_path):
+    """Test that resized JPEGs at different qualities never share a cache entry, even without IMAGE_RECOMPRESS."""
+    from ppt_assistant import PPTConfig
+    from ppt_assistant.images import MEDIA_CACHE, prepare_image
+
+    source = str(tmp_path / "noise.jpg")
+    Image.effect_noise((2000, 1000), 64).convert('RGB').save(source, 'JPEG', quality=95)
+
+    for cache_dir in (None, str(tmp_path / "cache")):
+        MEDIA_CACHE.clear()
+        sizes = []
+        for quality in (90, 30, 90):
+            config = PPTConfig()
+            config.IMAGE_CACHE_DIR = cache_dir
+            config.IMAGE_JPEG_QUALITY = quality
+            assert not config.IMAGE_RECOMPRESS
+            sizes.append(len(prepare_image(source, 4.0, config).getvalue()))
+            if cache_dir:
+                MEDIA_CACHE.clear()  # next lookup goes to the disk cache
+        assert sizes[0] == sizes[2] > sizes[1]
+
+
+def test_media_cache_lru_and_counters(tmp_path):
+    """Test that repeat loads hit the in-process cache and eviction is LRU."""
+    from ppt_assistant import PPTConfig
+    from ppt_assistant.images import MEDIA_CACHE, MediaCache, MediaEntry, load_image
+
+    MEDIA_CACHE.clear()
+    config = PPTConfig()
+    source = _make_image(tmp_path / "logo.png", (50, 50), 'PNG')
+
+    entry = load_image(source, 1.0, config)
+    os.utime(source, ns=(0, os.stat(source).st_mtime_ns))  # atime only; key unchanged
+    assert load_image(source, 1.0, config) is entry
+    stats = MEDIA_CACHE.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+
+    cache = MediaCache(max_bytes=10)
+    for key in 'abc':
+        cache.put(key, MediaEntry(b'x' * 4, 1, 1, (72, 72), 'PNG'))
+    cache.get('b')
+    cache.put('d', MediaEntry(b'x' * 4, 1, 1, (72, 72), 'PNG'))
+    assert cache.get('a') is None and cache.get('c') is None
+    assert cache.get('b') is not None and cache.evictions == 2
@@ -85,6 +85,43 @@ def test_config_calculated_properties():
     print("✓ Config calculated properties verified")
 
 
+def test_config_geometry_compiled_in_emu():
+    """Test that the compiled geometry matches Inches() math and tracks changes."""
+    from ppt_assistant import PPTConfig
+    from pptx.util import Inches
+    import json
+    import pickle
+    import tempfile
+    import os
+
+    config = PPTConfig()
+    geometry = config.geometry
+    assert config.geometry is geometry  # compiled once
+    assert geometry.body == (Inches(config.MARGIN), Inches(config.content_top),
+                             Inches(config.content_width), Inches(config.content_height))
+    assert geometry.slide_width == Inches(config.SLIDE_WIDTH)
+
+    try:
+        geometry.body = None
+        assert False, "Geometry should be immutable"
+    except AttributeError:
+        pass
+
+    config.MARGIN = 1.0
+    assert config.geometry.body.left == Inches(1.0)
+    assert pickle.loads(pickle.dumps(config)).geometry == config.geometry
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+        json.dump({"SLIDE_WIDTH": 10.0}, f)
+    try:
+        loaded = PPTConfig.from_json(f.name)
+    finally:
+        os.unlink(f.name)
+    assert loaded.geometry.slide_width == Inches(10.0)
+
+    print("✓ Config geometry verified")
+
+
 def test_custom_config_application():
     """Test that custom configurations are properly applied."""
     from ppt_assistant import PPTAssistant, PPTConfig
@@ -136,6 +173,24 @@ def test_custom_config_application():
             os.unlink("test_output.pptx")
 
 
+def test_lazy_imports():
+    """Test that startup and validation do not load python-pptx, and charts load only when used."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, ppt_assistant\n"
+        "from ppt_assistant.__main__ import build_parser\n"
+        "from ppt_assistant.validation import validate_manifest\n"
+        "build_parser(); validate_manifest('examples/example_config.json')\n"
+        "print('pptx' in sys.modules, 'PIL' in sys.modules)\n"
+        "ppt_assistant.PPTAssistant.from_slides([{'layout': 'content', 'content': {'body': 'x'}}]).to_bytes()\n"
+        "print('pptx' in sys.modules, 'xlsxwriter' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["False", "False", "True", "False"]
+
+
 if __name__ == "__main__":
     test_import()
     test_class_attributes()
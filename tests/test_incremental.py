@@ -0,0 +1,67 @@
+"""Test incremental rebuilds against full renders."""
+
+import json
+
+from tests.conftest import mixed_slides, zip_members
+
+
+def _build(tmp_path, slides, name="deck", incremental=True, ppt_config=None):
+    from ppt_assistant import PPTAssistant
+
+    output = tmp_path / f"{name}.pptx"
+    path = tmp_path / f"{name}.json"
+    path.write_text(json.dumps({"output": str(output), "slides": slides}))
+    assistant = PPTAssistant(str(path), ppt_config=ppt_config)
+    assistant.create_presentation(incremental=incremental)
+    return assistant, zip_members(output.read_bytes())
+
+
+def _rebuild_counts(assistant):
+    return {key: assistant.summary[key] for key in ('slides_reused', 'slides_rebuilt')}
+
+
+def test_incremental_rebuild_reuses_unchanged_slides(tmp_path):
+    """Test that only edited slides are re-rendered and the result matches a full build."""
+    slides = mixed_slides('examples/sample_image.png')
+    first, _ = _build(tmp_path, slides)
+    assert _rebuild_counts(first) == {'slides_reused': 0, 'slides_rebuilt': len(slides)}
+    assert (tmp_path / "deck.pptx.manifest.json").exists()
+
+    again, unchanged = _build(tmp_path, slides)
+    assert _rebuild_counts(again) == {'slides_reused': len(slides), 'slides_rebuilt': 0}
+
+    slides[3]["content"]["body"] = ["changed"]
+    edited, actual = _build(tmp_path, slides)
+    assert _rebuild_counts(edited) == {'slides_reused': len(slides) - 1, 'slides_rebuilt': 1}
+
+    _, expected = _build(tmp_path, slides, name="full", incremental=False)
+    assert sorted(actual) == sorted(expected)
+    assert [name for name in expected if actual[name] != expected[name]] == []
+    assert unchanged != actual
+
+
+def test_incremental_rebuild_invalidated_by_config(tmp_path):
+    """Test that changing the effective PPTConfig re-renders every slide."""
+    from ppt_assistant.config import PPTConfig
+
+    slides = mixed_slides('examples/sample_image.png')
+    _build(tmp_path, slides)
+
+    cfg = PPTConfig()
+    cfg.BODY_FONT_SIZE = 20
+    rebuilt, _ = _build(tmp_path, slides, ppt_config=cfg)
+    assert _rebuild_counts(rebuilt) == {'slides_reused': 0, 'slides_rebuilt': len(slides)}
+
+
+def test_incremental_rebuild_of_chart_before_reused_chart(tmp_path):
+    """Test that a rebuilt chart and a reused chart get distinct part names."""
+    chart = {"type": "bar", "data": {"categories": ["a", "b"], "series": [{"name": "s", "values": [1, 2]}]}}
+    slides = [{"layout": "chart", "content": {"title": f"C{i}", "chart": chart}} for i in range(2)]
+    _build(tmp_path, slides)
+
+    slides[0]["content"]["title"] = "changed"
+    edited, actual = _build(tmp_path, slides)
+    assert _rebuild_counts(edited) == {'slides_reused': 1, 'slides_rebuilt': 1}
+
+    _, expected = _build(tmp_path, slides, name="full", incremental=False)
+    assert sorted(actual) == sorted(expected)
@@ -0,0 +1,60 @@
+"""Test the layout registry."""
+
+import pytest
+
+
+def test_register_custom_layout():
+    """Test that a third-party layout renders and is timed by the registry."""
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.layouts import LAYOUTS, LayoutRenderer, register_layout
+
+    @register_layout('quote')
+    class QuoteRenderer(LayoutRenderer):
+        uses = ('title_box',)
+
+        def render(self, assistant, content):
+            slide = assistant.add_slide()
+            assistant.add_title_box(slide, content['quote'])
+
+    try:
+        LAYOUTS.reset_stats()
+        slides = [{"layout": "quote", "content": {"quote": "Hello"}},
+                  {"layout": "content", "content": {"title": "T", "body": "b"}}]
+        assistant = PPTAssistant.from_slides(slides)
+        assistant.render_slides(slides)
+
+        texts = [slide.shapes[0].text_frame.text for slide in assistant.prs.slides]
+        assert texts == ["Hello", "T"]
+        stats = LAYOUTS.stats()
+        assert stats['quote']['calls'] == 1
+        assert stats['content']['calls'] == 1
+        assert stats['quote']['seconds'] >= 0
+    finally:
+        LAYOUTS.unregister('quote')
+
+
+def test_registry_rejects_conflicts():
+    """Test duplicate names and unknown shared parts are rejected."""
+    from ppt_assistant.layouts import LayoutRegistry, LayoutRenderer
+
+    registry = LayoutRegistry()
+    registry.register('x', LayoutRenderer())
+    with pytest.raises(ValueError):
+        registry.register('x', LayoutRenderer())
+    registry.register('x', LayoutRenderer(), replace=True)
+
+    bad = LayoutRenderer()
+    bad.uses = ('no_such_part',)
+    with pytest.raises(ValueError):
+        registry.register('y', bad)
+
+
+def test_unknown_layout_warns(capsys):
+    """Test that unregistered layouts are skipped with a warning."""
+    from ppt_assistant import PPTAssistant
+
+    slides = [{"layout": "nope", "content": {}}]
+    assistant = PPTAssistant.from_slides(slides)
+    assistant.render_slides(slides)
+    assert len(assistant.prs.slides) == 0
+    assert "nope" in capsys.readouterr().out
@@ -0,0 +1,53 @@
+"""Test streaming slide manifest ingestion."""
+
+import json
+
+
+def test_slide_stream_matches_json_load_across_chunk_boundaries(tmp_path):
+    """Test that the incremental parser yields the same slides as json.load."""
+    from ppt_assistant.manifest import SlideStream
+
+    with open('examples/example_config.json', encoding='utf-8') as f:
+        config = json.load(f)
+    config['slides'].append({"layout": "chart", "content": {"chart": {"data": {
+        "categories": ["a", "b"], "series": [{"name": "n", "values": [12345, -0.5e3]}]}}}})
+    path = tmp_path / "deck.json"
+    path.write_text(json.dumps(config, indent=2, ensure_ascii=False), encoding='utf-8')
+
+    for chunk_size in (1, 7, 64, 1 << 20):
+        stream = SlideStream(str(path), chunk_size=chunk_size)
+        assert stream.header == {"output": config["output"]}
+        assert list(stream) == config["slides"]
+
+
+def test_slide_stream_reads_settings_after_slides(tmp_path):
+    """Test that top-level keys after the slides array reach the header."""
+    from ppt_assistant.manifest import SlideStream
+
+    path = tmp_path / "deck.json"
+    path.write_text('{"slides": [{"layout": "title"}], "output": "late.pptx"}')
+
+    stream = SlideStream(str(path), chunk_size=4)
+    assert 'output' not in stream.header
+    assert list(stream) == [{"layout": "title"}]
+    assert stream.header['output'] == "late.pptx"
+
+
+def test_jsonl_manifest_renders(tmp_path):
+    """Test that a JSON Lines manifest is rendered slide by slide."""
+    from ppt_assistant import PPTAssistant
+    from pptx import Presentation
+
+    output = tmp_path / "out.pptx"
+    lines = [
+        {"output": str(output)},
+        {"layout": "title", "content": {"title": "T", "subtitle": "S"}},
+        {"layout": "content", "content": {"title": "C", "body": ["a", "b"]}},
+    ]
+    path = tmp_path / "deck.jsonl"
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+
+    assistant = PPTAssistant(str(path))
+    assistant.create_presentation()
+
+    assert len(Presentation(str(output)).slides) == 2
@@ -0,0 +1,71 @@
+"""Test content-addressed sharing of image and workbook parts."""
+
+import io
+import zipfile
+
+from tests.conftest import mixed_slides, zip_members
+
+
+def _names(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return zf.namelist()
+
+
+def _chart_slides(count=2):
+    chart = {"type": "bar", "data": {"categories": ["a", "b", "c"],
+                                     "series": [{"name": "s", "values": [1, 2, 3]}]}}
+    return [{"layout": "chart", "content": {"title": f"C{i}", "chart": chart}} for i in range(count)]
+
+
+def test_repeated_image_stored_once():
+    """Test that a logo on every slide is embedded once, counted apart from new savings."""
+    from ppt_assistant import PPTAssistant
+
+    slides = [{"layout": "image", "content": {"title": f"S{i}", "image": "examples/sample_image.png"}}
+              for i in range(30)]
+    assistant = PPTAssistant.from_slides(slides)
+    members = zip_members(assistant.to_bytes())
+    media = [name for name in members if name.startswith('ppt/media/')]
+    assert len(media) == 1
+    # python-pptx already shared identical images, so they are not reported as bytes saved
+    assert assistant.summary['dedup'] == {'parts_shared': 0, 'bytes_saved': 0, 'images_shared': 29}
+
+
+def test_identical_charts_share_workbook_not_chart_part():
+    """Test that charts with the same data share one xlsx but keep their own chart parts."""
+    from ppt_assistant import PPTAssistant, PPTConfig
+
+    data = PPTAssistant.from_slides(_chart_slides()).to_bytes()
+    names = _names(data)
+    assert len([name for name in names if name.startswith('ppt/charts/chart')]) == 2
+    assert len([name for name in names if name.endswith('.xlsx')]) == 1
+
+    config = PPTConfig()
+    config.DEDUP_WORKBOOKS = False
+    assistant = PPTAssistant.from_slides(_chart_slides(), ppt_config=config)
+    names = _names(assistant.to_bytes())
+    assert len([name for name in names if name.endswith('.xlsx')]) == 2
+    assert 'dedup' not in assistant.summary
+
+
+def test_shared_parts_in_streaming_and_parallel_output(tmp_path):
+    """Test that streamed and worker-rendered decks share parts exactly like save()."""
+    from ppt_assistant import PPTAssistant
+
+    slides = mixed_slides('examples/sample_image.png') + _chart_slides(3)
+    expected = PPTAssistant.from_slides(slides).to_bytes()
+    # the workbook holds only the data, so line and bar charts of the same data share it
+    assert len([name for name in _names(expected) if name.endswith('.xlsx')]) == 1
+
+    streamed = io.BytesIO()
+    assistant = PPTAssistant.from_slides(slides)
+    assistant.write_streaming(streamed)
+    assert zip_members(streamed.getvalue()) == zip_members(expected)
+    stats = assistant.summary['dedup']
+    assert (stats['parts_shared'], stats['images_shared']) == (4, 1)
+    with zipfile.ZipFile(io.BytesIO(expected)) as zf:
+        assert stats['bytes_saved'] == 4 * zf.getinfo('ppt/embeddings/Microsoft_Excel_Sheet1.xlsx').file_size
+
+    output = tmp_path / "parallel.pptx"
+    PPTAssistant.from_slides(slides).write_streaming(str(output), workers=2)
+    assert zip_members(output.read_bytes()) == zip_members(expected)
@@ -0,0 +1,52 @@
+"""Test the profiling instrumentation."""
+
+import json
+
+import pytest
+
+
+def test_profiler_records_phases_and_slides():
+    """Test phases, per-slide records and hooks through the Python API."""
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.profiling import Profiler
+    from tests.conftest import mixed_slides
+
+    events = []
+    slides = mixed_slides('examples/sample_image.png')
+    with Profiler(hooks=[lambda kind, record: events.append(kind)]) as profiler:
+        assistant = PPTAssistant.from_slides(slides, profiler=profiler)
+        assistant.to_bytes()
+
+    report = profiler.report()
+    assert {'template', 'render', 'save', 'image', 'chart_xml', 'chart_workbook'} <= set(report['phases'])
+    assert report['phases']['render']['calls'] == 1
+    assert [record['index'] for record in report['slides']][:2] == [1, 2]
+    assert len(report['slides']) == len(slides)
+    assert sum(stats['calls'] for stats in report['layouts'].values()) == len(slides)
+    assert report['total']['wall_seconds'] >= report['phases']['render']['wall_seconds']
+    assert events.count('slide') == len(slides)
+    json.dumps(report)
+
+    with pytest.raises(ValueError):
+        profiler.dump_stats('unused.prof')
+
+
+def test_profile_cli(tmp_path, capsys):
+    """Test that --profile writes a JSON report and --profile-dump a pstats file."""
+    import pstats
+
+    from ppt_assistant.__main__ import main
+
+    output = tmp_path / "deck.pptx"
+    config = tmp_path / "deck.json"
+    config.write_text(json.dumps({"output": str(output), "slides": [
+        {"layout": "content", "content": {"title": "T", "body": "b"}}]}))
+    dump = tmp_path / "deck.prof"
+
+    main([str(config), "--profile-dump", str(dump)])
+
+    report = json.loads((tmp_path / "deck.pptx.profile.json").read_text(encoding="utf-8"))
+    assert report['phases']['load_json']['calls'] == 1
+    assert report['slides'][0]['layout'] == 'content'
+    assert pstats.Stats(str(dump)).total_calls > 0
+    assert "性能剖析" in capsys.readouterr().out
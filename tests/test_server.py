@@ -0,0 +1,88 @@
+"""Test the long-running render service."""
+
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+CONFIG = {
+    "slides": [
+        {"layout": "title", "content": {"title": "Served", "subtitle": "warm"}},
+        {"layout": "content", "content": {"title": "Body", "body": ["a", "b"]}},
+    ]
+}
+
+
+@pytest.fixture
+def service():
+    from ppt_assistant.server import WorkerPool, make_server
+
+    pool = WorkerPool(workers=1, queue_size=2, timeout=60)
+    server = make_server(pool, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    pool.close()
+
+
+def _post(url, body):
+    request = urllib.request.Request(url, data=body, method='POST',
+                                     headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return response.status, response.headers['Content-Type'], response.read()
+
+
+def test_render_returns_pptx_bytes(service):
+    """Test that POST /render returns a presentation and /health reports it."""
+    from pptx import Presentation
+
+    _, base = service
+    status, content_type, body = _post(base + '/render', json.dumps(CONFIG).encode())
+    assert status == 200
+    assert content_type.endswith('presentationml.presentation')
+    titles = [slide.shapes.title.text for slide in Presentation(io.BytesIO(body)).slides
+              if slide.shapes.title is not None]
+    assert titles[0] == "Served"
+
+    with urllib.request.urlopen(base + '/health', timeout=10) as response:
+        health = json.loads(response.read())
+    assert health['status'] == 'ok'
+    assert health['completed'] == 1
+
+
+def test_render_writes_to_path(service, tmp_path):
+    """Test that ?output= writes the deck on the server side."""
+    _, base = service
+    output = tmp_path / "served.pptx"
+    status, _, body = _post(f"{base}/render?output={output}", json.dumps(CONFIG).encode())
+    assert status == 200
+    assert json.loads(body)['output'] == str(output)
+    assert output.stat().st_size > 0
+
+
+def test_render_errors(service):
+    """Test bad input, timeouts and unknown endpoints map to HTTP errors."""
+    server, base = service
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        _post(base + '/render', b'{not json')
+    assert exc.value.code == 400
+
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        _post(base + '/render', json.dumps({"slides": [{"layout": "nope"}]}).encode())
+    assert exc.value.code == 400
+    assert json.loads(exc.value.read())['errors'][0].startswith("slides[0].layout")
+
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        _post(base + '/nope', b'{}')
+    assert exc.value.code == 404
+
+    server.pool.timeout = 0
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        _post(base + '/render', json.dumps(CONFIG).encode())
+    assert exc.value.code == 504
+    assert server.pool.health()['timeouts'] == 1
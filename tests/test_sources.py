@@ -0,0 +1,96 @@
+"""Test chart and table data loaded from external columnar sources."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def _chart_slide(data):
+    return {"layout": "chart", "content": {"title": "C", "chart": {"type": "line", "data": data}}}
+
+
+def _render(slides):
+    from ppt_assistant import PPTAssistant
+
+    assistant = PPTAssistant.from_slides(slides)
+    assistant.render_slides(slides)
+    return assistant.prs.slides
+
+
+def _chart(slide):
+    return next(shape.chart for shape in slide.shapes if shape.has_chart)
+
+
+def test_chart_from_csv(tmp_path):
+    """Test CSV coercion, missing values and number-format detection."""
+    path = tmp_path / "ts.csv"
+    path.write_text("day,sales,units\nmon,1.5,3\ntue,,4\nwed,2.25,5\n")
+
+    chart = _chart(_render([_chart_slide({"source": str(path)})])[0])
+    sales, units = chart.plots[0].series
+    assert list(chart.plots[0].categories) == ["mon", "tue", "wed"]
+    assert sales.name == "sales"
+    assert sales.values == (1.5, None, 2.25)
+    assert units.values == (3, 4, 5)
+    assert 'formatCode>0.00<' in chart._chartSpace.xml.replace('"', '')
+
+
+def test_chart_and_table_from_arrays(tmp_path):
+    """Test NumPy arrays through the Python API and .npy files."""
+    x = np.arange(5)
+    y = np.array([1.0, np.nan, 3.0, 4.0, 5.0])
+    np.save(tmp_path / "grid.npy", np.column_stack([x, y * 2]))
+
+    slides = [
+        _chart_slide({"categories": x, "series": [{"name": "y", "values": y}]}),
+        _chart_slide({"source": str(tmp_path / "grid.npy"), "categories": "0",
+                      "series": [{"name": "double", "values": "1"}]}),
+        {"layout": "table", "content": {"title": "T", "table": {
+            "headers": ["x", "y"], "rows": np.column_stack([x, y])}}},
+    ]
+    first, second, table_slide = _render(slides)
+    assert _chart(first).plots[0].series[0].values == (1.0, None, 3.0, 4.0, 5.0)
+    assert _chart(second).plots[0].series[0].values == (2.0, None, 6.0, 8.0, 10.0)
+
+    table = next(shape.table for shape in table_slide.shapes if shape.has_table)
+    assert [cell.text for cell in table.rows[2].cells] == ["1.0", ""]
+
+
+def test_table_from_parquet(tmp_path):
+    """Test selecting Parquet columns for a table."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "t.parquet"
+    pq.write_table(pa.table({"a": [1, 2], "b": ["x", None], "c": [0.5, 1.5]}), path)
+
+    slides = [{"layout": "table", "content": {"title": "P", "table": {
+        "source": str(path), "columns": ["b", "a"]}}}]
+    table = next(shape.table for shape in _render(slides)[0].shapes if shape.has_table)
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [["b", "a"], ["x", "1"], ["", "2"]]
+
+
+def test_number_format_detection():
+    """Test the number format chosen for integer, float and boolean columns."""
+    from ppt_assistant.sources import number_format, resolve_chart_data
+
+    assert number_format(np.arange(3)) == '0'
+    assert number_format(np.arange(3, dtype=np.uint8)) == '0'
+    assert number_format(np.array([1.0, 2.0, np.nan])) == '0'
+    assert number_format(np.array([1.5, 2.25])) == '0.00'
+    assert number_format(np.array([True, False])) is None
+
+    _, series = resolve_chart_data({"source": {"day": np.array(["a", "b"]), "units": np.array([3, 4])},
+                                    "categories": "day"})
+    assert series[0]['number_format'] == '0'
+
+
+def test_source_validation():
+    """Test vectorised validation errors."""
+    from ppt_assistant.sources import resolve_chart_data
+
+    with pytest.raises(ValueError):
+        resolve_chart_data({"categories": np.arange(3), "series": [{"name": "s", "values": np.arange(4)}]})
+    with pytest.raises(ValueError):
+        resolve_chart_data({"source": {"a": np.arange(3)}, "categories": "a", "series": ["missing"]})
+    with pytest.raises(ValueError):
+        resolve_chart_data({"categories": ["a"], "series": [{"name": "s", "values": np.array(["x"])}]})
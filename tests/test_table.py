@@ -0,0 +1,114 @@
+"""Test the bulk table XML builder against the proxy-object path."""
+
+from lxml import etree
+
+from tests._reference import add_table_with_proxies
+
+
+def _slide_xml(add, headers, rows):
+    from pptx import Presentation
+    from pptx.util import Emu
+    from ppt_assistant import DEFAULT_CONFIG
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add(slide, headers, rows, Emu(739132), Emu(1371600), Emu(10713431), Emu(4526287), DEFAULT_CONFIG)
+    return etree.tostring(slide._element)
+
+
+def test_bulk_table_matches_proxy_output():
+    """Test that the XML builder reproduces the proxy-styled table exactly."""
+    from ppt_assistant.table import add_table
+
+    headers = ["名稱", "A & B", "<c>", ""]
+    rows = [
+        ["多行\n文字", 1, 2.5, "soft\vbreak"],
+        ["ctrl\x1b\r", "", None, "tab\tkept"],
+        ["short row"],
+        [True, "x", "y", "z"],
+        ["a", "b"],
+    ]
+
+    assert _slide_xml(add_table, headers, rows) == _slide_xml(add_table_with_proxies, headers, rows)
+
+
+def test_bulk_table_rejects_rows_wider_than_headers():
+    """Test that rows longer than the header raise IndexError."""
+    from ppt_assistant.table import add_table
+
+    try:
+        _slide_xml(add_table, ["a"], [["1", "2"]])
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass  # Expected
+
+
+def _render_table(tmp_path, rows, ppt_config=None):
+    import json
+    from ppt_assistant import PPTAssistant
+
+    path = tmp_path / "table.json"
+    path.write_text(json.dumps({"output": str(tmp_path / "table.pptx"), "slides": []}))
+    assistant = PPTAssistant(str(path), ppt_config)
+    assistant._add_table_slide({"title": "Sales", "table": {"headers": ["a", "b"], "rows": rows}})
+    return assistant.prs.slides
+
+
+def test_table_paginates_with_repeated_header(tmp_path):
+    """Test that long tables continue on further slides with the header repeated."""
+    from ppt_assistant import DEFAULT_CONFIG
+    from ppt_assistant.table import rows_per_page
+
+    per_page = rows_per_page(DEFAULT_CONFIG)
+    slides = _render_table(tmp_path, [[str(i), str(i)] for i in range(2 * per_page + 1)])
+
+    titles = [slide.shapes[0].text_frame.text for slide in slides]
+    assert titles == ["Sales", "Sales (cont. 2/3)", "Sales (cont. 3/3)"]
+    tables = [slide.shapes[1].table for slide in slides]
+    assert [len(t.rows) for t in tables] == [per_page + 1, per_page + 1, 2]
+    assert all(t.cell(0, 0).text == "a" for t in tables)
+    assert tables[2].cell(1, 0).text == str(2 * per_page)
+
+
+def test_table_pagination_can_be_disabled(tmp_path):
+    """Test that TABLE_PAGINATE = False keeps every row on one slide."""
+    from ppt_assistant import PPTConfig
+
+    config = PPTConfig()
+    config.TABLE_PAGINATE = False
+    slides = _render_table(tmp_path, [["1", "2"]] * 40, config)
+
+    assert len(slides) == 1
+    assert len(slides[0].shapes[1].table.rows) == 41
+
+
+def test_table_rows_from_generator():
+    """Test that generator rows render page by page, and an empty generator gives one empty slide."""
+    from ppt_assistant import PPTAssistant, DEFAULT_CONFIG
+    from ppt_assistant.table import rows_per_page
+
+    per_page = rows_per_page(DEFAULT_CONFIG)
+    rows = ([str(i), str(i)] for i in range(per_page + 1))
+    assistant = PPTAssistant.from_slides([])
+    assistant.render_slides([
+        {"layout": "table", "content": {"title": "Gen", "table": {"headers": ["a", "b"], "rows": rows}}},
+        {"layout": "table", "content": {"title": "Empty", "table": {"headers": ["a"], "rows": iter([])}}},
+    ])
+
+    slides = list(assistant.prs.slides)
+    assert [slide.shapes[0].text_frame.text for slide in slides] == ["Gen", "Gen (cont. 2)", "Empty"]
+    assert [len(slide.shapes[1].table.rows) for slide in slides[:2]] == [per_page + 1, 2]
+    assert len(slides[2].shapes) == 1
+
+
+def test_paginate_rows_is_lazy():
+    """Test that pagination pulls rows from iterators one page at a time."""
+    from itertools import count
+    from ppt_assistant.table import paginate_rows, page_count
+
+    rows = ([i] for i in count())
+    pages = paginate_rows(rows, 3)
+    assert next(pages) == [[0], [1], [2]]
+    assert next(pages) == [[3], [4], [5]]
+    assert page_count(rows, 3) is None
+    assert page_count([[0]] * 100_000, 11) == 9091
@@ -0,0 +1,105 @@
+"""Test the per-process template cache and placeholder index."""
+
+import os
+
+import pytest
+
+
+def test_load_presentation_returns_independent_copies():
+    """Test that each deck gets its own copy of the cached template."""
+    from ppt_assistant.template import load_presentation, _cache
+
+    first = load_presentation()
+    first.slides.add_slide(first.slide_layouts[0])
+    second = load_presentation()
+
+    assert len(first.slides) == 1
+    assert len(second.slides) == 0
+    assert len(_cache) >= 1
+
+
+def test_user_template_reloaded_when_modified(tmp_path):
+    """Test that a user template is cached and re-parsed after it changes."""
+    from ppt_assistant.template import load_presentation, _cached_base
+
+    template = str(tmp_path / "brand.pptx")
+    prs = load_presentation()
+    prs.save(template)
+
+    base = _cached_base(template)
+    assert _cached_base(template) is base
+
+    stat = os.stat(template)
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _cached_base(template) is not base
+    assert len(load_presentation(template).slide_layouts) == len(prs.slide_layouts)
+
+
+def test_template_index_cached_per_template(tmp_path):
+    """Test that the layout/placeholder index is built once and picks layouts by placeholders."""
+    from ppt_assistant.template import load_presentation, template_index
+
+    template = str(tmp_path / "brand.pptx")
+    load_presentation().save(template)
+
+    index = template_index(template)
+    assert template_index(template) is index
+    assert index.layout_for('title').name == "Title Slide"
+    assert index.layout_for('content').name == "Title and Content"
+    assert index.layout_for('two_column').name == "Two Content"
+
+    picture = index.by_name["Picture with Caption"]
+    assert picture.slot('image').type == 'pic'
+    assert picture.caption('image').type == 'body'
+    # Geometry not set on the layout is inherited from the master
+    assert index.layout_for('content').title.box.width > 0
+
+    with pytest.raises(ValueError):
+        index.layout_for('chart', {'chart': 'No Such Layout'})
+
+
+def test_user_template_fills_placeholders(tmp_path):
+    """Test that slides fill the template's placeholders instead of adding text boxes."""
+    import io
+
+    from pptx import Presentation
+    from ppt_assistant import PPTAssistant, PPTConfig
+    from ppt_assistant.template import load_presentation
+
+    template = str(tmp_path / "brand.pptx")
+    base = load_presentation()
+    base.save(template)
+
+    slides = [
+        {"layout": "title", "content": {"title": "Deck", "subtitle": "Sub"}},
+        {"layout": "content", "content": {"title": "Body", "body": ["a", "b"]}},
+        {"layout": "two_column", "content": {"title": "Cols", "left": "L", "right": "R"}},
+        {"layout": "image", "content": {"title": "Pic", "image": "examples/sample_image.png", "caption": "cap"}},
+        {"layout": "table", "content": {"title": "Tab", "table": {"headers": ["a"], "rows": [[1]]}}},
+    ]
+    config = PPTConfig()
+    config.TEMPLATE_LAYOUTS = {"image": "Picture with Caption"}
+    prs = Presentation(io.BytesIO(PPTAssistant.from_slides(slides, config, template).to_bytes()))
+
+    assert (prs.slide_width, prs.slide_height) == (base.slide_width, base.slide_height)
+    texts = [[(shape.is_placeholder, shape.text_frame.text) for shape in slide.shapes if shape.has_text_frame]
+             for slide in prs.slides]
+    assert texts == [
+        [(True, "Deck"), (True, "Sub")],
+        [(True, "Body"), (True, "a\nb")],
+        [(True, "Cols"), (True, "L"), (True, "R")],
+        [(True, "Pic"), (True, "cap")],
+        [(True, "Tab")],
+    ]
+    picture_slide, table_slide = prs.slides[3], prs.slides[4]
+    assert picture_slide.slide_layout.name == "Picture with Caption"
+    picture = next(shape for shape in picture_slide.shapes if shape.shape_type == 13)
+    assert (picture.left, picture.top) == (1792288, 612775)
+    table = next(shape for shape in table_slide.shapes if shape.has_table)
+    assert (table.left, table.top, table.width) == (457200, 1600200, 8229600)
+
+    config = PPTConfig()
+    config.TEMPLATE_PLACEHOLDERS = False
+    prs = Presentation(io.BytesIO(PPTAssistant.from_slides(slides[1:2], config, template).to_bytes()))
+    assert prs.slide_width == config.geometry.slide_width
+    assert not any(shape.is_placeholder for shape in prs.slides[0].shapes)
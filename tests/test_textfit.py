@@ -0,0 +1,93 @@
+"""Test the text-fit engine."""
+
+LONG_BODY = "這是一段很長的繁體中文內容，用來測試文字適配。" * 40
+
+
+def _fitter(**options):
+    from ppt_assistant.config import PPTConfig
+    from ppt_assistant.textfit import TextFitter
+
+    config = PPTConfig()
+    for name, value in options.items():
+        setattr(config, name, value)
+    return TextFitter(config), config.geometry
+
+
+def test_line_breaking():
+    """Test that CJK text breaks anywhere and Latin text only between words."""
+    fitter, _ = _fitter()
+
+    assert fitter.line_starts("一二三四五六七八九十" * 3, 7.5) == [0, 7, 14, 21, 28]
+    assert fitter.line_starts("short line", 20) == [0]
+    assert fitter.line_starts("first\nsecond", 20) == [0, 6]
+    words = "lorem ipsum " * 10
+    for start in fitter.line_starts(words, 8)[1:]:
+        assert words[start - 1] == " "
+    assert len(fitter.line_starts("x" * 100, 10)) == 5
+
+
+def test_shrink_and_split():
+    """Test shrinking to the largest fitting size and splitting at line boundaries."""
+    fitter, geometry = _fitter(TEXT_MIN_FONT_SIZE=10)
+    box = geometry.body
+    paragraphs = [LONG_BODY[:200], LONG_BODY[:300]]
+
+    size = fitter.shrink(paragraphs, box, 24, (8, 8))
+    assert 10 <= size < 24
+    available = (box.height - 45720 * 2) / 12700
+    assert fitter.height(paragraphs, box, size, (8, 8)) <= available
+    assert fitter.height(paragraphs, box, size + 1, (8, 8)) > available
+    assert fitter.shrink(["short"], box, 24) == 24
+
+    pages = fitter.split(paragraphs, box, 24, (8, 8))
+    assert len(pages) > 1
+    assert "".join("".join(page) for page in pages) == "".join(paragraphs)
+    for page in pages:
+        assert fitter.height(page, box, 24, (8, 8)) <= available
+
+
+def test_content_slides_split_into_continuations():
+    """Test that TEXT_FIT='split' adds continuation slides and reports them."""
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.config import PPTConfig
+
+    config = PPTConfig()
+    config.TEXT_FIT = 'split'
+    slides = [
+        {"layout": "content", "content": {"title": "Long", "body": [LONG_BODY[:400], LONG_BODY[:400]]}},
+        {"layout": "two_column", "content": {"title": "Cols", "left": LONG_BODY, "right": "short"}},
+    ]
+    assistant = PPTAssistant.from_slides(slides, config)
+    assistant.render_slides(slides)
+
+    titles = [slide.shapes[0].text_frame.text for slide in assistant.prs.slides]
+    assert titles[0] == "Long"
+    assert titles[1].startswith("Long (cont. 2/")
+    cols = [title for title in titles if title.startswith("Cols")]
+    assert len(cols) > 1
+    assert assistant.summary['text_fit']['continuation_slides'] == len(titles) - 2
+
+    # the short right column only appears on the first page
+    right = [slide.shapes[2].text_frame.text for slide in list(assistant.prs.slides)[-len(cols):]]
+    assert right[0] == "short" and set(right[1:]) == {""}
+
+
+def test_content_slide_shrinks():
+    """Test that TEXT_FIT='shrink' lowers the body font size on overflowing slides only."""
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.config import PPTConfig
+
+    config = PPTConfig()
+    config.TEXT_FIT = 'shrink'
+    slides = [
+        {"layout": "content", "content": {"title": "Long", "body": LONG_BODY[:500]}},
+        {"layout": "content", "content": {"title": "Short", "body": "ok"}},
+    ]
+    assistant = PPTAssistant.from_slides(slides, config)
+    assistant.render_slides(slides)
+
+    long_size, short_size = [slide.shapes[1].text_frame.paragraphs[0].font.size.pt
+                             for slide in assistant.prs.slides]
+    assert long_size < config.BODY_FONT_SIZE
+    assert short_size == config.BODY_FONT_SIZE
+    assert assistant.summary['text_fit'] == {'shrunk': 1, 'continuation_slides': 0}
@@ -0,0 +1,147 @@
+"""Test the manifest validator."""
+
+import json
+
+import pytest
+
+IMAGE = "examples/sample_image.png"
+
+
+def _slides():
+    return [
+        {"layout": "title", "content": {"title": "T", "subtitle": "S"}},
+        {"layout": "content", "content": {"title": "C", "body": ["a", 1, 2.5]}},
+        {"layout": "two_column", "content": {"title": "Cols", "left": "l", "right": 3}},
+        {"layout": "image", "content": {"title": "I", "image": IMAGE, "caption": "c"}},
+        {"layout": "table", "content": {"table": {"headers": ["a", "b"], "rows": [[1, "x"], [2]]}}},
+        {"layout": "chart", "content": {"chart": {"type": "line", "data": {
+            "categories": ["q1", "q2"], "series": [{"name": "s", "values": [1, None]}]}}}},
+    ]
+
+
+def test_valid_manifest_passes():
+    """Test that every built-in layout accepts well-formed content."""
+    from ppt_assistant.validation import validate_slides
+
+    assert validate_slides(_slides()) == 6
+
+
+def test_numpy_scalars_accepted():
+    """Test that NumPy scalars from the Python API pass as numbers and table cells."""
+    np = pytest.importorskip("numpy")
+    from ppt_assistant.validation import ManifestValidationError, validate_slides
+
+    slides = [
+        {"layout": "table", "content": {"table": {"headers": ["a", "b"], "rows": [[np.int64(1), np.float32(2.5)]]}}},
+        {"layout": "chart", "content": {"chart": {"data": {
+            "categories": ["a", "b", "c"], "series": [{"values": [np.float64(1.5), np.int64(2), None]}]}}}},
+    ]
+    assert validate_slides(slides) == 2
+
+    slides[1]["content"]["chart"]["data"]["series"][0]["values"][2] = np.bool_(True)
+    with pytest.raises(ManifestValidationError):
+        validate_slides(slides)
+
+
+def test_iterator_rows_skip_row_checks():
+    """Test that generator rows pass validation untouched while non-iterables are rejected."""
+    from ppt_assistant.validation import ManifestValidationError, validate_slides
+
+    rows = ([i, "x"] for i in range(3))
+    assert validate_slides([{"layout": "table", "content": {"table": {"headers": ["a", "b"], "rows": rows}}}]) == 1
+    assert next(rows) == [0, "x"]
+
+    for bad in ("ab", {"a": 1}, 5):
+        with pytest.raises(ManifestValidationError):
+            validate_slides([{"layout": "table", "content": {"table": {"headers": ["a"], "rows": bad}}}])
+
+
+def test_all_errors_reported_together():
+    """Test that one pass reports every problem with its path."""
+    from ppt_assistant.validation import ManifestValidationError, validate_slides
+
+    slides = _slides() + [
+        {"layout": "nope"},
+        {"layout": "content", "content": {"title": ["not", "text"]}},
+        {"layout": "image", "content": {"image": "missing.png"}},
+        {"layout": "table", "content": {"table": {"headers": ["a"], "rows": [[1], [1, 2], [{"x": 1}]]}}},
+        {"layout": "chart", "content": {"chart": {"data": {
+            "categories": ["a", "b", "c"], "series": [{"values": [1, 2]}, {"values": [1, "2", True]}]}}}},
+        {"layout": "table", "content": {"table": {"source": "missing.csv"}}},
+        "not a slide",
+    ]
+    with pytest.raises(ManifestValidationError) as exc:
+        validate_slides(slides)
+
+    paths = [path for path, _ in exc.value.errors]
+    assert paths == [
+        "slides[6].layout",
+        "slides[7].content.title",
+        "slides[8].content.image",
+        "slides[9].content.table.rows[1]",
+        "slides[9].content.table.rows[2][0]",
+        "slides[10].content.chart.data.series[0].values",
+        "slides[10].content.chart.data.series[1].values[1]",
+        "slides[11].content.table.source",
+        "slides[12]",
+    ]
+    assert isinstance(exc.value, ValueError)
+    assert "共 9 個錯誤" in str(exc.value)
+
+
+def test_render_validates_up_front():
+    """Test that rendering fails before any slide is built and can be turned off."""
+    from ppt_assistant import PPTAssistant, PPTConfig
+    from ppt_assistant.validation import ManifestValidationError
+
+    slides = [{"layout": "content", "content": {"title": "ok"}},
+              {"layout": "table", "content": {"table": {"headers": ["a"], "rows": [[1, 2]]}}}]
+    assistant = PPTAssistant.from_slides(slides)
+    with pytest.raises(ManifestValidationError):
+        assistant.render()
+    assert len(assistant.prs.slides) == 0
+
+    config = PPTConfig()
+    config.VALIDATE_MANIFEST = False
+    with pytest.raises(IndexError):
+        PPTAssistant.from_slides(slides, config).render()
+
+
+def test_validator_compiled_once_and_follows_registry():
+    """Test that the validator is reused and recompiled when layouts change."""
+    from ppt_assistant.layouts import LAYOUTS, LayoutRenderer, register_layout
+    from ppt_assistant.validation import ManifestValidationError, get_validator
+
+    validator = get_validator()
+    assert get_validator() is validator
+
+    @register_layout('quote')
+    class QuoteRenderer(LayoutRenderer):
+        schema = {'quote': 'paragraphs'}
+
+    try:
+        assert get_validator() is not validator
+        get_validator().validate([{"layout": "quote", "content": {"quote": "hi"}}])
+        with pytest.raises(ManifestValidationError):
+            get_validator().validate([{"layout": "quote", "content": {"quote": {"x": 1}}}])
+    finally:
+        LAYOUTS.unregister('quote')
+
+
+def test_validate_only_cli(tmp_path, capsys):
+    """Test --validate-only checks the file without writing output."""
+    from ppt_assistant.__main__ import main
+
+    output = tmp_path / "out.pptx"
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps({"output": str(output), "slides": _slides()}), encoding="utf-8")
+    main([str(good), "--validate-only"])
+    assert "6 張投影片" in capsys.readouterr().out
+    assert not output.exists()
+
+    bad = tmp_path / "bad.jsonl"
+    bad.write_text("\n".join(json.dumps(s) for s in [{"layout": "nope"}, {"layout": "image", "content": {}}]),
+                   encoding="utf-8")
+    with pytest.raises(SystemExit):
+        main([str(bad), "--validate-only"])
+    assert "slides[0].layout" in capsys.readouterr().out
@@ -0,0 +1,88 @@
+"""Test embedded chart workbook generation."""
+
+import datetime
+import io
+import zipfile
+
+
+def _chart_slides(n=50):
+    data = {"categories": [f"c{i}" for i in range(n)], "series": [
+        {"name": "a & b", "values": [i * 0.5 if i % 7 else None for i in range(n)]},
+        {"name": "units", "values": list(range(n)), "number_format": "0.0"},
+    ]}
+    dates = {"categories": [datetime.date(2024, 1, d) for d in (1, 2, 3)],
+             "series": [{"name": "s", "values": [1, 2.5, 3]}]}
+    return [
+        {"layout": "chart", "content": {"title": "A", "chart": {"type": "line", "data": data}}},
+        {"layout": "chart", "content": {"title": "B", "chart": {"type": "bar", "data": dates}}},
+        {"layout": "chart", "content": {"title": "C", "chart": {"type": "line", "data": data}}},
+    ]
+
+
+def _render(mode):
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.config import PPTConfig
+
+    config = PPTConfig()
+    config.CHART_WORKBOOK = mode
+    slides = _chart_slides()
+    assistant = PPTAssistant.from_slides(slides, config)
+    assistant.render_slides(slides)
+    return assistant.prs.slides
+
+
+def _sheet_values(slide):
+    """Sheet1 cells of the chart's embedded workbook as {ref: value}; blank cells are skipped."""
+    from lxml import etree
+
+    ns = {'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+    chart = next(shape for shape in slide.shapes if shape.has_chart).chart
+    with zipfile.ZipFile(io.BytesIO(chart.part.chart_workbook.xlsx_part.blob)) as z:
+        root = etree.fromstring(z.read('xl/worksheets/sheet1.xml'))
+    cells = {}
+    for c in root.iterfind('.//x:c', ns):
+        if c.get('t') in ('s', 'inlineStr'):  # XlsxWriter uses shared strings, the fast writer inline
+            cells[c.get('r')] = 'string'
+        elif c.find('x:v', ns) is not None:
+            cells[c.get('r')] = float(c.find('x:v', ns).text)
+    return cells
+
+
+def test_fast_workbook_matches_xlsxwriter_layout():
+    """Test the fast writer fills the same cells the chart formulas reference."""
+    fast = [_sheet_values(slide) for slide in _render('fast')]
+    slow = [_sheet_values(slide) for slide in _render('xlsxwriter')]
+    assert fast == slow
+    assert 'B2' not in fast[0]  # missing values are left blank
+    assert fast[1]['A2'] == 45292.0  # 2024-01-01 as an Excel date serial
+
+
+def test_identical_data_reuses_workbook():
+    """Test that charts with identical data are written once and cached by content."""
+    from ppt_assistant.workbook import WORKBOOK_CACHE
+
+    WORKBOOK_CACHE.clear()
+    first, _, third = _render('fast')
+    blobs = [next(s for s in slide.shapes if s.has_chart).chart.part.chart_workbook.xlsx_part.blob
+             for slide in (first, third)]
+    assert blobs[0] == blobs[1]
+    assert WORKBOOK_CACHE.stats()['hits'] == 1
+
+    _render('fast')
+    assert WORKBOOK_CACHE.stats()['misses'] == 2
+
+
+def test_no_workbook_keeps_cached_values():
+    """Test that CHART_WORKBOOK='none' drops the embedded workbook but keeps the data."""
+    from ppt_assistant import PPTAssistant
+    from ppt_assistant.config import PPTConfig
+
+    config = PPTConfig()
+    config.CHART_WORKBOOK = 'none'
+    assistant = PPTAssistant.from_slides(_chart_slides(), config)
+    with zipfile.ZipFile(io.BytesIO(assistant.to_bytes())) as z:
+        assert not [name for name in z.namelist() if name.endswith('.xlsx')]
+        assert 'externalData' not in z.read('ppt/charts/chart1.xml').decode('utf-8')
+
+    chart = next(s for s in assistant.prs.slides[1].shapes if s.has_chart).chart
+    assert chart.plots[0].series[0].values == (1, 2.5, 3)
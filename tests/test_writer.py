@@ -0,0 +1,124 @@
+"""Test in-memory input and output."""
+
+import io
+import json
+import os
+import zipfile
+
+from tests.conftest import mixed_slides, zip_members
+
+
+def _config():
+    return {"slides": mixed_slides('examples/sample_image.png')}
+
+
+def test_to_bytes_matches_python_pptx_save():
+    """Test that the package writer produces the same parts as Presentation.save."""
+    from ppt_assistant import PPTAssistant
+
+    assistant = PPTAssistant.from_dict(_config())
+    data = assistant.to_bytes()
+
+    buf = io.BytesIO()
+    assistant.prs.save(buf)
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        names = zf.namelist()
+    with zipfile.ZipFile(buf) as zf:
+        assert names == zf.namelist()
+    assert zip_members(data) == zip_members(buf.getvalue())
+
+
+def test_compression_options():
+    """Test stored vs deflate output."""
+    from ppt_assistant import PPTAssistant
+
+    assistant = PPTAssistant.from_dict(_config())
+    stored = assistant.to_bytes(compression='stored')
+    fast = assistant.to_bytes(compress_level=1)
+    with zipfile.ZipFile(io.BytesIO(stored)) as zf:
+        assert {info.compress_type for info in zf.infolist()} == {zipfile.ZIP_STORED}
+    assert len(stored) > len(fast)
+    assert zip_members(stored) == zip_members(fast)
+
+
+def test_file_like_input_and_stream_output():
+    """Test reading the config from a file object and writing to a stream."""
+    from ppt_assistant import PPTAssistant
+    from pptx import Presentation
+
+    assistant = PPTAssistant(io.StringIO(json.dumps(_config())))
+    out = io.BytesIO()
+    assistant.save(out)
+    out.seek(0)
+    assert len(Presentation(out).slides) == len(assistant.prs.slides)
+
+
+def test_iter_bytes_streams_valid_package():
+    """Test the chunked writer yields fixed-size chunks of a readable package."""
+    from ppt_assistant import PPTAssistant
+
+    assistant = PPTAssistant.from_dict(_config())
+    chunks = list(assistant.iter_bytes(chunk_size=4096))
+    assert len(chunks) > 1
+    assert all(len(chunk) == 4096 for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= 4096
+    assert zip_members(b''.join(chunks)) == zip_members(assistant.to_bytes())
+
+
+def test_streaming_output_matches_save_and_releases_slides():
+    """Test that streaming output has the same members as save and leaves only stubs behind."""
+    from ppt_assistant import PPTAssistant
+    from pptx.parts.slide import SlidePart
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    expected = PPTAssistant.from_dict(_config()).to_bytes()
+
+    assistant = PPTAssistant.from_dict(_config())
+    out = io.BytesIO()
+    assistant.write_streaming(out)
+    assert zip_members(out.getvalue()) == zip_members(expected)
+    with zipfile.ZipFile(out) as zf:
+        names = zf.namelist()
+    assert len(names) == len(set(names))
+    # the shared image was deduplicated across flushed slides
+    assert len([name for name in names if name.startswith('ppt/media/')]) == 1
+    assert names[-1] == '[Content_Types].xml'
+
+    slides = [rel.target_part for rel in assistant.prs.part.rels.values() if rel.reltype == RT.SLIDE]
+    assert slides and not any(isinstance(part, SlidePart) for part in slides)
+
+    try:
+        assistant.to_bytes()
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
+def test_streaming_output_with_workers(tmp_path):
+    """Test streaming output of a deck rendered in worker processes."""
+    from ppt_assistant import PPTAssistant
+
+    expected = PPTAssistant.from_dict(_config()).to_bytes()
+    output = tmp_path / "streamed.pptx"
+    PPTAssistant.from_dict(_config()).write_streaming(str(output), workers=2)
+    assert zip_members(output.read_bytes()) == zip_members(expected)
+
+
+def test_failed_streaming_output_leaves_no_partial_file(tmp_path):
+    """Test that a render error mid-stream removes the partial zip and keeps any earlier output."""
+    from ppt_assistant import PPTAssistant, PPTConfig
+
+    config = PPTConfig()
+    config.VALIDATE_MANIFEST = False
+    slides = mixed_slides('examples/sample_image.png') + [
+        {"layout": "table", "content": {"table": {"headers": ["a"], "rows": [[1, 2]]}}}]
+    output = tmp_path / "deck.pptx"
+    output.write_bytes(b"previous")
+
+    try:
+        PPTAssistant.from_slides(slides, ppt_config=config).write_streaming(str(output))
+        assert False, "Should have raised IndexError"
+    except IndexError:
+        pass
+    assert os.listdir(tmp_path) == ["deck.pptx"]
+    assert output.read_bytes() == b"previous"